@@ -46,7 +46,7 @@ from datacachalog.core.ports import (
 )
 from datacachalog.core.services import Catalog
 from datacachalog.discovery import discover_catalogs, load_catalog
-from datacachalog.progress import RichProgressReporter
+from datacachalog.progress import QueuedProgressReporter, RichProgressReporter
 
 
 __version__ = "0.7.0"
@@ -70,6 +70,7 @@ __all__ = [
     "ObjectVersion",
     "ProgressCallback",
     "ProgressReporter",
+    "QueuedProgressReporter",
     "Reader",
     "ReaderNotConfiguredError",
     "RichProgressReporter",
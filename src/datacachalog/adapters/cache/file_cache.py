@@ -5,13 +5,37 @@ from __future__ import annotations
 import contextlib
 import json
 import shutil
+import uuid
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from datacachalog.core.exceptions import CacheCorruptError, InvalidCacheKeyError
 from datacachalog.core.models import CacheMetadata
 
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _install(target: Path, write: Callable[[Path], object]) -> None:
+    """Write a file beside target, then rename it over target atomically.
+
+    Readers see either the previous file or the complete new one, never a
+    partially written file. The temporary name ends in ".tmp", so it is
+    never mistaken for a data file or ".meta.json" sidecar.
+    """
+    tmp_path = target.with_name(f".{target.name}.{uuid.uuid4().hex}.tmp")
+    # Unlike mkstemp's fixed 0o600, an exclusive create honours the umask
+    tmp_path.touch(mode=0o666, exist_ok=False)
+    try:
+        write(tmp_path)
+        tmp_path.replace(target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 class FileCache:
     """Local file cache with JSON metadata sidecars.
 
@@ -30,7 +54,7 @@ class FileCache:
         """
         self.cache_dir = cache_dir
 
-    def _validate_cache_key(self, key: str) -> None:
+    def _validate_cache_key(self, key: str) -> Path:
         """Validate a cache key for security and safety.
 
         Rejects keys with:
@@ -41,6 +65,9 @@ class FileCache:
         Args:
             key: The cache key to validate.
 
+        Returns:
+            Path of the key's data file, so callers join cache_dir only once.
+
         Raises:
             InvalidCacheKeyError: If the key is invalid.
         """
@@ -60,14 +87,15 @@ class FileCache:
             raise InvalidCacheKeyError(
                 key=key, reason="resolved path escapes cache_dir"
             ) from None
+        return file_path
 
     def _file_path(self, key: str) -> Path:
         """Get the path for a cached file."""
         return self.cache_dir / key
 
-    def _meta_path(self, key: str) -> Path:
-        """Get the path for a metadata sidecar file."""
-        return self.cache_dir / f"{key}.meta.json"
+    def _meta_path(self, file_path: Path) -> Path:
+        """Get the metadata sidecar path next to a cached data file."""
+        return file_path.with_name(f"{file_path.name}.meta.json")
 
     def get(self, key: str) -> tuple[Path, CacheMetadata] | None:
         """Get cached file path and metadata, or None if not cached.
@@ -82,16 +110,18 @@ class FileCache:
             InvalidCacheKeyError: If the key contains path traversal or is invalid.
             CacheCorruptError: If metadata file exists but is corrupt/unreadable.
         """
-        self._validate_cache_key(key)
-        file_path = self._file_path(key)
-        meta_path = self._meta_path(key)
+        file_path = self._validate_cache_key(key)
+        meta_path = self._meta_path(file_path)
 
-        if not file_path.exists() or not meta_path.exists():
+        if not file_path.exists():
             return None
 
+        # Opening the sidecar doubles as its existence check
         try:
             with meta_path.open() as f:
                 data = json.load(f)
+        except FileNotFoundError:
+            return None
         except json.JSONDecodeError as e:
             raise CacheCorruptError(
                 f"Cache metadata corrupt for '{key}'",
@@ -113,6 +143,54 @@ class FileCache:
 
         return file_path, metadata
 
+    def fingerprint(self, key: str) -> tuple[int, int, int, int] | None:
+        """Get a cheap stat-based fingerprint of a cache entry.
+
+        The fingerprint covers mtime and size of both the data file and the
+        metadata sidecar, so any rewrite of the entry changes it. Unlike get(),
+        the metadata JSON is not read or parsed.
+
+        Args:
+            key: Cache key identifying the file.
+
+        Returns:
+            Tuple of (file mtime_ns, file size, meta mtime_ns, meta size),
+            or None if the entry is not cached.
+
+        Raises:
+            InvalidCacheKeyError: If the key contains path traversal or is invalid.
+        """
+        file_path = self._validate_cache_key(key)
+        try:
+            file_stat = file_path.stat()
+            meta_stat = self._meta_path(file_path).stat()
+        except FileNotFoundError:
+            return None
+
+        return (
+            file_stat.st_mtime_ns,
+            file_stat.st_size,
+            meta_stat.st_mtime_ns,
+            meta_stat.st_size,
+        )
+
+    def verify_unchanged(
+        self, key: str, prior: tuple[int, int, int, int] | None
+    ) -> bool:
+        """Check whether a cache entry still matches a previous fingerprint.
+
+        Args:
+            key: Cache key identifying the file.
+            prior: Fingerprint previously returned by fingerprint().
+
+        Returns:
+            True if the entry is unchanged (or still absent), False otherwise.
+
+        Raises:
+            InvalidCacheKeyError: If the key contains path traversal or is invalid.
+        """
+        return self.fingerprint(key) == prior
+
     def put(self, key: str, path: Path, metadata: CacheMetadata) -> None:
         """Store a file in cache with associated metadata.
 
@@ -124,15 +202,14 @@ class FileCache:
         Raises:
             InvalidCacheKeyError: If the key contains path traversal or is invalid.
         """
-        self._validate_cache_key(key)
-        file_path = self._file_path(key)
-        meta_path = self._meta_path(key)
+        file_path = self._validate_cache_key(key)
+        meta_path = self._meta_path(file_path)
 
         # Create parent directories (handles nested keys like "dataset/file.txt")
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Copy file to cache
-        shutil.copy2(path, file_path)
+        _install(file_path, lambda tmp: shutil.copy2(path, tmp))
 
         # Write metadata sidecar
         data = {
@@ -143,8 +220,7 @@ class FileCache:
             "cached_at": metadata.cached_at.isoformat(),
             "source": metadata.source,
         }
-        with meta_path.open("w") as f:
-            json.dump(data, f)
+        _install(meta_path, lambda tmp: tmp.write_text(json.dumps(data)))
 
     def invalidate(self, key: str) -> None:
         """Remove a file from cache.
@@ -155,9 +231,8 @@ class FileCache:
         Raises:
             InvalidCacheKeyError: If the key contains path traversal or is invalid.
         """
-        self._validate_cache_key(key)
-        file_path = self._file_path(key)
-        meta_path = self._meta_path(key)
+        file_path = self._validate_cache_key(key)
+        meta_path = self._meta_path(file_path)
 
         file_path.unlink(missing_ok=True)
         meta_path.unlink(missing_ok=True)
@@ -178,8 +253,7 @@ class FileCache:
         Raises:
             InvalidCacheKeyError: If the prefix contains path traversal or is invalid.
         """
-        self._validate_cache_key(prefix)
-        prefix_dir = self.cache_dir / prefix
+        prefix_dir = self._validate_cache_key(prefix)
         if not prefix_dir.exists():
             return 0
 
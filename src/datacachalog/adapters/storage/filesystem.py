@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import fnmatch
+import functools
 import hashlib
+import os
+import re
+import sys
+import time
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO
 
 from datacachalog.core.exceptions import (
     StorageNotFoundError,
@@ -23,6 +29,102 @@ if TYPE_CHECKING:
 # Chunk size for reading files (64KB)
 _CHUNK_SIZE = 64 * 1024
 
+# Files modified this recently may still change within the same timestamp tick,
+# so their hashes are not memoized (the "racy git" problem)
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Linux ioctl that shares the source's extents with dest (btrfs, XFS, ...)
+_FICLONE = 0x40049409
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a single-segment glob once, with the platform's case rules."""
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    return re.compile(fnmatch.translate(pattern), flags)
+
+
+def _md5_etag(path: Path) -> str:
+    """Hash a file's contents into an S3-style quoted ETag.
+
+    Matches S3 behavior for non-multipart uploads.
+    """
+    md5_hash = hashlib.md5()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            md5_hash.update(chunk)
+    return f'"{md5_hash.hexdigest()}"'
+
+
+def _reflink(src: BinaryIO, dst: BinaryIO) -> bool:
+    """Clone src into dst as a copy-on-write reference, if supported."""
+    if sys.platform != "linux":
+        return False
+    import fcntl
+
+    try:
+        fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except OSError:
+        return False
+    return True
+
+
+def _copy_range(
+    src: BinaryIO, dst: BinaryIO, total_size: int, progress: ProgressCallback
+) -> bool:
+    """Copy with os.copy_file_range, avoiding user-space buffers.
+
+    Returns False if the kernel rejects the copy before any bytes moved
+    (e.g. unsupported across these filesystems), or stops short of
+    total_size, as overlayfs and some FUSE and NFS mounts do by reporting
+    0 bytes. A short copy is rewound so the caller can start over.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        return False
+
+    copied = 0
+    try:
+        while n := copy_file_range(src.fileno(), dst.fileno(), _CHUNK_SIZE):
+            copied += n
+            progress(copied, total_size)
+    except OSError:
+        if copied:
+            raise
+        return False
+    if copied < total_size:
+        src.seek(0)
+        dst.seek(0)
+        dst.truncate()
+        return False
+    return True
+
+
+def _copy_file(
+    src: BinaryIO, dst: BinaryIO, total_size: int, progress: ProgressCallback
+) -> None:
+    """Copy src to dst, preferring kernel-side copies over user-space buffers.
+
+    Tries a reflink first, then os.copy_file_range, and finally a plain
+    chunked read/write loop. Progress is reported after each chunk; a
+    reflink completes in one step.
+    """
+    if total_size and _reflink(src, dst):
+        progress(total_size, total_size)
+        return
+    if _copy_range(src, dst, total_size, progress):
+        return
+
+    copied = 0
+    for chunk in iter(lambda: src.read(_CHUNK_SIZE), b""):
+        dst.write(chunk)
+        copied += len(chunk)
+        progress(copied, total_size)
+
+
+def _no_progress(_copied: int, _total: int) -> None:
+    """Discard progress updates for callers that did not ask for them."""
+
 
 class FilesystemStorage:
     """Storage adapter for local filesystem operations.
@@ -31,9 +133,18 @@ class FilesystemStorage:
     Useful for local development and testing without S3.
     """
 
+    def __init__(self) -> None:
+        """Initialize the storage with an empty ETag memo."""
+        # source -> (stat signature, etag) for files whose stat is settled
+        self._etags: dict[str, tuple[tuple[int, ...], str]] = {}
+
     def head(self, source: str) -> FileMetadata:
         """Get file metadata without reading full contents.
 
+        The MD5 ETag is memoized against the file's inode, size, mtime and
+        ctime, so re-checking an unchanged file costs one stat() rather
+        than a full read.
+
         Args:
             source: Path to file (absolute or relative).
 
@@ -53,25 +164,42 @@ class FilesystemStorage:
                 cause=e,
             ) from e
 
-        # Compute MD5 hash for ETag (matches S3 behavior for non-multipart)
-        md5_hash = hashlib.md5()
-        with path.open("rb") as f:
-            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
-                md5_hash.update(chunk)
+        signature = (
+            stat.st_dev,
+            stat.st_ino,
+            stat.st_size,
+            stat.st_mtime_ns,
+            stat.st_ctime_ns,
+        )
+        memo = self._etags.get(source)
+        if memo is not None and memo[0] == signature:
+            etag = memo[1]
+        else:
+            etag = _md5_etag(path)
+            if time.time_ns() - stat.st_ctime_ns > _RACY_WINDOW_NS:
+                self._etags[source] = (signature, etag)
 
         return FileMetadata(
-            etag=f'"{md5_hash.hexdigest()}"',
+            etag=etag,
             last_modified=datetime.fromtimestamp(stat.st_mtime, tz=UTC),
             size=stat.st_size,
         )
 
-    def download(self, source: str, dest: Path, progress: ProgressCallback) -> None:
+    def download(
+        self,
+        source: str,
+        dest: Path,
+        progress: ProgressCallback,
+        *,
+        meta: FileMetadata | None = None,  # noqa: ARG002
+    ) -> None:
         """Copy a file from source to destination with progress reporting.
 
         Args:
             source: Path to source file.
             dest: Destination path.
             progress: Callback function(bytes_downloaded, total_bytes).
+            meta: Unused; a local stat is as cheap as passing metadata in.
 
         Raises:
             StorageNotFoundError: If source file does not exist.
@@ -86,13 +214,8 @@ class FilesystemStorage:
                 cause=e,
             ) from e
 
-        bytes_copied = 0
-
         with source_path.open("rb") as src, dest.open("wb") as dst:
-            for chunk in iter(lambda: src.read(_CHUNK_SIZE), b""):
-                dst.write(chunk)
-                bytes_copied += len(chunk)
-                progress(bytes_copied, total_size)
+            _copy_file(src, dst, total_size, progress)
 
     def upload(
         self, local: Path, dest: str, progress: ProgressCallback | None = None
@@ -111,14 +234,9 @@ class FilesystemStorage:
         dest_path.parent.mkdir(parents=True, exist_ok=True)
 
         total_size = local.stat().st_size
-        bytes_uploaded = 0
 
         with local.open("rb") as src, dest_path.open("wb") as dst:
-            for chunk in iter(lambda: src.read(_CHUNK_SIZE), b""):
-                dst.write(chunk)
-                bytes_uploaded += len(chunk)
-                if progress:
-                    progress(bytes_uploaded, total_size)
+            _copy_file(src, dst, total_size, progress or _no_progress)
 
     def list(self, prefix: str, pattern: str | None = None) -> list[str]:
         """List files matching a prefix directory and optional glob pattern.
@@ -142,10 +260,19 @@ class FilesystemStorage:
                 source=prefix,
             )
 
-        matches = base.glob(pattern) if pattern else base.iterdir()
-
-        # Filter to files only and sort
-        return sorted(str(p) for p in matches if p.is_file())
+        if pattern and ("/" in pattern or "**" in pattern):
+            # Multi-segment or recursive patterns need pathlib's walker
+            return sorted(str(p) for p in base.glob(pattern) if p.is_file())
+
+        # Single directory: match names from one scandir pass. DirEntry caches
+        # the file type, so non-matching entries cost no extra stat calls.
+        regex = _compile_pattern(pattern) if pattern else None
+        with os.scandir(base) as entries:
+            return sorted(
+                str(base / entry.name)
+                for entry in entries
+                if (regex is None or regex.match(entry.name)) and entry.is_file()
+            )
 
     def list_versions(
         self,
@@ -173,6 +300,8 @@ class FilesystemStorage:
         dest: Path,  # noqa: ARG002
         version_id: str,  # noqa: ARG002
         progress: ProgressCallback,  # noqa: ARG002
+        *,
+        meta: FileMetadata | None = None,  # noqa: ARG002
     ) -> None:
         """Download version is not supported for filesystem storage.
 
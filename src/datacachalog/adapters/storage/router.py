@@ -76,10 +76,17 @@ class RouterStorage:
         backend, path = self._get_backend_and_path(source)
         return backend.head(path)
 
-    def download(self, source: str, dest: Path, progress: ProgressCallback) -> None:
+    def download(
+        self,
+        source: str,
+        dest: Path,
+        progress: ProgressCallback,
+        *,
+        meta: FileMetadata | None = None,
+    ) -> None:
         """Download file by delegating to appropriate backend."""
         backend, path = self._get_backend_and_path(source)
-        backend.download(path, dest, progress)
+        backend.download(path, dest, progress, meta=meta)
 
     def upload(
         self, local: Path, dest: str, progress: ProgressCallback | None = None
@@ -111,10 +118,12 @@ class RouterStorage:
         dest: Path,
         version_id: str,
         progress: ProgressCallback,
+        *,
+        meta: FileMetadata | None = None,
     ) -> None:
         """Download specific version by delegating to appropriate backend."""
         backend, path = self._get_backend_and_path(source)
-        backend.download_version(path, dest, version_id, progress)
+        backend.download_version(path, dest, version_id, progress, meta=meta)
 
 
 def create_router(s3_client: Any | None = None) -> RouterStorage:
@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import fnmatch
+import threading
+import uuid
 from pathlib import PurePosixPath
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import boto3
+from boto3.exceptions import S3TransferFailedError
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
 from botocore.exceptions import ClientError
+from s3transfer.exceptions import RetriesExceededError, S3DownloadFailedError
+from s3transfer.subscribers import BaseSubscriber
 
 from datacachalog.core.exceptions import (
     StorageAccessError,
@@ -22,18 +28,63 @@ if TYPE_CHECKING:
     from pathlib import Path
 
     from mypy_boto3_s3 import S3Client
+    from s3transfer.futures import TransferFuture
+    from s3transfer.manager import TransferManager
 
     from datacachalog.core.ports import ProgressCallback
 
 
-# Chunk size for streaming downloads (64KB)
+# Chunk size for streaming uploads (64KB)
 _CHUNK_SIZE = 64 * 1024
 
+# Objects above the threshold are fetched as parallel ranged GETs
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    max_concurrency=10,
+)
+
+# Failures s3transfer raises in place of a ClientError
+_TRANSFER_ERRORS = (S3DownloadFailedError, RetriesExceededError, S3TransferFailedError)
+
+
+class _ProgressSubscriber(BaseSubscriber):
+    """Forward s3transfer progress events to a ProgressCallback.
+
+    When the caller already holds the object's size and ETag, they are handed
+    to s3transfer so it skips its internal HEAD; the ETag also pins every
+    ranged GET with IfMatch. Progress events arrive from transfer worker
+    threads, hence the lock.
+    """
+
+    def __init__(self, progress: ProgressCallback, meta: FileMetadata | None) -> None:
+        self._progress = progress
+        self._meta = meta
+        self._bytes_done = 0
+        self._lock = threading.Lock()
+
+    def on_queued(self, future: TransferFuture, **kwargs: Any) -> None:  # noqa: ARG002
+        if self._meta is None or self._meta.size is None or not self._meta.etag:
+            return
+        future.meta.provide_transfer_size(self._meta.size)
+        future.meta.provide_object_etag(self._meta.etag)
+
+    def on_progress(
+        self,
+        future: TransferFuture,
+        bytes_transferred: int,
+        **kwargs: Any,  # noqa: ARG002
+    ) -> None:
+        with self._lock:
+            self._bytes_done += bytes_transferred
+            self._progress(self._bytes_done, future.meta.size or 0)
+
 
 class S3Storage:
     """Storage adapter for S3 operations.
 
-    Implements StoragePort protocol for AWS S3.
+    Implements StoragePort protocol for AWS S3. Downloads run on a worker
+    pool that lives until close(); use the adapter as a context manager to
+    release it.
     """
 
     def __init__(self, client: S3Client | None = None) -> None:
@@ -43,6 +94,26 @@ class S3Storage:
             client: Optional boto3 S3 client. If not provided, creates a default client.
         """
         self._client = client or boto3.client("s3")
+        self._manager: TransferManager | None = None
+        self._manager_lock = threading.Lock()
+
+    def __enter__(self) -> S3Storage:
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        """Exit context manager, shutting down the transfer workers."""
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the transfer manager and its worker threads.
+
+        A later download starts a fresh manager.
+        """
+        with self._manager_lock:
+            manager, self._manager = self._manager, None
+        if manager is not None:
+            manager.shutdown()
 
     def head(self, source: str) -> FileMetadata:
         """Get file metadata without downloading.
@@ -70,36 +141,29 @@ class S3Storage:
             size=response["ContentLength"],
         )
 
-    def download(self, source: str, dest: Path, progress: ProgressCallback) -> None:
+    def download(
+        self,
+        source: str,
+        dest: Path,
+        progress: ProgressCallback,
+        *,
+        meta: FileMetadata | None = None,
+    ) -> None:
         """Download a file from S3 to local path with progress reporting.
 
         Args:
             source: S3 URI (s3://bucket/key).
             dest: Local destination path.
             progress: Callback function(bytes_downloaded, total_bytes).
+            meta: Metadata from an earlier head(). Saves a HEAD request and
+                pins the download to that ETag.
 
         Raises:
             StorageNotFoundError: If object does not exist.
             StorageAccessError: If access is denied.
             StorageError: For other S3 errors.
         """
-        bucket, key = self._parse_s3_uri(source)
-
-        try:
-            # Get object with streaming body
-            response = self._client.get_object(Bucket=bucket, Key=key)
-        except ClientError as e:
-            raise self._translate_client_error(e, source) from e
-
-        total_size = response["ContentLength"]
-        body = response["Body"]
-
-        bytes_downloaded = 0
-        with dest.open("wb") as f:
-            for chunk in iter(lambda: body.read(_CHUNK_SIZE), b""):
-                f.write(chunk)
-                bytes_downloaded += len(chunk)
-                progress(bytes_downloaded, total_size)
+        self._transfer(source, dest, progress, version_id=None, meta=meta)
 
     def upload(
         self, local: Path, dest: str, progress: ProgressCallback | None = None
@@ -252,6 +316,8 @@ class S3Storage:
         dest: Path,
         version_id: str,
         progress: ProgressCallback,
+        *,
+        meta: FileMetadata | None = None,
     ) -> None:
         """Download a specific version of an S3 object.
 
@@ -260,30 +326,76 @@ class S3Storage:
             dest: Local destination path.
             version_id: The version identifier.
             progress: Callback function(bytes_downloaded, total_bytes).
+            meta: The version's metadata, if already known. Saves a HEAD
+                request.
 
         Raises:
             StorageNotFoundError: If the version does not exist.
             StorageAccessError: If access is denied.
             StorageError: For other S3 errors.
         """
+        self._transfer(source, dest, progress, version_id=version_id, meta=meta)
+
+    def _transfer_manager(self) -> TransferManager:
+        """Return the transfer manager shared by all downloads of this adapter.
+
+        One manager means one worker pool, so concurrent fetches share
+        _TRANSFER_CONFIG.max_concurrency rather than each starting their own.
+        """
+        with self._manager_lock:
+            if self._manager is None:
+                self._manager = create_transfer_manager(self._client, _TRANSFER_CONFIG)
+            return self._manager
+
+    def _transfer(
+        self,
+        source: str,
+        dest: Path,
+        progress: ProgressCallback,
+        version_id: str | None,
+        meta: FileMetadata | None,
+    ) -> None:
+        """Download an object through boto3's managed transfer.
+
+        Large objects are split into ranged GETs that run concurrently and
+        are written straight to disk, so memory use stays bounded. The data
+        lands in a temporary file beside dest that is renamed over dest only
+        once complete, so a failed download never leaves a truncated dest.
+
+        Args:
+            source: S3 URI (s3://bucket/key).
+            dest: Local destination path.
+            progress: Callback function(bytes_downloaded, total_bytes).
+            version_id: Specific version to fetch, or None for the latest.
+            meta: Known size and ETag of the object; s3transfer issues its
+                own HEAD when this is None.
+
+        Raises:
+            StorageNotFoundError: If the object or version does not exist.
+            StorageAccessError: If access is denied.
+            StorageError: If the object no longer matches meta, or for other
+                S3 errors.
+        """
         bucket, key = self._parse_s3_uri(source)
+        extra_args = {"VersionId": version_id} if version_id else {}
+
+        subscriber = _ProgressSubscriber(progress, meta)
+        tmp_path = dest.with_name(f".{dest.name}.{uuid.uuid4().hex}.tmp")
 
         try:
-            response = self._client.get_object(
-                Bucket=bucket, Key=key, VersionId=version_id
-            )
+            # "x" creates the file with mode 0o666 less the umask
+            with tmp_path.open("xb") as f:
+                future = self._transfer_manager().download(
+                    bucket, key, f, extra_args=extra_args, subscribers=[subscriber]
+                )
+                future.result()
+            tmp_path.replace(dest)
         except ClientError as e:
             raise self._translate_client_error(e, source) from e
-
-        total_size = response["ContentLength"]
-        body = response["Body"]
-
-        bytes_downloaded = 0
-        with dest.open("wb") as f:
-            for chunk in iter(lambda: body.read(_CHUNK_SIZE), b""):
-                f.write(chunk)
-                bytes_downloaded += len(chunk)
-                progress(bytes_downloaded, total_size)
+        except _TRANSFER_ERRORS as e:
+            raise self._translate_transfer_error(e, source) from e
+        finally:
+            tmp_path.unlink(missing_ok=True)
 
     def _parse_s3_uri_prefix(self, uri: str) -> tuple[str, str]:
         """Parse an S3 URI prefix into bucket and key prefix.
@@ -335,6 +447,34 @@ class S3Storage:
         bucket, key = parts
         return bucket, key
 
+    def _translate_transfer_error(self, error: Exception, source: str) -> StorageError:
+        """Translate an s3transfer failure to a domain exception.
+
+        Args:
+            error: The exception raised by the transfer.
+            source: The source URI for context.
+
+        Returns:
+            StorageError describing the failure.
+        """
+        # s3transfer raises S3DownloadFailedError while handling the 412 that
+        # an If-Match on a replaced object produces
+        context = error.__context__
+        if isinstance(context, ClientError) and (
+            context.response.get("Error", {}).get("Code") == "PreconditionFailed"
+        ):
+            return StorageError(
+                f"Object changed during download: {source}",
+                source=source,
+                cause=error,
+            )
+
+        return StorageError(
+            f"S3 download failed: {error}",
+            source=source,
+            cause=error,
+        )
+
     def _translate_client_error(self, error: ClientError, source: str) -> StorageError:
         """Translate botocore ClientError to domain exception.
 
@@ -8,6 +8,10 @@ from __future__ import annotations
 from pathlib import Path
 
 
+# Root markers in priority order; each is probed with one stat per directory
+_ROOT_MARKERS = (".datacachalog", "pyproject.toml", ".git")
+
+
 def find_project_root(start: Path | None = None) -> Path:
     """Find the project root directory by walking up from start directory.
 
@@ -30,12 +34,11 @@ def find_project_root(start: Path | None = None) -> Path:
     if start is None:
         start = Path.cwd()
 
-    markers = [".datacachalog", "pyproject.toml", ".git"]
     current = start.resolve()
 
-    for parent in [current, *current.parents]:
-        for marker in markers:
+    for parent in (current, *current.parents):
+        for marker in _ROOT_MARKERS:
             if (parent / marker).exists():
                 return parent
 
-    return start.resolve()
+    return current
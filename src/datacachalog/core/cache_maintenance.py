@@ -13,19 +13,21 @@ from datacachalog.core.glob_utils import is_glob_pattern
 
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from datacachalog.core.models import Dataset
     from datacachalog.core.ports import CachePort
 
 
 def clean_orphaned_keys(
     cache: CachePort,
-    datasets: dict[str, Dataset],
+    datasets: Mapping[str, Dataset],
 ) -> int:
     """Remove orphaned cache entries not belonging to any dataset.
 
     Args:
         cache: The cache port to clean.
-        datasets: Dict of dataset name to Dataset.
+        datasets: Mapping of dataset name to Dataset.
 
     Returns:
         Number of orphaned cache entries removed.
@@ -67,14 +69,14 @@ def clean_orphaned_keys(
 
 def calculate_cache_size(
     name: str,
-    datasets: dict[str, Dataset],
+    datasets: Mapping[str, Dataset],
     cache: CachePort,
 ) -> int:
     """Calculate total cached size for a dataset in bytes.
 
     Args:
         name: The dataset name.
-        datasets: Dict of dataset name to Dataset.
+        datasets: Mapping of dataset name to Dataset.
         cache: The cache port.
 
     Returns:
@@ -6,10 +6,12 @@ These are implementation details and should not be used directly.
 
 from __future__ import annotations
 
+import shutil
+import tempfile
 from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from datacachalog.core.exceptions import ConfigurationError, EmptyGlobMatchError
 from datacachalog.core.glob_utils import derive_cache_key, split_glob_pattern
@@ -17,12 +19,23 @@ from datacachalog.core.models import CacheMetadata, Dataset
 
 
 if TYPE_CHECKING:
-    from datacachalog.core.ports import CachePort, ProgressReporter, StoragePort
+    from datacachalog.core.models import FileMetadata
+    from datacachalog.core.ports import (
+        CachePort,
+        ExecutorPort,
+        ProgressReporter,
+        StoragePort,
+    )
 
 # Type aliases for the callable parameters
 ResolveCachePath = Callable[[Dataset], Path]
 ResolveVersionCacheKey = Callable[[Dataset, datetime], str]
 
+# Name parts of the private directory, beside the derived cache paths,
+# where one glob fetch downloads its matches
+_GLOB_STAGING_PREFIX = ".glob-"
+_GLOB_STAGING_SUFFIX = ".tmp"
+
 
 def fetch_single(
     cache_key: str,
@@ -59,7 +72,7 @@ def fetch_single(
 
     callback = progress.start_task(cache_key, total_size)
     try:
-        storage.download(dataset.source, dest, callback)
+        storage.download(dataset.source, dest, callback, meta=remote_meta)
     finally:
         progress.finish_task(cache_key)
 
@@ -88,10 +101,16 @@ def fetch_version(
     resolve_version_cache_key: ResolveVersionCacheKey,
     *,
     dry_run: bool = False,
+    remote_meta: FileMetadata | None = None,
 ) -> Path:
-    """Fetch a specific version of a dataset."""
+    """Fetch a specific version of a dataset.
+
+    remote_meta may carry the version's metadata from an earlier listing,
+    which saves the head_version() round-trip.
+    """
     # Get version metadata to generate date-based cache key
-    remote_meta = storage.head_version(dataset.source, version_id)
+    if remote_meta is None:
+        remote_meta = storage.head_version(dataset.source, version_id)
 
     if remote_meta.last_modified is None:
         raise ValueError(f"Version {version_id} has no last_modified timestamp")
@@ -111,8 +130,6 @@ def fetch_version(
         return cache_dir / cache_key
 
     # Download to a temporary location first
-    import tempfile
-
     if cache_dir is None:
         raise ConfigurationError("cache_dir is required for versioned fetches")
     cache_dir.mkdir(parents=True, exist_ok=True)
@@ -124,7 +141,9 @@ def fetch_version(
         total_size = remote_meta.size or 0
         callback = progress.start_task(cache_key, total_size)
         try:
-            storage.download_version(dataset.source, tmp_path, version_id, callback)
+            storage.download_version(
+                dataset.source, tmp_path, version_id, callback, meta=remote_meta
+            )
         finally:
             progress.finish_task(cache_key)
 
@@ -152,23 +171,45 @@ def fetch_glob(
     resolve_cache_path: ResolveCachePath,
     *,
     dry_run: bool = False,
+    executor: ExecutorPort | None = None,
 ) -> list[Path]:
-    """Fetch all files matching a glob pattern."""
+    """Fetch all files matching a glob pattern.
+
+    With an executor, matched files are fetched concurrently; the returned
+    paths keep the order of the storage listing either way.
+
+    Matches can share a basename (e.g. "**/x.csv"), so instead of the derived
+    cache path they would all share, each match downloads to its own file in
+    a private staging directory. The cache copies each file in, and the
+    directory is removed once the fetch ends, whether it succeeded or not.
+    """
     prefix, pattern = split_glob_pattern(dataset.source)
     matched_uris = storage.list(prefix, pattern)
 
     if not matched_uris:
         raise EmptyGlobMatchError(pattern, prefix)
 
-    paths: list[Path] = []
-    for uri in matched_uris:
+    staging: Path | None = None
+    if not dry_run:
+        derived = resolve_cache_path(Dataset(name=dataset.name, source=matched_uris[0]))
+        derived.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(
+            tempfile.mkdtemp(
+                dir=derived.parent,
+                prefix=_GLOB_STAGING_PREFIX,
+                suffix=_GLOB_STAGING_SUFFIX,
+            )
+        )
+
+    def fetch_match(index: int, uri: str) -> Path:
         cache_key = derive_cache_key(dataset.name, prefix, uri)
         single_dataset = Dataset(
             name=cache_key,
             source=uri,
             description=dataset.description,
+            cache_path=None if staging is None else staging / str(index),
         )
-        path = fetch_single(
+        return fetch_single(
             cache_key,
             single_dataset,
             progress,
@@ -177,6 +218,18 @@ def fetch_glob(
             resolve_cache_path,
             dry_run=dry_run,
         )
-        paths.append(path)
 
-    return paths
+    try:
+        if executor is None or len(matched_uris) == 1:
+            return [fetch_match(i, uri) for i, uri in enumerate(matched_uris)]
+
+        futures = [
+            executor.submit(fetch_match, i, uri) for i, uri in enumerate(matched_uris)
+        ]
+        # Let every match finish before the staging directory is removed
+        for future in futures:
+            future.exception()
+        return [cast("Path", future.result()) for future in futures]
+    finally:
+        if staging is not None:
+            shutil.rmtree(staging, ignore_errors=True)
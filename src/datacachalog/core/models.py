@@ -6,6 +6,7 @@ They represent the core domain concepts of the data catalog.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -104,6 +105,8 @@ class Dataset:
         if not self.source:
             raise ValueError("Dataset source cannot be empty")
         _validate_source_uri(self.source)
+        # Names are dict keys on every lookup; interned keys compare by identity
+        object.__setattr__(self, "name", sys.intern(str(self.name)))
 
     def with_cache_path(self, cache_path: Path) -> Self:
         """Return a new Dataset with the specified cache path.
@@ -305,3 +308,20 @@ def find_version_at(
         if version.last_modified <= as_of:
             return version
     return None
+
+
+def listed_version_metadata(version: ObjectVersion) -> FileMetadata | None:
+    """Take a listed version's metadata instead of issuing a HEAD.
+
+    A stored version never changes, so listing metadata stays valid for it.
+
+    Args:
+        version: A version from a list_versions() call.
+
+    Returns:
+        FileMetadata for the version, or None if it is a delete marker or
+        lacks an etag or size.
+    """
+    if version.is_delete_marker or version.etag is None or version.size is None:
+        return None
+    return version.to_file_metadata()
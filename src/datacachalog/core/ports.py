@@ -64,8 +64,23 @@ class Reader(Protocol[T_co]):
 class StoragePort(Protocol):
     """Remote storage backend (S3, local filesystem)."""
 
-    def download(self, source: str, dest: Path, progress: ProgressCallback) -> None:
-        """Download a file from remote storage to local path."""
+    def download(
+        self,
+        source: str,
+        dest: Path,
+        progress: ProgressCallback,
+        *,
+        meta: FileMetadata | None = None,
+    ) -> None:
+        """Download a file from remote storage to local path.
+
+        Args:
+            source: Remote storage URI.
+            dest: Local path to download to.
+            progress: Callback function(bytes_downloaded, total_bytes).
+            meta: Metadata from an earlier head(), which backends may use
+                instead of looking the object up again.
+        """
         ...
 
     def upload(
@@ -140,6 +155,8 @@ class StoragePort(Protocol):
         dest: Path,
         version_id: str,
         progress: ProgressCallback,
+        *,
+        meta: FileMetadata | None = None,
     ) -> None:
         """Download a specific version of an object.
 
@@ -148,6 +165,7 @@ class StoragePort(Protocol):
             dest: Local path to download to.
             version_id: The version identifier.
             progress: Callback function(bytes_downloaded, total_bytes).
+            meta: The version's metadata, if already known.
 
         Raises:
             VersioningNotSupportedError: If storage doesn't support versioning.
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 from datacachalog.core.exceptions import (
@@ -14,8 +15,10 @@ from datacachalog.core.glob_utils import is_glob_pattern
 from datacachalog.core.models import (
     CacheMetadata,
     Dataset,
+    FileMetadata,
     ObjectVersion,
     find_version_at,
+    listed_version_metadata,
 )
 from datacachalog.core.ports import (
     CachePort,
@@ -42,7 +45,8 @@ class Catalog:
         executor: ExecutorPort | None = None,
         reader: Reader[object] | None = None,
     ) -> None:
-        self._datasets = {d.name: d for d in datasets}
+        # Read-only view: the name index is fixed for the catalog's lifetime
+        self._datasets = MappingProxyType({d.name: d for d in datasets})
         self._storage = storage
         self._cache = cache
         self._cache_dir = cache_dir
@@ -157,7 +161,8 @@ class Catalog:
         """Fetch a dataset, downloading if not cached or stale.
 
         For glob patterns (source contains *, ?, or [), expands the pattern
-        and returns a list of paths. For single files, returns a single Path.
+        and returns a list of paths. When an executor is injected, the matched
+        files are fetched in parallel. For single files, returns a single Path.
 
         Args:
             name: The dataset name.
@@ -192,18 +197,14 @@ class Catalog:
                     "Versioned fetch (version_id or as_of) is not supported "
                     "for glob pattern datasets"
                 )
-            from datacachalog.core.fetch_operations import fetch_glob
-
-            return fetch_glob(
-                dataset,
-                progress,
-                self._storage,
-                self._cache,
-                self._resolve_cache_path,
-                dry_run=dry_run,
+            return self._fetch_glob(
+                dataset, progress, dry_run=dry_run, executor=self._executor
             )
 
-        # Resolve as_of to version_id
+        # Resolve as_of to version_id. The resolved listing entry also
+        # supplies the version's metadata, which saves a head_version()
+        # round-trip in fetch_version().
+        remote_meta: FileMetadata | None = None
         if as_of is not None:
             versions = self._storage.list_versions(dataset.source)
             resolved_version = find_version_at(versions, as_of)
@@ -212,6 +213,7 @@ class Catalog:
 
                 raise VersionNotFoundError(name, as_of)
             version_id = resolved_version.version_id
+            remote_meta = listed_version_metadata(resolved_version)
 
         # Version-specific fetch
         if version_id is not None:
@@ -226,6 +228,7 @@ class Catalog:
                 self._cache_dir,
                 self._resolve_version_cache_key,
                 dry_run=dry_run,
+                remote_meta=remote_meta,
             )
 
         # Single file fetch
@@ -417,6 +420,27 @@ class Catalog:
         )
         self._cache.put(name, local_path, cache_meta)
 
+    def _fetch_glob(
+        self,
+        dataset: Dataset,
+        progress: ProgressReporter,
+        *,
+        dry_run: bool,
+        executor: ExecutorPort | None,
+    ) -> list[Path]:
+        """Fetch every file matching a glob dataset, optionally in parallel."""
+        from datacachalog.core.fetch_operations import fetch_glob
+
+        return fetch_glob(
+            dataset,
+            progress,
+            self._storage,
+            self._cache,
+            self._resolve_cache_path,
+            dry_run=dry_run,
+            executor=executor,
+        )
+
     def fetch_all(
         self,
         progress: ProgressReporter | None = None,
@@ -428,6 +452,8 @@ class Catalog:
 
         Downloads are performed in parallel when an executor is injected and
         max_workers > 1. When no executor is provided, execution is sequential.
+        The injected executor is reused across calls and never shut down here;
+        its lifetime belongs to the caller that created it.
 
         Args:
             progress: Optional progress reporter for download feedback.
@@ -447,30 +473,42 @@ class Catalog:
         if not datasets:
             return {}
 
+        def fetch_one(dataset: Dataset) -> Path | list[Path]:
+            # fetch_all() parallelizes across datasets. A worker fanning its
+            # glob matches out into the same executor and waiting on them
+            # could leave every worker blocked, so globs stay sequential here.
+            if is_glob_pattern(dataset.source):
+                return self._fetch_glob(
+                    dataset, progress, dry_run=dry_run, executor=None
+                )
+            return self.fetch(dataset.name, progress=progress, dry_run=dry_run)
+
         results: dict[str, Path | list[Path]] = {}
 
         # Sequential execution for max_workers=1 or when no executor provided
         if max_workers == 1 or self._executor is None:
             for dataset in datasets:
-                results[dataset.name] = self.fetch(
-                    dataset.name, progress=progress, dry_run=dry_run
-                )
+                results[dataset.name] = fetch_one(dataset)
             return results
 
-        # Parallel execution - use injected executor
-        def fetch_one(dataset: Dataset) -> tuple[str, Path | list[Path]]:
-            result = self.fetch(dataset.name, progress=progress, dry_run=dry_run)
-            return dataset.name, result
+        # A lone dataset gains nothing from a round-trip through the pool;
+        # fetch() can still spread a glob's matches across the executor
+        if len(datasets) == 1:
+            (dataset,) = datasets
+            results[dataset.name] = self.fetch(
+                dataset.name, progress=progress, dry_run=dry_run
+            )
+            return results
 
+        # The injected executor outlives this call: entering it as a context
+        # manager would shut a thread pool down after the first fetch_all()
         executor = self._executor
-        with executor:
-            futures = [executor.submit(fetch_one, ds) for ds in datasets]
-            for future in futures:
-                result_tuple = future.result()
-                # Type narrowing: fetch_one returns tuple[str, Path | list[Path]]
-                assert isinstance(result_tuple, tuple)
-                name, result = result_tuple
-                results[name] = result
+        futures = [executor.submit(fetch_one, ds) for ds in datasets]
+        for dataset, future in zip(datasets, futures, strict=True):
+            result = future.result()
+            # Type narrowing: fetch_one returns Path | list[Path]
+            assert isinstance(result, Path | list)
+            results[dataset.name] = result
 
         return results
 
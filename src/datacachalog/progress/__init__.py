@@ -1,6 +1,7 @@
 """Progress reporting adapters."""
 
+from datacachalog.progress.queued import QueuedProgressReporter
 from datacachalog.progress.rich_progress import RichProgressReporter
 
 
-__all__ = ["RichProgressReporter"]
+__all__ = ["QueuedProgressReporter", "RichProgressReporter"]
@@ -0,0 +1,190 @@
+"""Queue-backed progress reporter for parallel fetches."""
+
+from __future__ import annotations
+
+import threading
+from queue import SimpleQueue
+from typing import TYPE_CHECKING, Literal
+
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from datacachalog.core.ports import ProgressCallback, ProgressReporter
+
+# (kind, task name, bytes downloaded, total bytes)
+_Event = tuple[Literal["start", "update", "finish"], str, int, int]
+
+
+class QueuedProgressReporter:
+    """Funnel progress events from worker threads through one dispatcher.
+
+    Wraps another ProgressReporter. start_task(), finish_task() and the
+    per-chunk callbacks only enqueue an event; a single background thread
+    replays the events in order against the wrapped reporter. Parallel
+    fetch_all() workers therefore never contend for the wrapped
+    reporter's internal lock.
+
+    Use it as a context manager so pending events are flushed on exit.
+    If the wrapped reporter raises, the dispatcher keeps delivering later
+    events and the first exception is re-raised by close().
+
+    Example:
+        with (
+            RichProgressReporter() as rich,
+            QueuedProgressReporter(rich) as reporter,
+        ):
+            catalog.fetch_all(progress=reporter, max_workers=8)
+    """
+
+    def __init__(self, reporter: ProgressReporter) -> None:
+        """Wrap a reporter.
+
+        Args:
+            reporter: The reporter that receives the replayed events.
+        """
+        self._reporter = reporter
+        self._queue: SimpleQueue[_Event | None] = SimpleQueue()
+        self._callbacks: dict[str, ProgressCallback] = {}
+        self._failed_starts: set[str] = set()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._closed = False
+        self._error: Exception | None = None
+
+    def __enter__(self) -> QueuedProgressReporter:
+        """Start the dispatcher thread.
+
+        Raises:
+            RuntimeError: If the reporter has been closed.
+        """
+        with self._lock:
+            self._ensure_started()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Flush pending events and stop the dispatcher thread.
+
+        A reporter error is re-raised unless the block is already raising.
+        """
+        error = self._stop()
+        if error is not None and exc_val is None:
+            raise error
+
+    def close(self) -> None:
+        """Deliver all queued events, then stop the dispatcher thread.
+
+        Once closed, start_task() raises and late progress or finish
+        events from still-running workers are dropped.
+
+        Raises:
+            Exception: The first exception raised by the wrapped reporter.
+        """
+        error = self._stop()
+        if error is not None:
+            raise error
+
+    def start_task(self, name: str, total: int) -> ProgressCallback:
+        """Queue the start of a download task.
+
+        Args:
+            name: Human-readable name for the task.
+            total: Total bytes to download.
+
+        Returns:
+            A callback that queues progress updates for this task.
+
+        Raises:
+            RuntimeError: If the reporter has been closed.
+        """
+        with self._lock:
+            self._ensure_started()
+            self._queue.put(("start", name, 0, total))
+
+        def callback(downloaded: int, total_bytes: int) -> None:
+            self._enqueue(("update", name, downloaded, total_bytes))
+
+        return callback
+
+    def finish_task(self, name: str) -> None:
+        """Queue the completion of a task.
+
+        Args:
+            name: The task name.
+        """
+        self._enqueue(("finish", name, 0, 0))
+
+    def _enqueue(self, event: _Event) -> None:
+        """Queue an event, or drop it if the reporter is already closed.
+
+        The check and the put share the lock with _stop(), so no event can
+        land behind the stop sentinel and sit in the queue undelivered.
+        """
+        with self._lock:
+            if not self._closed:
+                self._ensure_started()
+                self._queue.put(event)
+
+    def _stop(self) -> Exception | None:
+        """Drain the queue, join the dispatcher, and take its first error."""
+        with self._lock:
+            self._closed = True
+            thread, self._thread = self._thread, None
+            if thread is not None:
+                self._queue.put(None)
+        if thread is not None:
+            thread.join()
+        error, self._error = self._error, None
+        return error
+
+    def _ensure_started(self) -> None:
+        """Start the dispatcher thread once; the caller holds self._lock."""
+        if self._closed:
+            raise RuntimeError("QueuedProgressReporter is closed")
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._dispatch, name="progress-dispatch", daemon=True
+            )
+            self._thread.start()
+
+    def _dispatch(self) -> None:
+        """Replay queued events against the wrapped reporter until closed.
+
+        A failing event is recorded rather than allowed to end the thread,
+        which would leave every later event stuck in the queue.
+        """
+        while (event := self._queue.get()) is not None:
+            try:
+                self._deliver(event)
+            except Exception as e:
+                if self._error is None:
+                    self._error = e
+
+    def _deliver(self, event: _Event) -> None:
+        """Apply one event to the wrapped reporter.
+
+        Tasks whose start the wrapped reporter rejected never get their
+        updates or finish forwarded, since the reporter has no such task.
+        """
+        kind, name, downloaded, total = event
+        if kind == "start":
+            self._failed_starts.discard(name)
+            try:
+                self._callbacks[name] = self._reporter.start_task(name, total)
+            except Exception:
+                self._failed_starts.add(name)
+                raise
+        elif kind == "update":
+            callback = self._callbacks.get(name)
+            if callback is not None:
+                callback(downloaded, total)
+        elif name in self._failed_starts:
+            self._failed_starts.discard(name)
+        else:
+            self._callbacks.pop(name, None)
+            self._reporter.finish_task(name)
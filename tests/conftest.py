@@ -6,25 +6,48 @@ shared fixtures for the test suite.
 
 from __future__ import annotations
 
+import os
+import uuid
+from array import array
 from typing import TYPE_CHECKING
 
 import pytest
+from hypothesis import HealthCheck, settings
+
+from datacachalog import Dataset
+from datacachalog.adapters.storage import FilesystemStorage
+from datacachalog.core.exceptions import StorageNotFoundError
 
 
 if TYPE_CHECKING:
     import builtins
+    from collections.abc import Callable, Iterator
     from pathlib import Path
 
-    from datacachalog.core.models import FileMetadata, ObjectVersion
+    from mypy_boto3_s3 import S3Client
+
+    from datacachalog.core.models import CacheMetadata, FileMetadata, ObjectVersion
     from datacachalog.core.ports import ProgressCallback, StoragePort
 else:
     import builtins
     from pathlib import Path
 
-    from datacachalog.core.models import FileMetadata, ObjectVersion
+    from datacachalog.core.models import CacheMetadata, FileMetadata, ObjectVersion
     from datacachalog.core.ports import ProgressCallback, StoragePort
 
 
+# Hypothesis profiles: property tests do disk I/O per example, so per-example
+# deadlines only produce flaky failures. Select with HYPOTHESIS_PROFILE.
+settings.register_profile(
+    "ci",
+    max_examples=25,
+    deadline=None,
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+)
+settings.register_profile("nightly", max_examples=500, deadline=None)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "ci"))
+
+
 def pytest_configure(config: pytest.Config) -> None:
     """Register custom markers."""
     config.addinivalue_line("markers", "core: Core models, ports, and services")
@@ -33,6 +56,9 @@ def pytest_configure(config: pytest.Config) -> None:
     config.addinivalue_line("markers", "progress: Rich progress integration")
     config.addinivalue_line("markers", "cli: CLI tests")
     config.addinivalue_line("markers", "e2e: End-to-end tests")
+    config.addinivalue_line(
+        "markers", "parallel: Tests that run fetches on an executor"
+    )
     config.addinivalue_line(
         "markers", "tra: Test Responsibility Anchor (TRA) - namespace.Anchor format"
     )
@@ -51,7 +77,14 @@ def fake_storage() -> StoragePort:
     """
 
     class FakeStorage:
-        def download(self, source: str, dest: Path, progress: ProgressCallback) -> None:
+        def download(
+            self,
+            source: str,
+            dest: Path,
+            progress: ProgressCallback,
+            *,
+            meta: FileMetadata | None = None,
+        ) -> None:
             pass
 
         def upload(
@@ -79,7 +112,256 @@ def fake_storage() -> StoragePort:
             dest: Path,
             version_id: str,
             progress: ProgressCallback,
+            *,
+            meta: FileMetadata | None = None,
         ) -> None:
             pass
 
     return FakeStorage()
+
+
+@pytest.fixture(scope="session")
+def storage() -> FilesystemStorage:
+    """Filesystem storage adapter shared across the session.
+
+    Its only state is an ETag memo keyed by path and stat, so tests can share it.
+    """
+    return FilesystemStorage()
+
+
+class FakeVersionedStorage:
+    """In-memory versioned storage seeded with per-source version histories.
+
+    Serves list_versions/head/head_version from a dict of source URI to
+    ObjectVersion list, skipping the botocore and moto request stack for
+    tests that only exercise version resolution logic.
+    """
+
+    def __init__(self, versions: dict[str, builtins.list[ObjectVersion]]) -> None:
+        self._versions = {
+            source: sorted(history, reverse=True)
+            for source, history in versions.items()
+        }
+
+    def _history(self, source: str) -> builtins.list[ObjectVersion]:
+        try:
+            return self._versions[source]
+        except KeyError:
+            raise StorageNotFoundError(
+                f"Object not found: {source}", source=source
+            ) from None
+
+    def download(
+        self,
+        source: str,
+        dest: Path,
+        progress: ProgressCallback,
+        *,
+        meta: FileMetadata | None = None,
+    ) -> None:
+        pass
+
+    def upload(
+        self, local: Path, dest: str, progress: ProgressCallback | None = None
+    ) -> None:
+        pass
+
+    def head(self, source: str) -> FileMetadata:
+        latest = next(v for v in self._history(source) if not v.is_delete_marker)
+        return latest.to_file_metadata()
+
+    def list(self, prefix: str, pattern: str | None = None) -> builtins.list[str]:
+        return sorted(s for s in self._versions if s.startswith(prefix))
+
+    def list_versions(
+        self, source: str, limit: int | None = None
+    ) -> builtins.list[ObjectVersion]:
+        history = self._history(source)
+        return history[:limit] if limit else list(history)
+
+    def head_version(self, source: str, version_id: str) -> FileMetadata:
+        for version in self._history(source):
+            if version.version_id == version_id:
+                return version.to_file_metadata()
+        raise StorageNotFoundError(f"Object not found: {source}", source=source)
+
+    def download_version(
+        self,
+        source: str,
+        dest: Path,
+        version_id: str,
+        progress: ProgressCallback,
+        *,
+        meta: FileMetadata | None = None,
+    ) -> None:
+        pass
+
+
+@pytest.fixture(scope="session")
+def fake_versioned_storage() -> type[FakeVersionedStorage]:
+    """Factory for FakeVersionedStorage: call it with {source: [ObjectVersion]}."""
+    return FakeVersionedStorage
+
+
+class InMemoryCache:
+    """Dict-backed CachePort for tests that never read cached files.
+
+    put() records the source path instead of copying it, so constructor
+    and lookup tests can build a Catalog without creating a cache_dir.
+    """
+
+    def __init__(self) -> None:
+        self.entries: dict[str, tuple[Path, CacheMetadata]] = {}
+
+    def get(self, key: str) -> tuple[Path, CacheMetadata] | None:
+        return self.entries.get(key)
+
+    def put(self, key: str, path: Path, metadata: CacheMetadata) -> None:
+        self.entries[key] = (path, metadata)
+
+    def invalidate(self, key: str) -> None:
+        self.entries.pop(key, None)
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        keys = [key for key in self.entries if key.startswith(f"{prefix}/")]
+        for key in keys:
+            del self.entries[key]
+        return len(keys)
+
+    def list_all_keys(self) -> builtins.list[str]:
+        return sorted(self.entries)
+
+
+@pytest.fixture
+def in_memory_cache() -> InMemoryCache:
+    """Fresh InMemoryCache per test."""
+    return InMemoryCache()
+
+
+class TrackingReporter:
+    """Fake progress reporter that records task starts, finishes, and progress."""
+
+    def __init__(self) -> None:
+        self.started_tasks: builtins.list[tuple[str, int]] = []
+        self.finished_tasks: builtins.list[str] = []
+        # Starts and finishes in arrival order, as "start:<name>"/"finish:<name>"
+        self.order: builtins.list[str] = []
+        # Progress samples as parallel int64 columns, one entry per callback
+        self.done: array[int] = array("q")
+        self.totals: array[int] = array("q")
+
+    def start_task(self, name: str, total: int) -> ProgressCallback:
+        """Track task start and return a callback recording progress."""
+        self.started_tasks.append((name, total))
+        self.order.append(f"start:{name}")
+
+        def callback(done: int, total: int) -> None:
+            self.done.append(done)
+            self.totals.append(total)
+
+        return callback
+
+    def finish_task(self, name: str) -> None:
+        """Track task finish."""
+        self.finished_tasks.append(name)
+        self.order.append(f"finish:{name}")
+
+
+@pytest.fixture
+def tracking_reporter() -> TrackingReporter:
+    """Fresh TrackingReporter per test."""
+    return TrackingReporter()
+
+
+def _customers_dataset(remote_file: Path, cache_dir: Path) -> Dataset:
+    """Build the single-file "customers" dataset many catalog tests share."""
+    return Dataset(
+        name="customers",
+        source=str(remote_file),
+        cache_path=cache_dir / "customers.csv",
+    )
+
+
+@pytest.fixture(scope="session")
+def customers_dataset() -> Callable[[Path, Path], Dataset]:
+    """Builder for the "customers" dataset: call it with (remote_file, cache_dir)."""
+    return _customers_dataset
+
+
+# Files in the shared read-only storage seed, by name
+_SEED_FILES: dict[str, bytes] = {
+    "a.parquet": b"content a",
+    "b.parquet": b"content b",
+    "c.csv": b"not matched",
+    "file1.txt": b"original 1",
+    "file2.txt": b"original 2",
+    "single.csv": b"content",
+    "customers.csv": b"id,name\n1,Alice\n",
+    "orders.csv": b"id,amount\n1,100\n",
+    "a.csv": b"a",
+    "b.csv": b"b",
+    **{f"file{i}.csv": f"content {i}".encode() for i in range(4)},
+}
+
+
+@pytest.fixture(scope="session")
+def seed_storage(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session-wide "remote" directory holding _SEED_FILES plus an empty/ subdir.
+
+    Shared by every test that only reads its storage, so the files are
+    written once per session. Treat it as read-only: tests that modify
+    remote files must copytree() it into their own tmp_path first.
+    """
+    seed = tmp_path_factory.mktemp("seed_storage")
+    for name, content in _SEED_FILES.items():
+        (seed / name).write_bytes(content)
+    (seed / "empty").mkdir()
+    return seed
+
+
+@pytest.fixture(scope="session")
+def session_s3_client() -> S3Client:
+    """Session-wide boto3 S3 client for moto-backed tests.
+
+    Building a client loads botocore's JSON service model, which dominates
+    moto test setup. The client is created once with fake credentials and
+    only reaches moto while a mock_aws() context is active. It comes from
+    a fresh session, because boto3's default session may predate moto's
+    import and then lack moto's request handler.
+    """
+    import boto3
+    import moto  # noqa: F401 - registers moto's botocore handler first
+
+    return boto3.session.Session().client(
+        "s3",
+        region_name="us-east-1",
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",  # noqa: S106 - moto fake credentials
+    )
+
+
+@pytest.fixture(scope="module")
+def module_mock_aws() -> Iterator[None]:
+    """Keep one mock_aws() context open for a whole test module.
+
+    Entering mock_aws() resets every moto backend, so doing it once per
+    module instead of once per test removes most of the setup cost. Tests
+    stay isolated by working in their own uniquely named buckets, and each
+    pytest-xdist worker is a separate process with its own moto backend.
+    """
+    from moto import mock_aws
+
+    with mock_aws():
+        yield
+
+
+@pytest.fixture
+def versioned_bucket(session_s3_client: S3Client, module_mock_aws: None) -> str:
+    """Create a fresh, uniquely named versioning-enabled bucket."""
+    bucket = f"versioned-{uuid.uuid4().hex}"
+    session_s3_client.create_bucket(Bucket=bucket)
+    session_s3_client.put_bucket_versioning(
+        Bucket=bucket,
+        VersioningConfiguration={"Status": "Enabled"},
+    )
+    return bucket
@@ -2,15 +2,13 @@
 
 from __future__ import annotations
 
-import boto3
 import pytest
 from moto import mock_aws
 
 
 @pytest.fixture
-def s3_client():
-    """Create a mocked S3 client with a test bucket."""
+def s3_client(session_s3_client):
+    """Reset moto and give the shared S3 client a fresh test bucket."""
     with mock_aws():
-        client = boto3.client("s3", region_name="us-east-1")
-        client.create_bucket(Bucket="test-bucket")
-        yield client
+        session_s3_client.create_bucket(Bucket="test-bucket")
+        yield session_s3_client
@@ -24,7 +24,7 @@ class TestCatalogRouterMixedSchemes:
     """Tests for Catalog using RouterStorage with mixed URI schemes."""
 
     def test_fetch_routes_s3_uri_to_s3_storage(
-        self, s3_client: Any, tmp_path: Path
+        self, s3_client: Any, tmp_path: Path, storage: FilesystemStorage
     ) -> None:
         """Catalog with RouterStorage should fetch s3:// URIs via S3Storage."""
         # Setup S3 file
@@ -34,7 +34,7 @@ class TestCatalogRouterMixedSchemes:
         router = RouterStorage(
             backends={
                 "s3": S3Storage(client=s3_client),
-                None: FilesystemStorage(),
+                None: storage,
             }
         )
         cache = FileCache(cache_dir=cache_dir)
@@ -51,7 +51,7 @@ class TestCatalogRouterMixedSchemes:
         assert path.read_text() == "s3 content"
 
     def test_fetch_routes_local_path_to_filesystem_storage(
-        self, tmp_path: Path
+        self, tmp_path: Path, storage: FilesystemStorage
     ) -> None:
         """Catalog with RouterStorage should fetch local paths via FilesystemStorage."""
         # Setup local file
@@ -61,7 +61,7 @@ class TestCatalogRouterMixedSchemes:
         source_file.write_text("local content")
 
         cache_dir = tmp_path / "cache"
-        router = RouterStorage(backends={None: FilesystemStorage()})
+        router = RouterStorage(backends={None: storage})
         cache = FileCache(cache_dir=cache_dir)
         dataset = Dataset(name="localdata", source=str(source_file))
         catalog = Catalog(
@@ -76,7 +76,7 @@ class TestCatalogRouterMixedSchemes:
         assert path.read_text() == "local content"
 
     def test_fetch_mixed_datasets_in_single_catalog(
-        self, s3_client: Any, tmp_path: Path
+        self, s3_client: Any, tmp_path: Path, storage: FilesystemStorage
     ) -> None:
         """Catalog should handle both S3 and local datasets simultaneously."""
         # Setup S3 file
@@ -92,7 +92,7 @@ class TestCatalogRouterMixedSchemes:
         router = RouterStorage(
             backends={
                 "s3": S3Storage(client=s3_client),
-                None: FilesystemStorage(),
+                None: storage,
             }
         )
         cache = FileCache(cache_dir=cache_dir)
@@ -122,7 +122,9 @@ class TestCatalogRouterMixedSchemes:
 class TestCatalogRouterStaleness:
     """Tests for staleness detection with RouterStorage."""
 
-    def test_is_stale_works_with_router(self, s3_client: Any, tmp_path: Path) -> None:
+    def test_is_stale_works_with_router(
+        self, s3_client: Any, tmp_path: Path, storage: FilesystemStorage
+    ) -> None:
         """RouterStorage should correctly report staleness from S3."""
         s3_client.put_object(Bucket="test-bucket", Key="data.csv", Body=b"original")
 
@@ -130,7 +132,7 @@ class TestCatalogRouterStaleness:
         router = RouterStorage(
             backends={
                 "s3": S3Storage(client=s3_client),
-                None: FilesystemStorage(),
+                None: storage,
             }
         )
         cache = FileCache(cache_dir=cache_dir)
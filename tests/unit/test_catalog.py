@@ -1,10 +1,30 @@
 """Unit tests for Catalog service."""
 
+import os
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
 
 from datacachalog import Dataset
+from datacachalog.adapters.cache import FileCache
+from datacachalog.adapters.storage import FilesystemStorage
+from datacachalog.core.exceptions import ConfigurationError, DatasetNotFoundError
+from datacachalog.core.ports import CachePort
+from datacachalog.core.services import Catalog
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+CSV_ALICE = b"id,name\n1,Alice\n"
+CSV_ALICE_BOB = b"id,name\n1,Alice\n2,Bob\n"
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> FileCache:
+    """Isolated file cache under the test's tmp_path."""
+    return FileCache(cache_dir=tmp_path / "cache")
 
 
 @pytest.mark.core
@@ -13,17 +33,13 @@ from datacachalog import Dataset
 class TestCatalogInit:
     """Tests for Catalog instantiation."""
 
-    def test_catalog_accepts_datasets_storage_cache(self, tmp_path: Path) -> None:
+    def test_catalog_accepts_datasets_storage_cache(
+        self, storage: FilesystemStorage, in_memory_cache: CachePort
+    ) -> None:
         """Catalog should accept datasets, storage, and cache adapters."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=tmp_path / "cache")
-        dataset = Dataset(name="test", source=str(tmp_path / "file.txt"))
+        dataset = Dataset(name="test", source="/data/file.txt")
 
-        catalog = Catalog(datasets=[dataset], storage=storage, cache=cache)
+        catalog = Catalog(datasets=[dataset], storage=storage, cache=in_memory_cache)
 
         assert catalog is not None
 
@@ -34,50 +50,33 @@ class TestCatalogInit:
 class TestGetDataset:
     """Tests for dataset lookup."""
 
-    def test_get_dataset_returns_dataset_by_name(self, tmp_path: Path) -> None:
+    def test_get_dataset_returns_dataset_by_name(
+        self, storage: FilesystemStorage, in_memory_cache: CachePort
+    ) -> None:
         """get_dataset() should return the dataset with matching name."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=tmp_path / "cache")
         customers = Dataset(name="customers", source="/data/customers.csv")
 
-        catalog = Catalog(datasets=[customers], storage=storage, cache=cache)
+        catalog = Catalog(datasets=[customers], storage=storage, cache=in_memory_cache)
 
         assert catalog.get_dataset("customers") == customers
 
-    def test_get_dataset_raises_dataset_not_found_error(self, tmp_path: Path) -> None:
+    def test_get_dataset_raises_dataset_not_found_error(
+        self, storage: FilesystemStorage, in_memory_cache: CachePort
+    ) -> None:
         """get_dataset() should raise DatasetNotFoundError for unknown names."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.exceptions import DatasetNotFoundError
-        from datacachalog.core.services import Catalog
-
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=tmp_path / "cache")
-
-        catalog = Catalog(datasets=[], storage=storage, cache=cache)
+        catalog = Catalog(datasets=[], storage=storage, cache=in_memory_cache)
 
         with pytest.raises(DatasetNotFoundError, match="unknown"):
             catalog.get_dataset("unknown")
 
     def test_get_dataset_error_includes_available_datasets(
-        self, tmp_path: Path
+        self, storage: FilesystemStorage, in_memory_cache: CachePort
     ) -> None:
         """DatasetNotFoundError should list available dataset names."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.exceptions import DatasetNotFoundError
-        from datacachalog.core.services import Catalog
-
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=tmp_path / "cache")
         ds1 = Dataset(name="alpha", source="/a.csv")
         ds2 = Dataset(name="beta", source="/b.csv")
 
-        catalog = Catalog(datasets=[ds1, ds2], storage=storage, cache=cache)
+        catalog = Catalog(datasets=[ds1, ds2], storage=storage, cache=in_memory_cache)
 
         with pytest.raises(DatasetNotFoundError) as exc_info:
             catalog.get_dataset("missing")
@@ -93,22 +92,13 @@ class TestFetchMissingCacheDir:
     """Tests for fetch() when cache configuration is missing."""
 
     def test_fetch_raises_configuration_error_without_cache_path_or_dir(
-        self, tmp_path: Path
+        self, tmp_path: Path, storage: FilesystemStorage, cache: FileCache
     ) -> None:
         """fetch() should raise ConfigurationError if neither cache_path nor cache_dir."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.exceptions import ConfigurationError
-        from datacachalog.core.services import Catalog
-
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
         remote_file = storage_dir / "data.csv"
-        remote_file.write_text("data")
-
-        cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=cache_dir)
+        remote_file.write_bytes(b"data")
 
         # Dataset without explicit cache_path, catalog without cache_dir
         dataset = Dataset(name="customers", source=str(remote_file))
@@ -125,175 +115,67 @@ class TestFetchMissingCacheDir:
 class TestFetch:
     """Tests for fetch() method."""
 
-    def test_fetch_downloads_on_cache_miss(self, tmp_path: Path) -> None:
-        """fetch() should download file when cache is empty."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        # Setup: create a "remote" file
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        remote_file = storage_dir / "data.csv"
-        remote_file.write_text("id,name\n1,Alice\n")
-
-        cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=cache_dir)
-
-        dataset = Dataset(
-            name="customers",
-            source=str(remote_file),
-            cache_path=cache_dir / "customers.csv",
-        )
-        catalog = Catalog(datasets=[dataset], storage=storage, cache=cache)
-
-        # Act
-        result = catalog.fetch("customers")
-        assert isinstance(result, Path)  # Type narrowing
-        path = result
-
-        # Assert
-        assert path.exists()
-        assert path.read_text() == "id,name\n1,Alice\n"
-
-    def test_fetch_returns_cached_when_fresh(self, tmp_path: Path) -> None:
-        """fetch() should return cached path when not stale."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
+    def test_fetch_cache_miss_then_fresh_then_stale(
+        self, tmp_path: Path, storage: FilesystemStorage, cache: FileCache
+    ) -> None:
+        """fetch() should download on a miss, reuse a fresh cache, and re-download when stale.
 
-        # Setup: create "remote" file
+        The cached copy is overwritten with "MODIFIED" after the first fetch, so
+        the content of each later fetch shows whether it went back to storage.
+        """
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
         remote_file = storage_dir / "data.csv"
-        remote_file.write_text("id,name\n1,Alice\n")
-
-        cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=cache_dir)
+        remote_file.write_bytes(CSV_ALICE)
 
         dataset = Dataset(
             name="customers",
             source=str(remote_file),
-            cache_path=cache_dir / "customers.csv",
+            cache_path=cache.cache_dir / "customers.csv",
         )
         catalog = Catalog(datasets=[dataset], storage=storage, cache=cache)
 
-        # First fetch populates cache
-        result1 = catalog.fetch("customers")
-        assert isinstance(result1, Path)  # Type narrowing
-        path1 = result1
-
-        # Modify cached file to detect if re-downloaded
-        path1.write_text("MODIFIED")
-
-        # Second fetch (remote unchanged) should return cached
-        result2 = catalog.fetch("customers")
-        assert isinstance(result2, Path)  # Type narrowing
-        path2 = result2
-
-        assert path2 == path1
-        assert path2.read_text() == "MODIFIED"  # Proves no re-download
-
-    def test_fetch_redownloads_when_stale(self, tmp_path: Path) -> None:
-        """fetch() should re-download when remote has changed."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        # Setup: create "remote" file
+        # Miss: downloads from storage
+        first = catalog.fetch("customers")
+        assert isinstance(first, Path)  # Type narrowing
+        assert first.read_bytes() == CSV_ALICE
+        first.write_bytes(b"MODIFIED")
+
+        # Fresh: returns the cached copy untouched
+        second = catalog.fetch("customers")
+        assert isinstance(second, Path)  # Type narrowing
+        assert second.read_bytes() == b"MODIFIED"
+
+        # Stale: modifying the remote changes its ETag, forcing a re-download
+        remote_file.write_bytes(CSV_ALICE_BOB)
+        third = catalog.fetch("customers")
+        assert isinstance(third, Path)  # Type narrowing
+        assert third.read_bytes() == CSV_ALICE_BOB
+
+    @pytest.mark.parametrize("explicit", [False, True], ids=["derived", "explicit"])
+    def test_fetch_writes_to_resolved_cache_path(
+        self,
+        explicit: bool,
+        tmp_path: Path,
+        storage: FilesystemStorage,
+        cache: FileCache,
+    ) -> None:
+        """fetch() should use an explicit cache_path, else derive it from source."""
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
-        remote_file = storage_dir / "data.csv"
-        remote_file.write_text("id,name\n1,Alice\n")
-
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=cache_dir)
-
-        dataset = Dataset(
-            name="customers",
-            source=str(remote_file),
-            cache_path=cache_dir / "customers.csv",
-        )
-        catalog = Catalog(datasets=[dataset], storage=storage, cache=cache)
-
-        # First fetch populates cache
-        result1 = catalog.fetch("customers")
-        assert isinstance(result1, Path)  # Type narrowing
-        path1 = result1
-        original_content = path1.read_text()
-
-        # Modify remote file (changes ETag)
-        remote_file.write_text("id,name\n1,Alice\n2,Bob\n")
-
-        # Second fetch should detect stale and re-download
-        result2 = catalog.fetch("customers")
-        assert isinstance(result2, Path)  # Type narrowing
-        path2 = result2
-
-        assert path2.read_text() == "id,name\n1,Alice\n2,Bob\n"
-        assert path2.read_text() != original_content
-
-    def test_fetch_derives_cache_path_from_source(self, tmp_path: Path) -> None:
-        """fetch() should derive cache path from source when not explicit."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        # Setup: create "remote" file
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
         remote_file = storage_dir / "data.parquet"
-        remote_file.write_text("parquet data")
-
-        cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=cache_dir)
-
-        # Dataset without explicit cache_path
-        dataset = Dataset(
-            name="data",
-            source=str(remote_file),
-        )
-        catalog = Catalog(
-            datasets=[dataset],
-            storage=storage,
-            cache=cache,
-            cache_dir=cache_dir,
-        )
-
-        result = catalog.fetch("data")
-        assert isinstance(result, Path)  # Type narrowing
-        path = result
-
-        # Should derive path from source filename
-        assert path.exists()
-        assert path.read_text() == "parquet data"
-
-    def test_fetch_uses_explicit_cache_path(self, tmp_path: Path) -> None:
-        """fetch() should use explicit cache_path when provided."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        # Setup
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        remote_file = storage_dir / "source.csv"
-        remote_file.write_text("data")
-
-        cache_dir = tmp_path / "cache"
-        custom_path = cache_dir / "custom" / "location.csv"
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=cache_dir)
-
-        dataset = Dataset(
-            name="test",
-            source=str(remote_file),
-            cache_path=custom_path,
-        )
+        remote_file.write_bytes(b"parquet data")
+
+        if explicit:
+            expected_path = cache_dir / "custom" / "location.parquet"
+            dataset = Dataset(
+                name="data", source=str(remote_file), cache_path=expected_path
+            )
+        else:
+            # Derived from the source filename under cache_dir
+            expected_path = cache_dir / "data.parquet"
+            dataset = Dataset(name="data", source=str(remote_file))
         catalog = Catalog(
             datasets=[dataset],
             storage=storage,
@@ -301,11 +183,9 @@ class TestFetch:
             cache_dir=cache_dir,
         )
 
-        catalog.fetch("test")
+        catalog.fetch("data")
 
-        # The download should go to the explicit cache_path location
-        assert custom_path.exists()
-        assert custom_path.read_text() == "data"
+        assert expected_path.read_bytes() == b"parquet data"
 
 
 @pytest.mark.core
@@ -314,17 +194,13 @@ class TestFetch:
 class TestDatasetsProperty:
     """Tests for the catalog.datasets property."""
 
-    def test_datasets_returns_all_registered_datasets(self, tmp_path: Path) -> None:
+    def test_datasets_returns_all_registered_datasets(
+        self, tmp_path: Path, storage: FilesystemStorage, cache: FileCache
+    ) -> None:
         """datasets property should return all registered datasets."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
         # Arrange
         ds1 = Dataset(name="alpha", source=str(tmp_path / "a.csv"))
         ds2 = Dataset(name="beta", source=str(tmp_path / "b.csv"))
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=tmp_path / "cache")
         catalog = Catalog(datasets=[ds1, ds2], storage=storage, cache=cache)
 
         # Act
@@ -334,15 +210,11 @@ class TestDatasetsProperty:
         assert len(result) == 2
         assert {d.name for d in result} == {"alpha", "beta"}
 
-    def test_datasets_returns_empty_list_when_no_datasets(self, tmp_path: Path) -> None:
+    def test_datasets_returns_empty_list_when_no_datasets(
+        self, storage: FilesystemStorage, cache: FileCache
+    ) -> None:
         """datasets property should return empty list when catalog has no datasets."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
         # Arrange
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=tmp_path / "cache")
         catalog = Catalog(datasets=[], storage=storage, cache=cache)
 
         # Act
@@ -360,12 +232,10 @@ class TestCatalogFromDirectory:
 
     def test_from_directory_discovers_project_root(self, tmp_path: Path) -> None:
         """from_directory() should discover project root from marker files."""
-        from datacachalog.core.services import Catalog
-
         # Create project structure with .git marker
         (tmp_path / ".git").mkdir()
         source_file = tmp_path / "source.txt"
-        source_file.write_text("content")
+        source_file.write_bytes(b"content")
 
         dataset = Dataset(name="test", source=str(source_file))
         catalog = Catalog.from_directory([dataset], directory=tmp_path)
@@ -375,11 +245,9 @@ class TestCatalogFromDirectory:
 
     def test_from_directory_resolves_relative_cache_paths(self, tmp_path: Path) -> None:
         """from_directory() should resolve relative cache_path against root."""
-        from datacachalog.core.services import Catalog
-
         (tmp_path / ".git").mkdir()
         source_file = tmp_path / "source.txt"
-        source_file.write_text("content")
+        source_file.write_bytes(b"content")
 
         dataset = Dataset(
             name="test",
@@ -393,11 +261,9 @@ class TestCatalogFromDirectory:
 
     def test_from_directory_accepts_custom_cache_dir(self, tmp_path: Path) -> None:
         """from_directory() should accept custom cache directory."""
-        from datacachalog.core.services import Catalog
-
         (tmp_path / ".git").mkdir()
         source_file = tmp_path / "source.txt"
-        source_file.write_text("content")
+        source_file.write_bytes(b"content")
 
         dataset = Dataset(name="test", source=str(source_file))
         catalog = Catalog.from_directory(
@@ -410,11 +276,9 @@ class TestCatalogFromDirectory:
 
     def test_from_directory_accepts_absolute_cache_dir(self, tmp_path: Path) -> None:
         """from_directory() should accept absolute cache directory path."""
-        from datacachalog.core.services import Catalog
-
         (tmp_path / ".git").mkdir()
         source_file = tmp_path / "source.txt"
-        source_file.write_text("content")
+        source_file.write_bytes(b"content")
         absolute_cache = tmp_path / "absolute_cache"
 
         dataset = Dataset(name="test", source=str(source_file))
@@ -428,12 +292,10 @@ class TestCatalogFromDirectory:
 
     def test_from_directory_creates_working_catalog(self, tmp_path: Path) -> None:
         """from_directory() should create a fully functional catalog."""
-        from datacachalog.core.services import Catalog
-
         # Create project structure
         (tmp_path / ".git").mkdir()
         source_file = tmp_path / "source.txt"
-        source_file.write_text("test content")
+        source_file.write_bytes(b"test content")
 
         dataset = Dataset(
             name="test",
@@ -447,18 +309,14 @@ class TestCatalogFromDirectory:
         assert isinstance(result, Path)  # Type narrowing
         path = result
         assert path.exists()
-        assert path.read_text() == "test content"
+        assert path.read_bytes() == b"test content"
 
     def test_from_directory_uses_cwd_when_no_directory(self, tmp_path: Path) -> None:
         """from_directory() should use current directory when not specified."""
-        import os
-
-        from datacachalog.core.services import Catalog
-
         # Create project structure in tmp_path
         (tmp_path / ".git").mkdir()
         source_file = tmp_path / "source.txt"
-        source_file.write_text("content")
+        source_file.write_bytes(b"content")
 
         original_cwd = Path.cwd()
         try:
@@ -478,63 +336,26 @@ class TestConcurrencyBoundary:
     """Tests to verify concurrency boundary compliance in core domain."""
 
     def test_core_services_no_concurrency_imports(self) -> None:
-        """core/services.py should not import ThreadPoolExecutorAdapter or other concurrency primitives."""
-        import ast
-        from pathlib import Path
-
-        # Read the source file
-        core_services_path = (
-            Path(__file__).parent.parent.parent
-            / "src"
-            / "datacachalog"
-            / "core"
-            / "services.py"
-        )
-        source_code = core_services_path.read_text()
-
-        # Parse AST to check imports
-        tree = ast.parse(source_code, filename=str(core_services_path))
-
-        # Check for forbidden imports
-        forbidden_imports = [
-            "ThreadPoolExecutorAdapter",
-            "ThreadPoolExecutor",
-            "ProcessPoolExecutor",
-            "threading.Lock",
-            "asyncio.Lock",
-        ]
-
-        violations: list[str] = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    if any(forbidden in alias.name for forbidden in forbidden_imports):
-                        violations.append(f"Import: {alias.name}")
-            elif isinstance(node, ast.ImportFrom):
-                if node.module and any(
-                    forbidden in node.module for forbidden in forbidden_imports
-                ):
-                    violations.append(f"ImportFrom: {node.module}")
-                for alias in node.names:
-                    if any(forbidden in alias.name for forbidden in forbidden_imports):
-                        violations.append(f"ImportFrom: {node.module}.{alias.name}")
-
-        # Also check source code directly for string patterns (AST might miss some)
-        if "ThreadPoolExecutorAdapter" in source_code:
-            # Check if it's in a comment or string literal vs actual import
-            lines = source_code.split("\n")
-            for i, line in enumerate(lines, 1):
-                stripped = line.strip()
-                # Skip comments and docstrings, check if it's an import statement
-                if (
-                    "ThreadPoolExecutorAdapter" in stripped
-                    and not stripped.startswith("#")
-                    and not stripped.startswith('"""')
-                    and "import" in stripped
-                ):
-                    violations.append(f"Line {i}: {stripped}")
-
-        assert len(violations) == 0, (
-            f"Concurrency boundary violations found in core/services.py: {violations}"
+        """core/ should not import ThreadPoolExecutorAdapter or other concurrency primitives.
+
+        The banned imports live in pyproject.toml (ruff TID251); this only
+        asserts that the lint rule passes for the core package. ruff is a
+        dev dependency, so a missing install fails here rather than skipping.
+        """
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "ruff",
+                "check",
+                "--select",
+                "TID251",
+                "src/datacachalog/core",
+            ],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=False,
         )
+
+        assert result.returncode == 0, result.stdout + result.stderr
@@ -1,103 +1,133 @@
 """Unit tests for Catalog cache operations."""
 
+from collections.abc import Callable
 from pathlib import Path
+from typing import NamedTuple
 
 import pytest
 
 from datacachalog import Dataset
+from datacachalog.adapters.cache import FileCache
+from datacachalog.adapters.storage import FilesystemStorage
+from datacachalog.core.models import CacheMetadata
+from datacachalog.core.services import Catalog
 
 
-@pytest.mark.core
-@pytest.mark.tra("UseCase.IsStale")
-@pytest.mark.tier(1)
-class TestIsStale:
-    """Tests for is_stale() method."""
+CSV_ALICE = b"id,name\n1,Alice\n"
+CSV_ALICE_BOB = b"id,name\n1,Alice\n2,Bob\n"
 
-    def test_is_stale_returns_true_when_not_cached(self, tmp_path: Path) -> None:
-        """is_stale() should return True when dataset not in cache."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
+# Sidecar for hand-written cache entries that no dataset owns
+ORPHAN_META = b'{"etag": "orphaned", "cached_at": "2024-01-01T00:00:00", "source": ""}'
 
-        # Setup: create "remote" file but don't fetch
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        remote_file = storage_dir / "data.csv"
-        remote_file.write_text("id,name\n1,Alice\n")
 
-        cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=cache_dir)
+@pytest.fixture(scope="module")
+def remote_alice_csv(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Read-only remote CSV shared by tests that never modify the source."""
+    remote_file = tmp_path_factory.mktemp("storage") / "data.csv"
+    remote_file.write_bytes(CSV_ALICE)
+    return remote_file
 
-        dataset = Dataset(
-            name="customers",
-            source=str(remote_file),
-            cache_path=cache_dir / "customers.csv",
-        )
-        catalog = Catalog(datasets=[dataset], storage=storage, cache=cache)
 
-        assert catalog.is_stale("customers") is True
+def add_orphan(cache_dir: Path, key: str) -> None:
+    """Write a cache entry and its sidecar under a key no dataset owns."""
+    (cache_dir / key).write_bytes(b"orphaned")
+    (cache_dir / f"{key}.meta.json").write_bytes(ORPHAN_META)
 
-    def test_is_stale_returns_false_when_fresh(self, tmp_path: Path) -> None:
-        """is_stale() should return False when cache matches remote."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
 
-        # Setup
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        remote_file = storage_dir / "data.csv"
-        remote_file.write_text("id,name\n1,Alice\n")
+class CatalogEnv(NamedTuple):
+    """A filesystem-backed catalog, with its FileCache and cache directory."""
 
-        cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=cache_dir)
+    catalog: Catalog
+    cache: FileCache
+    cache_dir: Path
 
-        dataset = Dataset(
-            name="customers",
-            source=str(remote_file),
-            cache_path=cache_dir / "customers.csv",
-        )
-        catalog = Catalog(datasets=[dataset], storage=storage, cache=cache)
 
-        # Fetch to populate cache
-        catalog.fetch("customers")
+def make_catalog(
+    storage: FilesystemStorage, cache_dir: Path, *datasets: Dataset
+) -> CatalogEnv:
+    """Build a catalog over datasets with a fresh FileCache in cache_dir."""
+    cache = FileCache(cache_dir=cache_dir)
+    catalog = Catalog(
+        datasets=list(datasets),
+        storage=storage,
+        cache=cache,
+        cache_dir=cache_dir,
+    )
+    return CatalogEnv(catalog=catalog, cache=cache, cache_dir=cache_dir)
 
-        # Assert: remote unchanged = fresh
-        assert catalog.is_stale("customers") is False
 
-    def test_is_stale_returns_true_when_remote_changed(self, tmp_path: Path) -> None:
-        """is_stale() should return True when remote has changed."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
+def seed_cache(cache: FileCache, name: str, source: Path) -> None:
+    """Cache source under a dataset's key directly, without going through fetch()."""
+    cache.put(name, source, CacheMetadata(source=str(source)))
 
-        # Setup
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        remote_file = storage_dir / "data.csv"
-        remote_file.write_text("id,name\n1,Alice\n")
 
-        cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=cache_dir)
+@pytest.fixture
+def customers_catalog(
+    tmp_path: Path,
+    remote_alice_csv: Path,
+    storage: FilesystemStorage,
+    customers_dataset: Callable[[Path, Path], Dataset],
+) -> CatalogEnv:
+    """Catalog reading remote_alice_csv through a fresh per-test cache."""
+    cache_dir = tmp_path / "cache"
+    return make_catalog(
+        storage, cache_dir, customers_dataset(remote_alice_csv, cache_dir)
+    )
 
-        dataset = Dataset(
-            name="customers",
-            source=str(remote_file),
-            cache_path=cache_dir / "customers.csv",
-        )
-        catalog = Catalog(datasets=[dataset], storage=storage, cache=cache)
 
-        # Fetch to populate cache
-        catalog.fetch("customers")
+@pytest.mark.core
+@pytest.mark.tra("UseCase.IsStale")
+@pytest.mark.tier(1)
+class TestIsStale:
+    """Tests for is_stale() method."""
 
-        # Modify remote (changes ETag)
-        remote_file.write_text("id,name\n1,Alice\n2,Bob\n")
+    @pytest.fixture
+    def remote_file(self, tmp_path: Path, remote_alice_csv: Path) -> Path:
+        """A private name for the shared remote, since one case rewrites it."""
+        remote_file = tmp_path / "data.csv"
+        remote_file.hardlink_to(remote_alice_csv)
+        return remote_file
+
+    @pytest.fixture
+    def catalog(
+        self,
+        remote_file: Path,
+        storage: FilesystemStorage,
+        customers_dataset: Callable[[Path, Path], Dataset],
+    ) -> Catalog:
+        """Catalog reading remote_file through a fresh cache beside it."""
+        cache_dir = remote_file.parent / "cache"
+        return make_catalog(
+            storage, cache_dir, customers_dataset(remote_file, cache_dir)
+        ).catalog
+
+    @pytest.mark.parametrize(
+        ("prefetch", "remote_update", "expected"),
+        [
+            pytest.param(False, None, True, id="not-cached"),
+            pytest.param(True, None, False, id="fresh"),
+            pytest.param(True, CSV_ALICE_BOB, True, id="remote-changed"),
+        ],
+    )
+    def test_is_stale_reflects_cache_state(
+        self,
+        remote_file: Path,
+        catalog: Catalog,
+        prefetch: bool,
+        remote_update: bytes | None,
+        expected: bool,
+    ) -> None:
+        """is_stale() should be True when not cached or remote changed, else False."""
+        if prefetch:
+            # Fetch to populate cache
+            catalog.fetch("customers")
+        if remote_update is not None:
+            # Modify remote (changes ETag); unlink first so the write
+            # lands in a new inode instead of the shared remote_alice_csv
+            remote_file.unlink()
+            remote_file.write_bytes(remote_update)
 
-        # Assert: remote changed = stale
-        assert catalog.is_stale("customers") is True
+        assert catalog.is_stale("customers") is expected
 
 
 @pytest.mark.core
@@ -106,32 +136,15 @@ class TestIsStale:
 class TestInvalidate:
     """Tests for invalidate() method."""
 
-    def test_invalidate_removes_from_cache(self, tmp_path: Path) -> None:
+    def test_invalidate_removes_from_cache(
+        self, customers_catalog: CatalogEnv, remote_alice_csv: Path
+    ) -> None:
         """invalidate() should remove dataset from cache."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        # Setup
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        remote_file = storage_dir / "data.csv"
-        remote_file.write_text("id,name\n1,Alice\n")
+        catalog = customers_catalog.catalog
+        cache = customers_catalog.cache
 
-        cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=cache_dir)
-
-        dataset = Dataset(
-            name="customers",
-            source=str(remote_file),
-            cache_path=cache_dir / "customers.csv",
-        )
-        catalog = Catalog(datasets=[dataset], storage=storage, cache=cache)
-
-        # Fetch to populate cache
-        catalog.fetch("customers")
-        assert catalog.is_stale("customers") is False
+        seed_cache(cache, "customers", remote_alice_csv)
+        assert cache.get("customers") is not None
 
         # Invalidate
         catalog.invalidate("customers")
@@ -139,34 +152,17 @@ class TestInvalidate:
         # Assert: now stale (not in cache)
         assert catalog.is_stale("customers") is True
 
-    def test_invalidate_causes_redownload_on_next_fetch(self, tmp_path: Path) -> None:
+    def test_invalidate_causes_redownload_on_next_fetch(
+        self, customers_catalog: CatalogEnv
+    ) -> None:
         """invalidate() should cause next fetch to re-download."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        # Setup
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        remote_file = storage_dir / "data.csv"
-        remote_file.write_text("id,name\n1,Alice\n")
-
-        cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=cache_dir)
-
-        dataset = Dataset(
-            name="customers",
-            source=str(remote_file),
-            cache_path=cache_dir / "customers.csv",
-        )
-        catalog = Catalog(datasets=[dataset], storage=storage, cache=cache)
+        catalog = customers_catalog.catalog
 
         # Fetch and modify cached file
         result = catalog.fetch("customers")
         assert isinstance(result, Path)  # Type narrowing
         path = result
-        path.write_text("MODIFIED")
+        path.write_bytes(b"MODIFIED")
 
         # Invalidate
         catalog.invalidate("customers")
@@ -176,7 +172,7 @@ class TestInvalidate:
         assert isinstance(result2, Path)  # Type narrowing
         path2 = result2
 
-        assert path2.read_text() == "id,name\n1,Alice\n"
+        assert path2.read_bytes() == CSV_ALICE
 
 
 @pytest.mark.core
@@ -185,33 +181,23 @@ class TestInvalidate:
 class TestInvalidateGlob:
     """Tests for invalidate_glob() method."""
 
-    def test_invalidate_glob_clears_all_cached_files(self, tmp_path: Path) -> None:
+    def test_invalidate_glob_clears_all_cached_files(
+        self, tmp_path: Path, storage: FilesystemStorage
+    ) -> None:
         """invalidate_glob() should remove all cached files for a glob dataset."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
         # Setup: create multiple files
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
-        (storage_dir / "2024-01.parquet").write_text("jan")
-        (storage_dir / "2024-02.parquet").write_text("feb")
-        (storage_dir / "2024-03.parquet").write_text("mar")
+        (storage_dir / "2024-01.parquet").write_bytes(b"jan")
+        (storage_dir / "2024-02.parquet").write_bytes(b"feb")
+        (storage_dir / "2024-03.parquet").write_bytes(b"mar")
 
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=cache_dir)
-
         dataset = Dataset(
             name="monthly_data",
             source=str(storage_dir / "*.parquet"),
         )
-        catalog = Catalog(
-            datasets=[dataset],
-            storage=storage,
-            cache=cache,
-            cache_dir=cache_dir,
-        )
+        catalog, cache, _ = make_catalog(storage, cache_dir, dataset)
 
         # Fetch to populate cache
         catalog.fetch("monthly_data")
@@ -219,34 +205,24 @@ class TestInvalidateGlob:
         # Invalidate
         catalog.invalidate_glob("monthly_data")
 
-        # Assert: all cache entries cleared (cache.get returns None)
-        assert cache.get("monthly_data/2024-01.parquet") is None
-        assert cache.get("monthly_data/2024-02.parquet") is None
-        assert cache.get("monthly_data/2024-03.parquet") is None
+        # Assert: no cache entries left under the dataset's key prefix
+        remaining = {
+            key for key in cache.list_all_keys() if key.startswith("monthly_data/")
+        }
+        assert remaining == set()
 
-    def test_invalidate_glob_returns_count(self, tmp_path: Path) -> None:
+    def test_invalidate_glob_returns_count(
+        self, tmp_path: Path, storage: FilesystemStorage
+    ) -> None:
         """invalidate_glob() should return count of deleted entries."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
         # Setup
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
-        (storage_dir / "a.txt").write_text("a")
-        (storage_dir / "b.txt").write_text("b")
-
-        cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=cache_dir)
+        (storage_dir / "a.txt").write_bytes(b"a")
+        (storage_dir / "b.txt").write_bytes(b"b")
 
         dataset = Dataset(name="files", source=str(storage_dir / "*.txt"))
-        catalog = Catalog(
-            datasets=[dataset],
-            storage=storage,
-            cache=cache,
-            cache_dir=cache_dir,
-        )
+        catalog = make_catalog(storage, tmp_path / "cache", dataset).catalog
 
         catalog.fetch("files")
 
@@ -256,72 +232,48 @@ class TestInvalidateGlob:
         # Assert
         assert count == 2
 
-    def test_invalidate_glob_forces_redownload(self, tmp_path: Path) -> None:
+    def test_invalidate_glob_forces_redownload(
+        self, tmp_path: Path, storage: FilesystemStorage
+    ) -> None:
         """invalidate_glob() should force re-download on next fetch."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
         # Setup
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
-        (storage_dir / "data.txt").write_text("original")
-
-        cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=cache_dir)
+        (storage_dir / "data.txt").write_bytes(b"original")
 
         dataset = Dataset(name="data", source=str(storage_dir / "*.txt"))
-        catalog = Catalog(
-            datasets=[dataset],
-            storage=storage,
-            cache=cache,
-            cache_dir=cache_dir,
-        )
+        catalog = make_catalog(storage, tmp_path / "cache", dataset).catalog
 
         # Fetch and modify cached file
         result = catalog.fetch("data")
         assert isinstance(result, list)  # Type narrowing for glob
         paths = result
-        paths[0].write_text("MODIFIED")
+        paths[0].write_bytes(b"MODIFIED")
 
         # Invalidate
         catalog.invalidate_glob("data")
 
         # Update source file
-        (storage_dir / "data.txt").write_text("updated")
+        (storage_dir / "data.txt").write_bytes(b"updated")
 
         # Fetch again - should get updated content
         result2 = catalog.fetch("data")
         assert isinstance(result2, list)  # Type narrowing for glob
         paths2 = result2
-        assert paths2[0].read_text() == "updated"
+        assert paths2[0].read_bytes() == b"updated"
 
-    def test_invalidate_glob_on_non_glob_dataset_raises(self, tmp_path: Path) -> None:
+    def test_invalidate_glob_on_non_glob_dataset_raises(
+        self, tmp_path: Path, storage: FilesystemStorage
+    ) -> None:
         """invalidate_glob() should raise ValueError for non-glob datasets."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        (storage_dir / "data.txt").write_text("content")
-
-        cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=cache_dir)
+        (tmp_path / "data.txt").write_bytes(b"content")
 
         # Non-glob dataset (no wildcards)
         dataset = Dataset(
             name="single_file",
-            source=str(storage_dir / "data.txt"),
-        )
-        catalog = Catalog(
-            datasets=[dataset],
-            storage=storage,
-            cache=cache,
-            cache_dir=cache_dir,
+            source=str(tmp_path / "data.txt"),
         )
+        catalog = make_catalog(storage, tmp_path / "cache", dataset).catalog
 
         with pytest.raises(ValueError, match="not a glob pattern"):
             catalog.invalidate_glob("single_file")
@@ -333,125 +285,67 @@ class TestInvalidateGlob:
 class TestCleanOrphaned:
     """Tests for clean_orphaned() method."""
 
-    def test_clean_orphaned_returns_zero_when_cache_empty(self, tmp_path: Path) -> None:
+    def test_clean_orphaned_returns_zero_when_cache_empty(
+        self, tmp_path: Path, storage: FilesystemStorage
+    ) -> None:
         """clean_orphaned() should return 0 when cache is empty."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=cache_dir)
-
         dataset = Dataset(name="customers", source=str(tmp_path / "data.csv"))
-        catalog = Catalog(datasets=[dataset], storage=storage, cache=cache)
+        catalog = make_catalog(storage, tmp_path / "cache", dataset).catalog
 
         count = catalog.clean_orphaned()
         assert count == 0
 
     def test_clean_orphaned_returns_zero_when_no_orphaned_keys(
-        self, tmp_path: Path
+        self, customers_catalog: CatalogEnv, remote_alice_csv: Path
     ) -> None:
         """clean_orphaned() should return 0 when all cache keys are valid."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        remote_file = storage_dir / "data.csv"
-        remote_file.write_text("id,name\n1,Alice\n")
+        catalog = customers_catalog.catalog
 
-        cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=cache_dir)
-
-        dataset = Dataset(
-            name="customers",
-            source=str(remote_file),
-            cache_path=cache_dir / "customers.csv",
-        )
-        catalog = Catalog(datasets=[dataset], storage=storage, cache=cache)
-
-        # Fetch to populate cache with valid key
-        catalog.fetch("customers")
+        # Populate cache with valid key
+        seed_cache(customers_catalog.cache, "customers", remote_alice_csv)
 
         count = catalog.clean_orphaned()
         assert count == 0
 
-    def test_clean_orphaned_removes_orphaned_keys(self, tmp_path: Path) -> None:
+    def test_clean_orphaned_removes_orphaned_keys(
+        self, customers_catalog: CatalogEnv, remote_alice_csv: Path
+    ) -> None:
         """clean_orphaned() should remove orphaned keys and return count."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
+        catalog = customers_catalog.catalog
+        cache = customers_catalog.cache
+        cache_dir = customers_catalog.cache_dir
 
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        remote_file = storage_dir / "data.csv"
-        remote_file.write_text("id,name\n1,Alice\n")
-
-        cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=cache_dir)
-
-        dataset = Dataset(
-            name="customers",
-            source=str(remote_file),
-            cache_path=cache_dir / "customers.csv",
-        )
-        catalog = Catalog(datasets=[dataset], storage=storage, cache=cache)
-
-        # Fetch to populate cache with valid key
-        catalog.fetch("customers")
+        # Populate cache with valid key
+        seed_cache(cache, "customers", remote_alice_csv)
 
         # Manually add orphaned cache entry
-        orphaned_file = cache_dir / "orphaned.csv"
-        orphaned_file.write_text("orphaned data")
-        orphaned_meta = cache_dir / "orphaned.csv.meta.json"
-        orphaned_meta.write_text(
-            '{"etag": "orphaned", "cached_at": "2024-01-01T00:00:00", "source": ""}'
-        )
+        add_orphan(cache_dir, "orphaned.csv")
 
         count = catalog.clean_orphaned()
         assert count == 1
         assert cache.get("orphaned") is None
 
-    def test_clean_orphaned_preserves_glob_dataset_keys(self, tmp_path: Path) -> None:
+    def test_clean_orphaned_preserves_glob_dataset_keys(
+        self, tmp_path: Path, storage: FilesystemStorage
+    ) -> None:
         """clean_orphaned() should preserve hierarchical keys for glob datasets."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
-        (storage_dir / "2024-01.parquet").write_text("jan")
-        (storage_dir / "2024-02.parquet").write_text("feb")
+        (storage_dir / "2024-01.parquet").write_bytes(b"jan")
+        (storage_dir / "2024-02.parquet").write_bytes(b"feb")
 
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=cache_dir)
-
         dataset = Dataset(
             name="monthly_data",
             source=str(storage_dir / "*.parquet"),
         )
-        catalog = Catalog(
-            datasets=[dataset],
-            storage=storage,
-            cache=cache,
-            cache_dir=cache_dir,
-        )
+        catalog, cache, _ = make_catalog(storage, cache_dir, dataset)
 
         # Fetch to populate cache with glob keys
         catalog.fetch("monthly_data")
 
         # Add orphaned key
-        orphaned_file = cache_dir / "orphaned.txt"
-        orphaned_file.write_text("orphaned")
-        orphaned_meta = cache_dir / "orphaned.txt.meta.json"
-        orphaned_meta.write_text(
-            '{"etag": "orphaned", "cached_at": "2024-01-01T00:00:00", "source": ""}'
-        )
+        add_orphan(cache_dir, "orphaned.txt")
 
         count = catalog.clean_orphaned()
         assert count == 1
@@ -459,45 +353,26 @@ class TestCleanOrphaned:
         assert cache.get("monthly_data/2024-01.parquet") is not None
         assert cache.get("monthly_data/2024-02.parquet") is not None
 
-    def test_clean_orphaned_preserves_versioned_keys(self, tmp_path: Path) -> None:
+    def test_clean_orphaned_preserves_versioned_keys(
+        self, customers_catalog: CatalogEnv
+    ) -> None:
         """clean_orphaned() should preserve date-based versioned keys."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        remote_file = storage_dir / "data.csv"
-        remote_file.write_text("id,name\n1,Alice\n")
-
-        cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=cache_dir)
-
-        dataset = Dataset(
-            name="customers",
-            source=str(remote_file),
-            cache_path=cache_dir / "customers.csv",
-        )
-        catalog = Catalog(datasets=[dataset], storage=storage, cache=cache)
+        catalog = customers_catalog.catalog
+        cache = customers_catalog.cache
+        cache_dir = customers_catalog.cache_dir
 
         # Manually create a versioned cache key (date-based format)
         cache_dir.mkdir(parents=True, exist_ok=True)
         versioned_key = "2024-01-15T120000.csv"
         versioned_file = cache_dir / versioned_key
-        versioned_file.write_text("versioned data")
+        versioned_file.write_bytes(b"versioned data")
         versioned_meta = cache_dir / f"{versioned_key}.meta.json"
         versioned_meta.write_text(
             '{"etag": "v1", "cached_at": "2024-01-15T12:00:00", "source": "s3://bucket/data.csv"}'
         )
 
         # Add orphaned key
-        orphaned_file = cache_dir / "orphaned.txt"
-        orphaned_file.write_text("orphaned")
-        orphaned_meta = cache_dir / "orphaned.txt.meta.json"
-        orphaned_meta.write_text(
-            '{"etag": "orphaned", "cached_at": "2024-01-01T00:00:00", "source": ""}'
-        )
+        add_orphan(cache_dir, "orphaned.txt")
 
         count = catalog.clean_orphaned()
         assert count == 1
@@ -505,48 +380,29 @@ class TestCleanOrphaned:
         assert cache.get(versioned_key) is not None
 
     def test_clean_orphaned_handles_mixed_valid_and_orphaned(
-        self, tmp_path: Path
+        self, tmp_path: Path, remote_alice_csv: Path, storage: FilesystemStorage
     ) -> None:
         """clean_orphaned() should correctly identify and remove only orphaned keys."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        remote_file1 = storage_dir / "data1.csv"
-        remote_file1.write_text("data1")
-        remote_file2 = storage_dir / "data2.csv"
-        remote_file2.write_text("data2")
-
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
-        cache = FileCache(cache_dir=cache_dir)
-
         dataset1 = Dataset(
             name="customers",
-            source=str(remote_file1),
+            source=str(tmp_path / "data1.csv"),
             cache_path=cache_dir / "customers.csv",
         )
         dataset2 = Dataset(
             name="products",
-            source=str(remote_file2),
+            source=str(tmp_path / "data2.csv"),
             cache_path=cache_dir / "products.csv",
         )
-        catalog = Catalog(datasets=[dataset1, dataset2], storage=storage, cache=cache)
+        catalog, cache, _ = make_catalog(storage, cache_dir, dataset1, dataset2)
 
-        # Fetch to populate cache with valid keys
-        catalog.fetch("customers")
-        catalog.fetch("products")
+        # Populate cache with valid keys; clean_orphaned() never reads sources
+        seed_cache(cache, "customers", remote_alice_csv)
+        seed_cache(cache, "products", remote_alice_csv)
 
         # Add multiple orphaned keys
         for i in range(3):
-            orphaned_file = cache_dir / f"orphaned{i}.txt"
-            orphaned_file.write_text(f"orphaned{i}")
-            orphaned_meta = cache_dir / f"orphaned{i}.txt.meta.json"
-            orphaned_meta.write_text(
-                f'{{"etag": "orphaned{i}", "cached_at": "2024-01-01T00:00:00", "source": ""}}'
-            )
+            add_orphan(cache_dir, f"orphaned{i}.txt")
 
         count = catalog.clean_orphaned()
         assert count == 3
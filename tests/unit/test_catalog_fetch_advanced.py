@@ -1,10 +1,27 @@
 """Unit tests for Catalog advanced fetch operations (progress, fetch_all, parallel)."""
 
+import hashlib
+from collections.abc import Callable
+from concurrent.futures import Future
 from pathlib import Path
+from typing import Any
 
 import pytest
 
 from datacachalog import Dataset
+from datacachalog.adapters.cache import FileCache
+from datacachalog.adapters.executor import ThreadPoolExecutorAdapter
+from datacachalog.adapters.storage import FilesystemStorage
+from datacachalog.core.ports import NullProgressReporter
+from datacachalog.core.services import Catalog
+
+
+# Fixed-size payloads whose lengths are asserted against progress totals
+PAYLOAD_64 = b"x" * 64
+PAYLOAD_A100 = b"a" * 100
+PAYLOAD_B200 = b"b" * 200
+# Digest for content checks that stay constant-memory as payloads grow
+PAYLOAD_64_SHA256 = hashlib.sha256(PAYLOAD_64).digest()
 
 
 @pytest.mark.core
@@ -13,27 +30,20 @@ from datacachalog import Dataset
 class TestFetchWithProgress:
     """Tests for fetch() with progress reporting."""
 
-    def test_fetch_accepts_progress_parameter(self, tmp_path: Path) -> None:
+    def test_fetch_accepts_progress_parameter(
+        self,
+        tmp_path: Path,
+        seed_storage: Path,
+        storage: FilesystemStorage,
+        customers_dataset: Callable[[Path, Path], Dataset],
+    ) -> None:
         """fetch() should accept an optional progress parameter."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.ports import NullProgressReporter
-        from datacachalog.core.services import Catalog
-
-        # Setup
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        remote_file = storage_dir / "data.csv"
-        remote_file.write_text("id,name\n1,Alice\n")
+        # Setup: read-only remote from the shared seed
+        remote_file = seed_storage / "customers.csv"
 
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
-        dataset = Dataset(
-            name="customers",
-            source=str(remote_file),
-            cache_path=cache_dir / "customers.csv",
-        )
+        dataset = customers_dataset(remote_file, cache_dir)
         catalog = Catalog(datasets=[dataset], storage=storage, cache=cache)
 
         # Act - should not raise
@@ -45,97 +55,64 @@ class TestFetchWithProgress:
         # Assert
         assert path.exists()
 
-    def test_fetch_calls_progress_reporter_on_download(self, tmp_path: Path) -> None:
+    def test_fetch_calls_progress_reporter_on_download(
+        self,
+        tmp_path: Path,
+        storage: FilesystemStorage,
+        customers_dataset: Callable[[Path, Path], Dataset],
+        tracking_reporter: Any,
+    ) -> None:
         """fetch() should call progress reporter during download."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.ports import ProgressCallback
-        from datacachalog.core.services import Catalog
-
         # Setup
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
         remote_file = storage_dir / "data.csv"
-        remote_file.write_text("x" * 1000)
+        remote_file.write_bytes(PAYLOAD_64)
 
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
-        dataset = Dataset(
-            name="customers",
-            source=str(remote_file),
-            cache_path=cache_dir / "customers.csv",
-        )
+        dataset = customers_dataset(remote_file, cache_dir)
         catalog = Catalog(datasets=[dataset], storage=storage, cache=cache)
 
-        # Track calls
-        started_tasks: list[tuple[str, int]] = []
-        finished_tasks: list[str] = []
-        progress_calls: list[tuple[int, int]] = []
-
-        class TrackingReporter:
-            def start_task(self, name: str, total: int) -> ProgressCallback:
-                started_tasks.append((name, total))
-
-                def callback(downloaded: int, total: int) -> None:
-                    progress_calls.append((downloaded, total))
-
-                return callback
-
-            def finish_task(self, name: str) -> None:
-                finished_tasks.append(name)
-
-        reporter = TrackingReporter()
-        catalog.fetch("customers", progress=reporter)
+        result = catalog.fetch("customers", progress=tracking_reporter)
+        assert isinstance(result, Path)  # Type narrowing
 
         # Assert
-        assert ("customers", 1000) in started_tasks
-        assert "customers" in finished_tasks
-        assert len(progress_calls) > 0
-        assert progress_calls[-1][0] == 1000  # All bytes downloaded
-
-    def test_fetch_does_not_call_progress_when_cache_hit(self, tmp_path: Path) -> None:
+        assert hashlib.sha256(result.read_bytes()).digest() == PAYLOAD_64_SHA256
+        assert ("customers", len(PAYLOAD_64)) in tracking_reporter.started_tasks
+        assert "customers" in tracking_reporter.finished_tasks
+        assert len(tracking_reporter.done) > 0
+        # All bytes downloaded
+        assert tracking_reporter.done[-1] == len(PAYLOAD_64)
+        assert tracking_reporter.totals[-1] == len(PAYLOAD_64)
+
+    def test_fetch_does_not_call_progress_when_cache_hit(
+        self,
+        tmp_path: Path,
+        storage: FilesystemStorage,
+        customers_dataset: Callable[[Path, Path], Dataset],
+        tracking_reporter: Any,
+    ) -> None:
         """fetch() should not call progress reporter when returning from cache."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.ports import ProgressCallback
-        from datacachalog.core.services import Catalog
-
         # Setup
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
         remote_file = storage_dir / "data.csv"
-        remote_file.write_text("content")
+        remote_file.write_bytes(b"content")
 
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
-        dataset = Dataset(
-            name="customers",
-            source=str(remote_file),
-            cache_path=cache_dir / "customers.csv",
-        )
+        dataset = customers_dataset(remote_file, cache_dir)
         catalog = Catalog(datasets=[dataset], storage=storage, cache=cache)
 
         # First fetch populates cache
         catalog.fetch("customers")
 
         # Track second fetch
-        started_tasks: list[str] = []
-
-        class TrackingReporter:
-            def start_task(self, name: str, total: int) -> ProgressCallback:
-                started_tasks.append(name)
-                return lambda d, t: None
-
-            def finish_task(self, name: str) -> None:
-                pass
-
-        reporter = TrackingReporter()
-        catalog.fetch("customers", progress=reporter)
+        catalog.fetch("customers", progress=tracking_reporter)
 
         # Assert: no progress since cache was used
-        assert started_tasks == []
+        assert tracking_reporter.started_tasks == []
 
 
 @pytest.mark.core
@@ -144,33 +121,25 @@ class TestFetchWithProgress:
 class TestFetchAll:
     """Tests for fetch_all() method."""
 
-    def test_fetch_all_exists(self, tmp_path: Path) -> None:
+    def test_fetch_all_exists(self, tmp_path: Path, storage: FilesystemStorage) -> None:
         """Catalog should have fetch_all() method."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=tmp_path / "cache")
         catalog = Catalog(datasets=[], storage=storage, cache=cache)
 
         assert hasattr(catalog, "fetch_all")
         assert callable(catalog.fetch_all)
 
-    def test_fetch_all_returns_dict_of_paths(self, tmp_path: Path) -> None:
+    def test_fetch_all_returns_dict_of_paths(
+        self, tmp_path: Path, storage: FilesystemStorage
+    ) -> None:
         """fetch_all() should return dict mapping names to paths."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
         # Setup
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
-        (storage_dir / "a.csv").write_text("a content")
-        (storage_dir / "b.csv").write_text("b content")
+        (storage_dir / "a.csv").write_bytes(b"a content")
+        (storage_dir / "b.csv").write_bytes(b"b content")
 
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
         datasets = [
@@ -192,25 +161,21 @@ class TestFetchAll:
         assert set(result.keys()) == {"alpha", "beta"}
         alpha_path = result["alpha"]
         assert isinstance(alpha_path, Path)  # Type narrowing
-        assert alpha_path.read_text() == "a content"
+        assert alpha_path.read_bytes() == b"a content"
         beta_path = result["beta"]
         assert isinstance(beta_path, Path)  # Type narrowing
-        assert beta_path.read_text() == "b content"
+        assert beta_path.read_bytes() == b"b content"
 
-    def test_fetch_all_accepts_progress_parameter(self, tmp_path: Path) -> None:
+    def test_fetch_all_accepts_progress_parameter(
+        self, tmp_path: Path, storage: FilesystemStorage
+    ) -> None:
         """fetch_all() should accept optional progress reporter."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.ports import NullProgressReporter
-        from datacachalog.core.services import Catalog
-
         # Setup
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
-        (storage_dir / "a.csv").write_text("content")
+        (storage_dir / "a.csv").write_bytes(b"content")
 
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
         dataset = Dataset(name="alpha", source=str(storage_dir / "a.csv"))
@@ -227,21 +192,17 @@ class TestFetchAll:
 
         assert "alpha" in result
 
-    def test_fetch_all_reports_progress_for_each_dataset(self, tmp_path: Path) -> None:
+    def test_fetch_all_reports_progress_for_each_dataset(
+        self, tmp_path: Path, storage: FilesystemStorage, tracking_reporter: Any
+    ) -> None:
         """fetch_all() should report progress for each download."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.ports import ProgressCallback
-        from datacachalog.core.services import Catalog
-
         # Setup
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
-        (storage_dir / "a.csv").write_text("a" * 100)
-        (storage_dir / "b.csv").write_text("b" * 200)
+        (storage_dir / "a.csv").write_bytes(PAYLOAD_A100)
+        (storage_dir / "b.csv").write_bytes(PAYLOAD_B200)
 
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
         datasets = [
@@ -255,36 +216,18 @@ class TestFetchAll:
             cache_dir=cache_dir,
         )
 
-        # Track progress
-        started_tasks: list[tuple[str, int]] = []
-        finished_tasks: list[str] = []
-
-        class TrackingReporter:
-            def start_task(self, name: str, total: int) -> ProgressCallback:
-                started_tasks.append((name, total))
-                return lambda d, t: None
-
-            def finish_task(self, name: str) -> None:
-                finished_tasks.append(name)
-
-        reporter = TrackingReporter()
-        catalog.fetch_all(progress=reporter)
+        catalog.fetch_all(progress=tracking_reporter)
 
         # Assert both datasets reported
-        assert ("alpha", 100) in started_tasks
-        assert ("beta", 200) in started_tasks
-        assert "alpha" in finished_tasks
-        assert "beta" in finished_tasks
+        assert ("alpha", len(PAYLOAD_A100)) in tracking_reporter.started_tasks
+        assert ("beta", len(PAYLOAD_B200)) in tracking_reporter.started_tasks
+        assert "alpha" in tracking_reporter.finished_tasks
+        assert "beta" in tracking_reporter.finished_tasks
 
     def test_fetch_all_returns_empty_dict_when_no_datasets(
-        self, tmp_path: Path
+        self, tmp_path: Path, storage: FilesystemStorage
     ) -> None:
         """fetch_all() should return empty dict when catalog is empty."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=tmp_path / "cache")
         catalog = Catalog(datasets=[], storage=storage, cache=cache)
 
@@ -295,22 +238,16 @@ class TestFetchAll:
     @pytest.mark.tra("Domain.Catalog")
     @pytest.mark.tier(1)
     def test_fetch_all_without_executor_uses_sequential_execution(
-        self, tmp_path: Path
+        self, tmp_path: Path, storage: FilesystemStorage, tracking_reporter: Any
     ) -> None:
         """fetch_all() with executor=None should execute sequentially, not create ThreadPoolExecutor."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.ports import ProgressCallback
-        from datacachalog.core.services import Catalog
-
         # Setup multiple files
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
-        (storage_dir / "a.csv").write_text("a")
-        (storage_dir / "b.csv").write_text("b")
+        (storage_dir / "a.csv").write_bytes(b"a")
+        (storage_dir / "b.csv").write_bytes(b"b")
 
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
         datasets = [
@@ -326,18 +263,8 @@ class TestFetchAll:
         )
 
         # Track execution order to verify sequential execution
-        execution_order: list[str] = []
-
-        class OrderTrackingReporter:
-            def start_task(self, name: str, total: int) -> ProgressCallback:
-                execution_order.append(name)
-                return lambda d, t: None
-
-            def finish_task(self, name: str) -> None:
-                pass
-
-        tracker = OrderTrackingReporter()
-        result = catalog.fetch_all(progress=tracker, max_workers=None)
+        result = catalog.fetch_all(progress=tracking_reporter, max_workers=None)
+        execution_order = [name for name, _ in tracking_reporter.started_tasks]
 
         # Verify results are correct
         assert len(result) == 2
@@ -354,21 +281,16 @@ class TestFetchAll:
     @pytest.mark.tra("Domain.Catalog")
     @pytest.mark.tier(1)
     def test_fetch_all_without_executor_preserves_functionality(
-        self, tmp_path: Path
+        self, tmp_path: Path, storage: FilesystemStorage
     ) -> None:
         """fetch_all() should still return correct results when no executor provided."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
         # Setup
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
-        (storage_dir / "a.csv").write_text("a content")
-        (storage_dir / "b.csv").write_text("b content")
+        (storage_dir / "a.csv").write_bytes(b"a content")
+        (storage_dir / "b.csv").write_bytes(b"b content")
 
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
         datasets = [
@@ -391,31 +313,25 @@ class TestFetchAll:
         assert set(result.keys()) == {"alpha", "beta"}
         alpha_path = result["alpha"]
         assert isinstance(alpha_path, Path)
-        assert alpha_path.read_text() == "a content"
+        assert alpha_path.read_bytes() == b"a content"
         beta_path = result["beta"]
         assert isinstance(beta_path, Path)
-        assert beta_path.read_text() == "b content"
+        assert beta_path.read_bytes() == b"b content"
 
 
 @pytest.mark.core
 @pytest.mark.tra("UseCase.FetchAll")
 @pytest.mark.tier(1)
+@pytest.mark.parallel
 class TestFetchAllParallel:
     """Tests for parallel fetch_all()."""
 
-    def test_fetch_all_accepts_max_workers_parameter(self, tmp_path: Path) -> None:
+    def test_fetch_all_accepts_max_workers_parameter(
+        self, tmp_path: Path, seed_storage: Path, storage: FilesystemStorage
+    ) -> None:
         """fetch_all() should accept max_workers parameter."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        # Setup
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        (storage_dir / "a.csv").write_text("content")
-
+        storage_dir = seed_storage
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
         dataset = Dataset(name="alpha", source=str(storage_dir / "a.csv"))
@@ -431,21 +347,16 @@ class TestFetchAllParallel:
 
         assert "alpha" in result
 
-    def test_fetch_all_parallel_downloads_multiple_files(self, tmp_path: Path) -> None:
+    def test_fetch_all_parallel_downloads_multiple_files(
+        self,
+        tmp_path: Path,
+        seed_storage: Path,
+        storage: FilesystemStorage,
+        tracking_reporter: Any,
+    ) -> None:
         """fetch_all(max_workers=N) should download N files concurrently."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.ports import ProgressCallback
-        from datacachalog.core.services import Catalog
-
-        # Setup multiple files
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        for i in range(4):
-            (storage_dir / f"file{i}.csv").write_text(f"content {i}")
-
+        storage_dir = seed_storage  # file0.csv .. file3.csv
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
         datasets = [
@@ -459,40 +370,49 @@ class TestFetchAllParallel:
             cache_dir=cache_dir,
         )
 
-        # Track tasks
-        started_tasks: list[str] = []
-        finished_tasks: list[str] = []
-
-        class TrackingReporter:
-            def start_task(self, name: str, total: int) -> ProgressCallback:
-                started_tasks.append(name)
-                return lambda d, t: None
-
-            def finish_task(self, name: str) -> None:
-                finished_tasks.append(name)
-
-        tracker = TrackingReporter()
-        result = catalog.fetch_all(progress=tracker, max_workers=2)
+        result = catalog.fetch_all(progress=tracking_reporter, max_workers=2)
 
         assert len(result) == 4
-        assert set(started_tasks) == {"ds0", "ds1", "ds2", "ds3"}
-        assert set(finished_tasks) == {"ds0", "ds1", "ds2", "ds3"}
+        expected = {"ds0", "ds1", "ds2", "ds3"}
+        assert {name for name, _ in tracking_reporter.started_tasks} == expected
+        assert set(tracking_reporter.finished_tasks) == expected
 
-    def test_fetch_all_sequential_when_max_workers_1(self, tmp_path: Path) -> None:
-        """fetch_all(max_workers=1) should download sequentially."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.ports import ProgressCallback
-        from datacachalog.core.services import Catalog
-
-        # Setup
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        (storage_dir / "a.csv").write_text("a")
-        (storage_dir / "b.csv").write_text("b")
+    def test_fetch_all_reuses_injected_executor_across_calls(
+        self, tmp_path: Path, seed_storage: Path, storage: FilesystemStorage
+    ) -> None:
+        """fetch_all() should not shut down the injected executor between calls."""
+        storage_dir = seed_storage
+        cache_dir = tmp_path / "cache"
+        datasets = [
+            Dataset(name="alpha", source=str(storage_dir / "a.csv")),
+            Dataset(name="beta", source=str(storage_dir / "b.csv")),
+        ]
 
+        with ThreadPoolExecutorAdapter(max_workers=2) as executor:
+            catalog = Catalog(
+                datasets=datasets,
+                storage=storage,
+                cache=FileCache(cache_dir=cache_dir),
+                cache_dir=cache_dir,
+                executor=executor,
+            )
+
+            first = catalog.fetch_all(max_workers=2)
+            second = catalog.fetch_all(max_workers=2)
+
+        assert first == second
+        assert set(second) == {"alpha", "beta"}
+
+    def test_fetch_all_sequential_when_max_workers_1(
+        self,
+        tmp_path: Path,
+        seed_storage: Path,
+        storage: FilesystemStorage,
+        tracking_reporter: Any,
+    ) -> None:
+        """fetch_all(max_workers=1) should download sequentially."""
+        storage_dir = seed_storage
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
         datasets = [
@@ -506,22 +426,40 @@ class TestFetchAllParallel:
             cache_dir=cache_dir,
         )
 
-        # Track order
-        order: list[str] = []
-
-        class OrderTracker:
-            def start_task(self, name: str, total: int) -> ProgressCallback:
-                order.append(f"start:{name}")
-                return lambda d, t: None
-
-            def finish_task(self, name: str) -> None:
-                order.append(f"finish:{name}")
-
-        tracker = OrderTracker()
-        catalog.fetch_all(progress=tracker, max_workers=1)
+        catalog.fetch_all(progress=tracking_reporter, max_workers=1)
+        order = tracking_reporter.order
 
         # Sequential order means start/finish pairs are not interleaved
         assert order[0].startswith("start:")
         assert order[1].startswith("finish:")
         assert order[2].startswith("start:")
         assert order[3].startswith("finish:")
+
+    def test_fetch_all_single_dataset_skips_executor(
+        self, tmp_path: Path, seed_storage: Path, storage: FilesystemStorage
+    ) -> None:
+        """fetch_all() with one dataset should not submit to the executor."""
+        cache_dir = tmp_path / "cache"
+        submitted: list[object] = []
+
+        with ThreadPoolExecutorAdapter(max_workers=4) as executor:
+            real_submit = executor.submit
+
+            def tracking_submit(
+                fn: Callable[..., object], *args: object, **kwargs: object
+            ) -> Future[object]:
+                submitted.append(fn)
+                return real_submit(fn, *args, **kwargs)
+
+            executor.submit = tracking_submit  # type: ignore[method-assign]
+            catalog = Catalog(
+                datasets=[Dataset(name="alpha", source=str(seed_storage / "a.csv"))],
+                storage=storage,
+                cache=FileCache(cache_dir=cache_dir),
+                cache_dir=cache_dir,
+                executor=executor,
+            )
+            result = catalog.fetch_all(max_workers=4)
+
+        assert isinstance(result["alpha"], Path)
+        assert submitted == []
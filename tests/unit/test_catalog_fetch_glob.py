@@ -1,10 +1,23 @@
 """Unit tests for Catalog glob pattern fetch operations."""
 
+import os
+import shutil
+import time
+import uuid
 from pathlib import Path
 
 import pytest
+from hypothesis import given, settings
+from hypothesis.strategies import binary, integers, text
 
 from datacachalog import Dataset
+from datacachalog.adapters.cache import FileCache
+from datacachalog.adapters.executor import ThreadPoolExecutorAdapter
+from datacachalog.adapters.storage import FilesystemStorage
+from datacachalog.core.exceptions import EmptyGlobMatchError
+from datacachalog.core.models import FileMetadata
+from datacachalog.core.ports import ProgressCallback
+from datacachalog.core.services import Catalog
 
 
 @pytest.mark.tra("UseCase.Fetch")
@@ -19,21 +32,12 @@ class TestFetchGlob:
         # This fixture explicitly signals isolation intent
         pass
 
-    def test_fetch_glob_returns_list_of_paths(self, tmp_path: Path) -> None:
+    def test_fetch_glob_returns_list_of_paths(
+        self, tmp_path: Path, seed_storage: Path, storage: FilesystemStorage
+    ) -> None:
         """fetch() with glob pattern should return list[Path]."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        # Setup: create multiple files
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        (storage_dir / "data_2024_01.parquet").write_text("jan")
-        (storage_dir / "data_2024_02.parquet").write_text("feb")
-        (storage_dir / "data_2024_03.parquet").write_text("mar")
-
+        storage_dir = seed_storage
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
         # Dataset with glob pattern
@@ -53,24 +57,15 @@ class TestFetchGlob:
 
         # Assert
         assert isinstance(result, list)
-        assert len(result) == 3
+        assert len(result) == 2  # a.parquet, b.parquet
         assert all(isinstance(p, Path) for p in result)
 
-    def test_fetch_glob_downloads_all_matching_files(self, tmp_path: Path) -> None:
+    def test_fetch_glob_downloads_all_matching_files(
+        self, tmp_path: Path, seed_storage: Path, storage: FilesystemStorage
+    ) -> None:
         """fetch() should download all files matching the glob pattern."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        # Setup
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        (storage_dir / "a.parquet").write_text("content a")
-        (storage_dir / "b.parquet").write_text("content b")
-        (storage_dir / "c.csv").write_text("not matched")
-
+        storage_dir = seed_storage  # a.parquet, b.parquet, non-matching c.csv
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
         dataset = Dataset(name="data", source=str(storage_dir / "*.parquet"))
@@ -88,23 +83,15 @@ class TestFetchGlob:
 
         # Assert: only .parquet files matched
         assert len(paths) == 2
-        contents = {p.read_text() for p in paths}
-        assert contents == {"content a", "content b"}
+        contents = {p.read_bytes() for p in paths}
+        assert contents == {b"content a", b"content b"}
 
-    def test_fetch_glob_caches_each_file_separately(self, tmp_path: Path) -> None:
+    def test_fetch_glob_caches_each_file_separately(
+        self, tmp_path: Path, seed_storage: Path, storage: FilesystemStorage
+    ) -> None:
         """Each file matched by glob should have its own cache entry."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        # Setup
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        (storage_dir / "file1.txt").write_text("one")
-        (storage_dir / "file2.txt").write_text("two")
-
+        storage_dir = seed_storage
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
         dataset = Dataset(name="files", source=str(storage_dir / "*.txt"))
@@ -122,19 +109,133 @@ class TestFetchGlob:
         assert cache.get("files/file1.txt") is not None
         assert cache.get("files/file2.txt") is not None
 
-    def test_fetch_glob_empty_match_raises_error(self, tmp_path: Path) -> None:
-        """fetch() should raise EmptyGlobMatchError when pattern matches nothing."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.exceptions import EmptyGlobMatchError
-        from datacachalog.core.services import Catalog
+    @pytest.mark.parallel
+    def test_fetch_glob_with_executor_keeps_listing_order(
+        self, tmp_path: Path, seed_storage: Path, storage: FilesystemStorage
+    ) -> None:
+        """With an executor, glob matches are fetched in parallel, in order."""
+        cache_dir = tmp_path / "cache"
+        dataset = Dataset(name="files", source=str(seed_storage / "file*.csv"))
+
+        with ThreadPoolExecutorAdapter(max_workers=4) as executor:
+            catalog = Catalog(
+                datasets=[dataset],
+                storage=storage,
+                cache=FileCache(cache_dir=cache_dir),
+                cache_dir=cache_dir,
+                executor=executor,
+            )
+            result = catalog.fetch("files")
+
+        assert isinstance(result, list)
+        expected = storage.list(str(seed_storage), "file*.csv")
+        assert [p.name for p in result] == [Path(uri).name for uri in expected]
+
+    @pytest.mark.parallel
+    def test_fetch_glob_with_executor_keeps_same_named_matches_apart(
+        self, tmp_path: Path, storage: FilesystemStorage
+    ) -> None:
+        """Parallel matches sharing a basename each cache their own bytes."""
+        storage_dir = tmp_path / "storage"
+        for i in range(8):
+            (storage_dir / f"d{i}").mkdir(parents=True)
+            (storage_dir / f"d{i}" / "x.csv").write_bytes(f"content {i}".encode())
+        cache_dir = tmp_path / "cache"
+        cache = FileCache(cache_dir=cache_dir)
+        dataset = Dataset(name="g", source=str(storage_dir / "**" / "x.csv"))
+
+        with ThreadPoolExecutorAdapter(max_workers=4) as executor:
+            catalog = Catalog(
+                datasets=[dataset],
+                storage=storage,
+                cache=cache,
+                cache_dir=cache_dir,
+                executor=executor,
+            )
+            catalog.fetch("g")
+
+        for i in range(8):
+            cached = cache.get(f"g/d{i}/x.csv")
+            assert cached is not None
+            assert cached[0].read_bytes() == f"content {i}".encode()
+
+    @pytest.mark.parametrize("fail", [False, True], ids=["ok", "failed"])
+    @pytest.mark.parametrize("max_workers", [None, 4], ids=["serial", "parallel"])
+    def test_fetch_glob_leaves_no_staging_files(
+        self, tmp_path: Path, max_workers: int | None, fail: bool
+    ) -> None:
+        """Nothing but cache entries remains in cache_dir after a glob fetch."""
+
+        class PartialFailStorage(FilesystemStorage):
+            def download(
+                self,
+                source: str,
+                dest: Path,
+                progress: ProgressCallback,
+                *,
+                meta: FileMetadata | None = None,
+            ) -> None:
+                if fail and source.endswith("d3/x.csv"):
+                    dest.write_bytes(b"partial")
+                    raise OSError("connection reset")
+                super().download(source, dest, progress, meta=meta)
 
-        # Setup: empty directory
         storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
+        for i in range(8):
+            (storage_dir / f"d{i}").mkdir(parents=True)
+            (storage_dir / f"d{i}" / "x.csv").write_bytes(f"content {i}".encode())
+        cache_dir = tmp_path / "cache"
+        dataset = Dataset(name="g", source=str(storage_dir / "**" / "x.csv"))
+
+        with ThreadPoolExecutorAdapter(max_workers=max_workers or 1) as executor:
+            catalog = Catalog(
+                datasets=[dataset],
+                storage=PartialFailStorage(),
+                cache=FileCache(cache_dir=cache_dir),
+                cache_dir=cache_dir,
+                executor=executor if max_workers else None,
+            )
+            if fail:
+                with pytest.raises(OSError, match="connection reset"):
+                    catalog.fetch("g")
+            else:
+                catalog.fetch("g")
+
+        assert [p.name for p in cache_dir.iterdir() if p.name.startswith(".")] == []
+        assert {p.name for p in cache_dir.iterdir()} <= {"g"}
+
+    @pytest.mark.parallel
+    def test_fetch_all_globs_do_not_exhaust_executor(
+        self, tmp_path: Path, seed_storage: Path, storage: FilesystemStorage
+    ) -> None:
+        """fetch_all() completes when every worker is busy with a glob dataset."""
+        cache_dir = tmp_path / "cache"
+        datasets = [
+            Dataset(name="parquet", source=str(seed_storage / "*.parquet")),
+            Dataset(name="text", source=str(seed_storage / "*.txt")),
+        ]
+
+        with ThreadPoolExecutorAdapter(max_workers=2) as executor:
+            catalog = Catalog(
+                datasets=datasets,
+                storage=storage,
+                cache=FileCache(cache_dir=cache_dir),
+                cache_dir=cache_dir,
+                executor=executor,
+            )
+            results = catalog.fetch_all()
+
+        assert isinstance(results["parquet"], list)
+        assert isinstance(results["text"], list)
+        assert len(results["parquet"]) == 2
+        assert len(results["text"]) == 2
 
+    def test_fetch_glob_empty_match_raises_error(
+        self, tmp_path: Path, seed_storage: Path, storage: FilesystemStorage
+    ) -> None:
+        """fetch() should raise EmptyGlobMatchError when pattern matches nothing."""
+        storage_dir = seed_storage / "empty"
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
         dataset = Dataset(name="data", source=str(storage_dir / "*.parquet"))
@@ -152,19 +253,12 @@ class TestFetchGlob:
         assert "*.parquet" in str(exc_info.value)
         assert exc_info.value.recovery_hint is not None
 
-    def test_fetch_non_glob_still_returns_single_path(self, tmp_path: Path) -> None:
+    def test_fetch_non_glob_still_returns_single_path(
+        self, tmp_path: Path, seed_storage: Path, storage: FilesystemStorage
+    ) -> None:
         """fetch() without glob should return single Path (backward compatible)."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        # Setup
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        (storage_dir / "single.csv").write_text("content")
-
+        storage_dir = seed_storage
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
         dataset = Dataset(
@@ -184,24 +278,17 @@ class TestFetchGlob:
 
         # Assert: single Path, not list
         assert isinstance(result, Path)
-        assert result.read_text() == "content"
+        assert result.read_bytes() == b"content"
 
-    def test_fetch_glob_checks_staleness_per_file(self, tmp_path: Path) -> None:
+    def test_fetch_glob_checks_staleness_per_file(
+        self, tmp_path: Path, seed_storage: Path, storage: FilesystemStorage
+    ) -> None:
         """Each file in glob should have independent staleness checking."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        # Setup
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        file1 = storage_dir / "file1.txt"
+        # Private copy: this test rewrites a remote file
+        storage_dir = shutil.copytree(seed_storage, tmp_path / "storage")
         file2 = storage_dir / "file2.txt"
-        file1.write_text("original 1")
-        file2.write_text("original 2")
 
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
         dataset = Dataset(name="files", source=str(storage_dir / "*.txt"))
@@ -216,7 +303,7 @@ class TestFetchGlob:
         catalog.fetch("files")
 
         # Modify only file2
-        file2.write_text("updated 2")
+        file2.write_bytes(b"updated 2")
 
         # Second fetch
         result = catalog.fetch("files")
@@ -224,25 +311,16 @@ class TestFetchGlob:
         paths = result
 
         # Assert: file2 was re-downloaded with new content
-        contents = {p.read_text() for p in paths}
-        assert contents == {"original 1", "updated 2"}
+        contents = {p.read_bytes() for p in paths}
+        assert contents == {b"original 1", b"updated 2"}
 
     def test_fetch_with_dry_run_returns_cached_path_if_fresh(
-        self, tmp_path: Path
+        self, tmp_path: Path, seed_storage: Path, storage: FilesystemStorage
     ) -> None:
         """fetch(dry_run=True) should return cached path when cache is fresh."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        # Setup: create "remote" file
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        remote_file = storage_dir / "data.csv"
-        remote_file.write_text("id,name\n1,Alice\n")
+        remote_file = seed_storage / "customers.csv"
 
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
         dataset = Dataset(
@@ -265,22 +343,14 @@ class TestFetchGlob:
         assert path2 == path1, "Dry-run should return cached path when fresh"
 
     def test_fetch_with_dry_run_checks_staleness_but_does_not_download(
-        self, tmp_path: Path
+        self, tmp_path: Path, seed_storage: Path, storage: FilesystemStorage
     ) -> None:
         """fetch(dry_run=True) should check staleness but skip download and cache update."""
-
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        # Setup: create "remote" file
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        remote_file = storage_dir / "data.csv"
-        remote_file.write_text("id,name\n1,Alice\n")
+        # Private copy: this test rewrites the remote file
+        storage_dir = shutil.copytree(seed_storage, tmp_path / "storage")
+        remote_file = storage_dir / "customers.csv"
 
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
         dataset = Dataset(
@@ -294,14 +364,14 @@ class TestFetchGlob:
         result1 = catalog.fetch("customers")
         assert isinstance(result1, Path)
         path1 = result1
-        original_content = path1.read_text()
+        original_content = path1.read_bytes()
 
-        # Get cache metadata before modification
-        cached_before = cache.get("customers")
-        assert cached_before is not None
+        # Get cache fingerprint before modification
+        fingerprint_before = cache.fingerprint("customers")
+        assert fingerprint_before is not None
 
         # Modify remote file (changes ETag via content hash)
-        remote_file.write_text("id,name\n1,Alice\n2,Bob\n")
+        remote_file.write_bytes(b"id,name\n1,Alice\n2,Bob\n")
 
         # Dry-run fetch should check staleness but not download
         result2 = catalog.fetch("customers", dry_run=True)
@@ -309,28 +379,19 @@ class TestFetchGlob:
         path2 = result2
 
         # Cache should be unchanged (still has old content)
-        assert path2.read_text() == original_content, (
+        assert path2.read_bytes() == original_content, (
             "Cache should not be updated in dry-run"
         )
-        cached_after = cache.get("customers")
-        assert cached_before == cached_after, (
+        assert cache.verify_unchanged("customers", fingerprint_before), (
             "Cache metadata should not change in dry-run"
         )
 
-    def test_fetch_all_with_dry_run(self, tmp_path: Path) -> None:
+    def test_fetch_all_with_dry_run(
+        self, tmp_path: Path, seed_storage: Path, storage: FilesystemStorage
+    ) -> None:
         """fetch_all(dry_run=True) should check all datasets without downloading."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        # Setup: create "remote" files
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        (storage_dir / "customers.csv").write_text("id,name\n1,Alice\n")
-        (storage_dir / "orders.csv").write_text("id,amount\n1,100\n")
-
+        storage_dir = seed_storage
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
         customers = Dataset(
@@ -349,8 +410,8 @@ class TestFetchGlob:
         catalog.fetch_all()
 
         # Get cache state before dry-run
-        cached_customers_before = cache.get("customers")
-        cached_orders_before = cache.get("orders")
+        customers_before = cache.fingerprint("customers")
+        orders_before = cache.fingerprint("orders")
 
         # Dry-run fetch_all
         results = catalog.fetch_all(dry_run=True)
@@ -360,30 +421,18 @@ class TestFetchGlob:
         assert "orders" in results
 
         # Cache should be unchanged
-        cached_customers_after = cache.get("customers")
-        cached_orders_after = cache.get("orders")
-        assert cached_customers_before == cached_customers_after
-        assert cached_orders_before == cached_orders_after
+        assert cache.verify_unchanged("customers", customers_before)
+        assert cache.verify_unchanged("orders", orders_before)
 
-    def test_fetch_glob_with_dry_run(self, tmp_path: Path) -> None:
+    def test_fetch_glob_with_dry_run(
+        self, tmp_path: Path, seed_storage: Path, storage: FilesystemStorage
+    ) -> None:
         """fetch(dry_run=True) for glob dataset should check staleness without downloading."""
-        import os
-        import time
-
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
-        # Setup
-        storage_dir = tmp_path / "storage"
-        storage_dir.mkdir()
-        file1 = storage_dir / "file1.txt"
+        # Private copy: this test rewrites a remote file
+        storage_dir = shutil.copytree(seed_storage, tmp_path / "storage")
         file2 = storage_dir / "file2.txt"
-        file1.write_text("original 1")
-        file2.write_text("original 2")
 
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
         dataset = Dataset(name="files", source=str(storage_dir / "*.txt"))
@@ -398,13 +447,13 @@ class TestFetchGlob:
         catalog.fetch("files")
 
         # Get cache state before modification (check that entries exist)
-        cache_entry1_before = cache.get("files/file1.txt")
-        cache_entry2_before = cache.get("files/file2.txt")
+        cache_entry1_before = cache.fingerprint("files/file1.txt")
+        cache_entry2_before = cache.fingerprint("files/file2.txt")
         assert cache_entry1_before is not None
         assert cache_entry2_before is not None
 
         # Modify one file (use os.utime instead of sleep for determinism)
-        file2.write_text("updated 2")
+        file2.write_bytes(b"updated 2")
         future_time = time.time() + 10
         os.utime(file2, (future_time, future_time))
 
@@ -412,30 +461,20 @@ class TestFetchGlob:
         result = catalog.fetch("files", dry_run=True)
         assert isinstance(result, list)
 
-        # Cache should be unchanged (same metadata)
-        cache_entry1_after = cache.get("files/file1.txt")
-        cache_entry2_after = cache.get("files/file2.txt")
-        assert cache_entry1_before == cache_entry1_after, (
+        # Cache should be unchanged (same data file and metadata sidecar)
+        assert cache.verify_unchanged("files/file1.txt", cache_entry1_before), (
             "Cache should not be modified in dry-run"
         )
-        assert cache_entry2_before == cache_entry2_after, (
+        assert cache.verify_unchanged("files/file2.txt", cache_entry2_before), (
             "Cache should not be modified in dry-run"
         )
 
     @pytest.mark.property
     @pytest.mark.timeout(10.0)  # Property-based tests may take longer
-    def test_fetch_dry_run_cache_immutability_property(self, tmp_path: Path) -> None:
+    def test_fetch_dry_run_cache_immutability_property(
+        self, tmp_path: Path, storage: FilesystemStorage
+    ) -> None:
         """Property: Multiple fetch(dry_run=True) calls never modify cache state."""
-        import os
-        import time
-        import uuid
-
-        from hypothesis import given, settings
-        from hypothesis.strategies import binary, integers
-
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
 
         @settings(database=None)  # Disable example persistence for isolation
         @given(
@@ -454,7 +493,6 @@ class TestFetchGlob:
             remote_file.write_bytes(content)
 
             cache_dir = tmp_path / f"cache_{run_id}"
-            storage = FilesystemStorage()
             cache = FileCache(cache_dir=cache_dir)
 
             dataset = Dataset(
@@ -523,17 +561,10 @@ class TestFetchGlob:
 
     @pytest.mark.property
     @pytest.mark.tier(1)
-    def test_fetch_dry_run_never_modifies_cache_property(self, tmp_path: Path) -> None:
+    def test_fetch_dry_run_never_modifies_cache_property(
+        self, tmp_path: Path, storage: FilesystemStorage
+    ) -> None:
         """Property: Multiple fetch(dry_run=True) calls never modify cache state (metadata, file contents, file count)."""
-        import uuid
-
-        from hypothesis import given, settings
-        from hypothesis.strategies import binary, integers, text
-
-        from datacachalog import Dataset
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
 
         @settings(database=None)  # Disable example persistence for isolation
         @given(
@@ -556,7 +587,6 @@ class TestFetchGlob:
             remote_file.write_bytes(content)
 
             cache_dir = tmp_path / f"cache_{run_id}"
-            storage = FilesystemStorage()
             cache = FileCache(cache_dir=cache_dir)
 
             dataset = Dataset(
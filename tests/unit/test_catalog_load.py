@@ -6,6 +6,7 @@ Test Isolation Strategy:
 - No shared state between tests
 """
 
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
@@ -18,12 +19,6 @@ from datacachalog.core.ports import ProgressCallback
 from datacachalog.core.services import Catalog
 
 
-@pytest.fixture
-def storage() -> FilesystemStorage:
-    """Stateless filesystem storage adapter."""
-    return FilesystemStorage()
-
-
 @pytest.fixture
 def cache(tmp_path: Path):
     """Isolated file cache using tmp_path for test isolation.
@@ -63,14 +58,18 @@ class TestLoad:
     """Tests for load() method."""
 
     def test_load_single_file(
-        self, tmp_path: Path, storage: FilesystemStorage, cache: FileCache
+        self,
+        tmp_path: Path,
+        storage: FilesystemStorage,
+        cache: FileCache,
+        customers_dataset: Callable[[Path, Path], Dataset],
     ) -> None:
         """load() should fetch dataset and call reader.read() with the path."""
         # Setup: create a "remote" file
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
         remote_file = storage_dir / "data.csv"
-        remote_file.write_text("id,name\n1,Alice\n")
+        remote_file.write_bytes(b"id,name\n1,Alice\n")
 
         # Create a simple reader that tracks calls
         class TrackingReader:
@@ -84,11 +83,7 @@ class TestLoad:
         reader = TrackingReader()
         cache_dir = tmp_path / "cache"
 
-        dataset = Dataset(
-            name="customers",
-            source=str(remote_file),
-            cache_path=cache_dir / "customers.csv",
-        )
+        dataset = customers_dataset(remote_file, cache_dir)
         catalog = Catalog(
             datasets=[dataset], storage=storage, cache=cache, reader=reader
         )
@@ -102,21 +97,21 @@ class TestLoad:
         assert result == "id,name\n1,Alice\n"
 
     def test_load_raises_without_reader(
-        self, tmp_path: Path, storage: FilesystemStorage, cache: FileCache
+        self,
+        tmp_path: Path,
+        storage: FilesystemStorage,
+        cache: FileCache,
+        customers_dataset: Callable[[Path, Path], Dataset],
     ) -> None:
         """load() should raise ReaderNotConfiguredError when no reader configured."""
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
         remote_file = storage_dir / "data.csv"
-        remote_file.write_text("id,name\n1,Alice\n")
+        remote_file.write_bytes(b"id,name\n1,Alice\n")
 
         cache_dir = tmp_path / "cache"
 
-        dataset = Dataset(
-            name="customers",
-            source=str(remote_file),
-            cache_path=cache_dir / "customers.csv",
-        )
+        dataset = customers_dataset(remote_file, cache_dir)
         # Catalog without reader
         catalog = Catalog(datasets=[dataset], storage=storage, cache=cache)
 
@@ -124,13 +119,17 @@ class TestLoad:
             catalog.load("customers")
 
     def test_load_passes_fetch_params(
-        self, tmp_path: Path, storage: FilesystemStorage, cache: FileCache
+        self,
+        tmp_path: Path,
+        storage: FilesystemStorage,
+        cache: FileCache,
+        customers_dataset: Callable[[Path, Path], Dataset],
     ) -> None:
         """load() should pass progress through to fetch()."""
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
         remote_file = storage_dir / "data.csv"
-        remote_file.write_text("id,name\n1,Alice\n")
+        remote_file.write_bytes(b"id,name\n1,Alice\n")
 
         cache_dir = tmp_path / "cache"
 
@@ -140,11 +139,7 @@ class TestLoad:
 
         reader = SimpleReader()
 
-        dataset = Dataset(
-            name="customers",
-            source=str(remote_file),
-            cache_path=cache_dir / "customers.csv",
-        )
+        dataset = customers_dataset(remote_file, cache_dir)
         catalog = Catalog(
             datasets=[dataset], storage=storage, cache=cache, reader=reader
         )
@@ -161,13 +156,17 @@ class TestLoad:
         assert progress.started_tasks[0][0] == "customers"
 
     def test_load_dry_run_returns_path(
-        self, tmp_path: Path, storage: FilesystemStorage, cache: FileCache
+        self,
+        tmp_path: Path,
+        storage: FilesystemStorage,
+        cache: FileCache,
+        customers_dataset: Callable[[Path, Path], Dataset],
     ) -> None:
         """load() with dry_run=True should return Path without calling reader."""
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
         remote_file = storage_dir / "data.csv"
-        remote_file.write_text("id,name\n1,Alice\n")
+        remote_file.write_bytes(b"id,name\n1,Alice\n")
 
         cache_dir = tmp_path / "cache"
 
@@ -181,11 +180,7 @@ class TestLoad:
 
         reader = TrackingReader()
 
-        dataset = Dataset(
-            name="customers",
-            source=str(remote_file),
-            cache_path=cache_dir / "customers.csv",
-        )
+        dataset = customers_dataset(remote_file, cache_dir)
         catalog = Catalog(
             datasets=[dataset], storage=storage, cache=cache, reader=reader
         )
@@ -197,17 +192,18 @@ class TestLoad:
         # Verify reader was NOT called
         assert len(reader.read_calls) == 0
 
-    def test_load_glob_returns_list(self, tmp_path: Path) -> None:
+    def test_load_glob_returns_list(
+        self, tmp_path: Path, storage: FilesystemStorage
+    ) -> None:
         """load() should call reader.read() for each file in glob pattern."""
         # Setup: create multiple files
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
-        (storage_dir / "2024-01.csv").write_text("jan")
-        (storage_dir / "2024-02.csv").write_text("feb")
-        (storage_dir / "2024-03.csv").write_text("mar")
+        (storage_dir / "2024-01.csv").write_bytes(b"jan")
+        (storage_dir / "2024-02.csv").write_bytes(b"feb")
+        (storage_dir / "2024-03.csv").write_bytes(b"mar")
 
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
         class TrackingReader:
@@ -242,17 +238,18 @@ class TestLoad:
         # Verify reader was called for each file
         assert len(reader.read_calls) == 3
 
-    def test_load_glob_maintains_order(self, tmp_path: Path) -> None:
+    def test_load_glob_maintains_order(
+        self, tmp_path: Path, storage: FilesystemStorage
+    ) -> None:
         """load() should maintain the order of files from fetch()."""
         # Setup: create files with known order (alphabetical by default)
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
-        (storage_dir / "a.csv").write_text("alpha")
-        (storage_dir / "b.csv").write_text("beta")
-        (storage_dir / "c.csv").write_text("gamma")
+        (storage_dir / "a.csv").write_bytes(b"alpha")
+        (storage_dir / "b.csv").write_bytes(b"beta")
+        (storage_dir / "c.csv").write_bytes(b"gamma")
 
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
         class OrderedReader:
@@ -1,11 +1,19 @@
 """Unit tests for Catalog.push() method."""
 
+import uuid
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 import pytest
+from hypothesis import given
+from hypothesis.strategies import binary
 
 from datacachalog import Dataset
-from datacachalog.core.ports import ProgressCallback
+from datacachalog.adapters.cache import FileCache
+from datacachalog.adapters.storage import FilesystemStorage
+from datacachalog.core.exceptions import DatasetNotFoundError
+from datacachalog.core.services import Catalog
 
 
 @pytest.mark.core
@@ -15,67 +23,59 @@ class TestPush:
     """Tests for push() method."""
 
     @pytest.mark.tier(1)
-    def test_push_uploads_to_remote(self, tmp_path: Path) -> None:
+    def test_push_uploads_to_remote(
+        self,
+        tmp_path: Path,
+        storage: FilesystemStorage,
+        customers_dataset: Callable[[Path, Path], Dataset],
+    ) -> None:
         """push() should upload local file to dataset's source location."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
         # Setup: create directories for "remote" and local
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
         remote_file = storage_dir / "data.csv"
-        remote_file.write_text("original content")
+        remote_file.write_bytes(b"original content")
 
         local_dir = tmp_path / "local"
         local_dir.mkdir()
         local_file = local_dir / "new_data.csv"
-        local_file.write_text("updated content")
+        local_file.write_bytes(b"updated content")
 
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
-        dataset = Dataset(
-            name="customers",
-            source=str(remote_file),
-            cache_path=cache_dir / "customers.csv",
-        )
+        dataset = customers_dataset(remote_file, cache_dir)
         catalog = Catalog(datasets=[dataset], storage=storage, cache=cache)
 
         # Act
         catalog.push("customers", local_file)
 
         # Assert: remote file now has updated content
-        assert remote_file.read_text() == "updated content"
+        assert remote_file.read_bytes() == b"updated content"
 
     @pytest.mark.tier(1)
-    def test_push_updates_cache_metadata(self, tmp_path: Path) -> None:
+    def test_push_updates_cache_metadata(
+        self,
+        tmp_path: Path,
+        storage: FilesystemStorage,
+        customers_dataset: Callable[[Path, Path], Dataset],
+    ) -> None:
         """push() should update cache with new metadata matching remote."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
         # Setup
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
         remote_file = storage_dir / "data.csv"
-        remote_file.write_text("original")
+        remote_file.write_bytes(b"original")
 
         local_dir = tmp_path / "local"
         local_dir.mkdir()
         local_file = local_dir / "new_data.csv"
-        local_file.write_text("updated")
+        local_file.write_bytes(b"updated")
 
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
-        dataset = Dataset(
-            name="customers",
-            source=str(remote_file),
-            cache_path=cache_dir / "customers.csv",
-        )
+        dataset = customers_dataset(remote_file, cache_dir)
         catalog = Catalog(datasets=[dataset], storage=storage, cache=cache)
 
         # Act
@@ -85,32 +85,28 @@ class TestPush:
         assert catalog.is_stale("customers") is False
 
     @pytest.mark.tier(1)
-    def test_push_allows_fetch_without_redownload(self, tmp_path: Path) -> None:
+    def test_push_allows_fetch_without_redownload(
+        self,
+        tmp_path: Path,
+        storage: FilesystemStorage,
+        customers_dataset: Callable[[Path, Path], Dataset],
+    ) -> None:
         """After push(), fetch() should return cache without re-download."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
         # Setup
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
         remote_file = storage_dir / "data.csv"
-        remote_file.write_text("original")
+        remote_file.write_bytes(b"original")
 
         local_dir = tmp_path / "local"
         local_dir.mkdir()
         local_file = local_dir / "new_data.csv"
-        local_file.write_text("pushed content")
+        local_file.write_bytes(b"pushed content")
 
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
-        dataset = Dataset(
-            name="customers",
-            source=str(remote_file),
-            cache_path=cache_dir / "customers.csv",
-        )
+        dataset = customers_dataset(remote_file, cache_dir)
         catalog = Catalog(datasets=[dataset], storage=storage, cache=cache)
 
         # Act: push then fetch
@@ -120,46 +116,35 @@ class TestPush:
         path = result
 
         # Assert: fetch returns the pushed content
-        assert path.read_text() == "pushed content"
+        assert path.read_bytes() == b"pushed content"
 
     @pytest.mark.tier(1)
     def test_push_nonexistent_dataset_raises_dataset_not_found(
-        self, tmp_path: Path
+        self, tmp_path: Path, storage: FilesystemStorage
     ) -> None:
         """push() should raise DatasetNotFoundError for unknown dataset name."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.exceptions import DatasetNotFoundError
-        from datacachalog.core.services import Catalog
-
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
         catalog = Catalog(datasets=[], storage=storage, cache=cache)
 
         local_file = tmp_path / "file.csv"
-        local_file.write_text("content")
+        local_file.write_bytes(b"content")
 
         with pytest.raises(DatasetNotFoundError, match="unknown"):
             catalog.push("unknown", local_file)
 
     @pytest.mark.tier(1)
     def test_push_nonexistent_file_raises_filenotfounderror(
-        self, tmp_path: Path
+        self, tmp_path: Path, storage: FilesystemStorage
     ) -> None:
         """push() should raise FileNotFoundError for missing local file."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
         remote_file = storage_dir / "data.csv"
-        remote_file.write_text("content")
+        remote_file.write_bytes(b"content")
 
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
         dataset = Dataset(
@@ -176,77 +161,49 @@ class TestPush:
             catalog.push("customers", missing_file)
 
     @pytest.mark.tier(1)
-    def test_push_calls_progress_reporter(self, tmp_path: Path) -> None:
+    def test_push_calls_progress_reporter(
+        self,
+        tmp_path: Path,
+        storage: FilesystemStorage,
+        customers_dataset: Callable[[Path, Path], Dataset],
+        tracking_reporter: Any,
+    ) -> None:
         """push() should call progress reporter during upload."""
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
-
         # Setup
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
         remote_file = storage_dir / "data.csv"
-        remote_file.write_text("original")
+        remote_file.write_bytes(b"original")
 
         local_dir = tmp_path / "local"
         local_dir.mkdir()
         local_file = local_dir / "new_data.csv"
-        content = "x" * 1000
-        local_file.write_text(content)
+        local_file.write_bytes(b"x" * 64)
 
         cache_dir = tmp_path / "cache"
-        storage = FilesystemStorage()
         cache = FileCache(cache_dir=cache_dir)
 
-        dataset = Dataset(
-            name="customers",
-            source=str(remote_file),
-            cache_path=cache_dir / "customers.csv",
-        )
+        dataset = customers_dataset(remote_file, cache_dir)
         catalog = Catalog(datasets=[dataset], storage=storage, cache=cache)
 
-        # Track progress calls
-        started_tasks: list[tuple[str, int]] = []
-        finished_tasks: list[str] = []
-        progress_calls: list[tuple[int, int]] = []
-
-        class TrackingReporter:
-            def start_task(self, name: str, total: int) -> ProgressCallback:
-                started_tasks.append((name, total))
-
-                def callback(uploaded: int, total: int) -> None:
-                    progress_calls.append((uploaded, total))
-
-                return callback
-
-            def finish_task(self, name: str) -> None:
-                finished_tasks.append(name)
-
-        reporter = TrackingReporter()
-        catalog.push("customers", local_file, progress=reporter)
+        catalog.push("customers", local_file, progress=tracking_reporter)
 
         # Assert
-        assert ("customers", 1000) in started_tasks
-        assert "customers" in finished_tasks
-        assert len(progress_calls) > 0
-        assert progress_calls[-1][0] == 1000
+        assert ("customers", 64) in tracking_reporter.started_tasks
+        assert "customers" in tracking_reporter.finished_tasks
+        assert len(tracking_reporter.done) > 0
+        assert tracking_reporter.done[-1] == 64
 
     @pytest.mark.tier(1)
     @pytest.mark.property
-    def test_push_roundtrip_property(self, tmp_path: Path) -> None:
+    def test_push_roundtrip_property(
+        self, tmp_path: Path, storage: FilesystemStorage
+    ) -> None:
         """Property: push(file) then fetch() returns same content (roundtrip invariant)."""
-        from hypothesis import given
-        from hypothesis.strategies import binary
-
-        from datacachalog.adapters.cache import FileCache
-        from datacachalog.adapters.storage import FilesystemStorage
-        from datacachalog.core.services import Catalog
 
         @given(content=binary())
         def _test_roundtrip(content: bytes) -> None:
             # Setup: create fresh directories for each hypothesis run
-            import uuid
-
             run_id = uuid.uuid4().hex[:8]
             storage_dir = tmp_path / f"storage_{run_id}"
             storage_dir.mkdir()
@@ -260,7 +217,6 @@ class TestPush:
             local_file.write_bytes(content)
 
             cache_dir = tmp_path / f"cache_{run_id}"
-            storage = FilesystemStorage()
             cache = FileCache(cache_dir=cache_dir)
 
             dataset = Dataset(
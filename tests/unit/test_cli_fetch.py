@@ -1,12 +1,19 @@
 """Tests for the CLI fetch command."""
 
+import os
+import time
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from textwrap import dedent
+from typing import Any
 
 import pytest
 from typer.testing import CliRunner
 
+from datacachalog import Catalog
 from datacachalog.cli import app
+from datacachalog.config import find_project_root
+from datacachalog.discovery import discover_catalogs, load_catalog
 
 
 runner = CliRunner()
@@ -226,257 +233,205 @@ class TestCatalogFetch:
 
     @pytest.mark.tier(2)
     def test_fetch_with_as_of_flag_resolves_version(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        session_s3_client: Any,
+        versioned_bucket: str,
     ) -> None:
         """fetch --as-of resolves and downloads correct version."""
-        from datetime import timedelta
-
-        import boto3
-        from moto import mock_aws
-
-        with mock_aws():
-            client = boto3.client("s3", region_name="us-east-1")
-            client.create_bucket(Bucket="versioned-bucket")
-            client.put_bucket_versioning(
-                Bucket="versioned-bucket",
-                VersioningConfiguration={"Status": "Enabled"},
-            )
-
-            # Upload a version
-            client.put_object(
-                Bucket="versioned-bucket", Key="data.txt", Body=b"version 1"
-            )
-
-            # Create catalog with dataset pointing to S3
-            catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
-            catalogs_dir.mkdir(parents=True)
-            (catalogs_dir / "default.py").write_text(
-                dedent("""\
-                from datacachalog import Dataset
-                datasets = [
-                    Dataset(name="data", source="s3://versioned-bucket/data.txt"),
-                ]
-            """)
-            )
+        # Upload a version
+        session_s3_client.put_object(
+            Bucket=versioned_bucket, Key="data.txt", Body=b"version 1"
+        )
+        uploaded_at = datetime.now(UTC)
 
-            (tmp_path / "data").mkdir()
-            monkeypatch.chdir(tmp_path)
+        # Create catalog with dataset pointing to S3
+        catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
+        catalogs_dir.mkdir(parents=True)
+        (catalogs_dir / "default.py").write_text(
+            dedent(f"""\
+            from datacachalog import Dataset
+            datasets = [
+                Dataset(name="data", source="s3://{versioned_bucket}/data.txt"),
+            ]
+        """)
+        )
 
-            # Get version timestamp to use for --as-of
-            from datacachalog.adapters.storage import S3Storage
+        (tmp_path / "data").mkdir()
+        monkeypatch.chdir(tmp_path)
 
-            storage = S3Storage(client=client)
-            versions = storage.list_versions("s3://versioned-bucket/data.txt")
-            v1_timestamp = versions[0].last_modified
-            future_time = v1_timestamp + timedelta(days=1)
+        # The version was written no later than uploaded_at
+        future_time = uploaded_at + timedelta(days=1)
 
-            # Format as YYYY-MM-DD for CLI
-            as_of_date = future_time.strftime("%Y-%m-%d")
+        # Format as YYYY-MM-DD for CLI
+        as_of_date = future_time.strftime("%Y-%m-%d")
 
-            result = runner.invoke(app, ["fetch", "data", "--as-of", as_of_date])
+        result = runner.invoke(app, ["fetch", "data", "--as-of", as_of_date])
 
-            assert result.exit_code == 0, f"Failed with: {result.output}"
-            # Should output path to cached file
-            assert "data" in result.output
+        assert result.exit_code == 0, f"Failed with: {result.output}"
+        # Should output path to cached file
+        assert "data" in result.output
 
     @pytest.mark.tier(1)
     def test_fetch_with_as_of_flag_date_format_parsing(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        session_s3_client: Any,
+        versioned_bucket: str,
     ) -> None:
         """Date format parsing works for YYYY-MM-DD and YYYY-MM-DDTHH:MM:SS formats."""
-        from datetime import timedelta
-
-        import boto3
-        from moto import mock_aws
-
-        with mock_aws():
-            client = boto3.client("s3", region_name="us-east-1")
-            client.create_bucket(Bucket="versioned-bucket")
-            client.put_bucket_versioning(
-                Bucket="versioned-bucket",
-                VersioningConfiguration={"Status": "Enabled"},
-            )
-
-            client.put_object(
-                Bucket="versioned-bucket", Key="data.txt", Body=b"content"
-            )
-
-            catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
-            catalogs_dir.mkdir(parents=True)
-            (catalogs_dir / "default.py").write_text(
-                dedent("""\
-                from datacachalog import Dataset
-                datasets = [
-                    Dataset(name="data", source="s3://versioned-bucket/data.txt"),
-                ]
-            """)
-            )
+        session_s3_client.put_object(
+            Bucket=versioned_bucket, Key="data.txt", Body=b"content"
+        )
+        uploaded_at = datetime.now(UTC)
 
-            (tmp_path / "data").mkdir()
-            monkeypatch.chdir(tmp_path)
+        catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
+        catalogs_dir.mkdir(parents=True)
+        (catalogs_dir / "default.py").write_text(
+            dedent(f"""\
+            from datacachalog import Dataset
+            datasets = [
+                Dataset(name="data", source="s3://{versioned_bucket}/data.txt"),
+            ]
+        """)
+        )
 
-            # Get version timestamp to use future dates
-            from datacachalog.adapters.storage import S3Storage
+        (tmp_path / "data").mkdir()
+        monkeypatch.chdir(tmp_path)
 
-            storage = S3Storage(client=client)
-            versions = storage.list_versions("s3://versioned-bucket/data.txt")
-            v1_timestamp = versions[0].last_modified
-            future_time1 = v1_timestamp + timedelta(days=1)
-            future_time2 = v1_timestamp + timedelta(days=2)
+        # The version was written no later than uploaded_at
+        future_time1 = uploaded_at + timedelta(days=1)
+        future_time2 = uploaded_at + timedelta(days=2)
 
-            # Test YYYY-MM-DD format
-            as_of_date1 = future_time1.strftime("%Y-%m-%d")
-            result1 = runner.invoke(app, ["fetch", "data", "--as-of", as_of_date1])
-            assert result1.exit_code == 0, f"Failed with: {result1.output}"
+        # Test YYYY-MM-DD format
+        as_of_date1 = future_time1.strftime("%Y-%m-%d")
+        result1 = runner.invoke(app, ["fetch", "data", "--as-of", as_of_date1])
+        assert result1.exit_code == 0, f"Failed with: {result1.output}"
 
-            # Test YYYY-MM-DDTHH:MM:SS format
-            as_of_date2 = future_time2.strftime("%Y-%m-%dT%H:%M:%S")
-            result2 = runner.invoke(app, ["fetch", "data", "--as-of", as_of_date2])
-            assert result2.exit_code == 0, f"Failed with: {result2.output}"
+        # Test YYYY-MM-DDTHH:MM:SS format
+        as_of_date2 = future_time2.strftime("%Y-%m-%dT%H:%M:%S")
+        result2 = runner.invoke(app, ["fetch", "data", "--as-of", as_of_date2])
+        assert result2.exit_code == 0, f"Failed with: {result2.output}"
 
     @pytest.mark.tier(1)
     def test_fetch_with_as_of_flag_error_when_version_not_found(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        session_s3_client: Any,
+        versioned_bucket: str,
     ) -> None:
         """Error handling when no version exists at or before specified date."""
-        import boto3
-        from moto import mock_aws
-
-        with mock_aws():
-            client = boto3.client("s3", region_name="us-east-1")
-            client.create_bucket(Bucket="versioned-bucket")
-            client.put_bucket_versioning(
-                Bucket="versioned-bucket",
-                VersioningConfiguration={"Status": "Enabled"},
-            )
-
-            # Upload a version
-            client.put_object(
-                Bucket="versioned-bucket", Key="data.txt", Body=b"content"
-            )
+        # Upload a version
+        session_s3_client.put_object(
+            Bucket=versioned_bucket, Key="data.txt", Body=b"content"
+        )
 
-            catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
-            catalogs_dir.mkdir(parents=True)
-            (catalogs_dir / "default.py").write_text(
-                dedent("""\
-                from datacachalog import Dataset
-                datasets = [
-                    Dataset(name="data", source="s3://versioned-bucket/data.txt"),
-                ]
-            """)
-            )
+        catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
+        catalogs_dir.mkdir(parents=True)
+        (catalogs_dir / "default.py").write_text(
+            dedent(f"""\
+            from datacachalog import Dataset
+            datasets = [
+                Dataset(name="data", source="s3://{versioned_bucket}/data.txt"),
+            ]
+        """)
+        )
 
-            (tmp_path / "data").mkdir()
-            monkeypatch.chdir(tmp_path)
+        (tmp_path / "data").mkdir()
+        monkeypatch.chdir(tmp_path)
 
-            # Use a date in the past before any version exists
-            result = runner.invoke(app, ["fetch", "data", "--as-of", "2020-01-01"])
+        # Use a date in the past before any version exists
+        result = runner.invoke(app, ["fetch", "data", "--as-of", "2020-01-01"])
 
-            assert result.exit_code == 1, f"Expected error but got: {result.output}"
-            assert (
-                "version" in result.output.lower()
-                or "not found" in result.output.lower()
-            )
+        assert result.exit_code == 1, f"Expected error but got: {result.output}"
+        assert (
+            "version" in result.output.lower() or "not found" in result.output.lower()
+        )
 
     @pytest.mark.tier(1)
     def test_fetch_with_as_of_flag_mutually_exclusive_with_version_id(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        session_s3_client: Any,
+        versioned_bucket: str,
     ) -> None:
         """--as-of and --version-id cannot be used together."""
-        import boto3
-        from moto import mock_aws
-
-        with mock_aws():
-            client = boto3.client("s3", region_name="us-east-1")
-            client.create_bucket(Bucket="versioned-bucket")
-            client.put_bucket_versioning(
-                Bucket="versioned-bucket",
-                VersioningConfiguration={"Status": "Enabled"},
-            )
+        session_s3_client.put_object(
+            Bucket=versioned_bucket, Key="data.txt", Body=b"content"
+        )
 
-            client.put_object(
-                Bucket="versioned-bucket", Key="data.txt", Body=b"content"
-            )
+        catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
+        catalogs_dir.mkdir(parents=True)
+        (catalogs_dir / "default.py").write_text(
+            dedent(f"""\
+            from datacachalog import Dataset
+            datasets = [
+                Dataset(name="data", source="s3://{versioned_bucket}/data.txt"),
+            ]
+        """)
+        )
 
-            catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
-            catalogs_dir.mkdir(parents=True)
-            (catalogs_dir / "default.py").write_text(
-                dedent("""\
-                from datacachalog import Dataset
-                datasets = [
-                    Dataset(name="data", source="s3://versioned-bucket/data.txt"),
-                ]
-            """)
-            )
+        (tmp_path / "data").mkdir()
+        monkeypatch.chdir(tmp_path)
 
-            (tmp_path / "data").mkdir()
-            monkeypatch.chdir(tmp_path)
-
-            result = runner.invoke(
-                app,
-                [
-                    "fetch",
-                    "data",
-                    "--as-of",
-                    "2024-12-10",
-                    "--version-id",
-                    "some-version-id",
-                ],
-            )
+        result = runner.invoke(
+            app,
+            [
+                "fetch",
+                "data",
+                "--as-of",
+                "2024-12-10",
+                "--version-id",
+                "some-version-id",
+            ],
+        )
 
-            assert result.exit_code == 1, f"Expected error but got: {result.output}"
-            assert "mutually exclusive" in result.output.lower() or (
-                "as-of" in result.output.lower()
-                and "version-id" in result.output.lower()
-            )
+        assert result.exit_code == 1, f"Expected error but got: {result.output}"
+        assert "mutually exclusive" in result.output.lower() or (
+            "as-of" in result.output.lower() and "version-id" in result.output.lower()
+        )
 
     @pytest.mark.tier(1)
     def test_fetch_with_as_of_flag_cannot_use_with_all(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        session_s3_client: Any,
+        versioned_bucket: str,
     ) -> None:
         """--as-of cannot be used with --all flag."""
-        import boto3
-        from moto import mock_aws
-
-        with mock_aws():
-            client = boto3.client("s3", region_name="us-east-1")
-            client.create_bucket(Bucket="versioned-bucket")
-            client.put_bucket_versioning(
-                Bucket="versioned-bucket",
-                VersioningConfiguration={"Status": "Enabled"},
-            )
-
-            client.put_object(
-                Bucket="versioned-bucket", Key="data.txt", Body=b"content"
-            )
+        session_s3_client.put_object(
+            Bucket=versioned_bucket, Key="data.txt", Body=b"content"
+        )
 
-            catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
-            catalogs_dir.mkdir(parents=True)
-            (catalogs_dir / "default.py").write_text(
-                dedent("""\
-                from datacachalog import Dataset
-                datasets = [
-                    Dataset(name="data", source="s3://versioned-bucket/data.txt"),
-                ]
-            """)
-            )
+        catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
+        catalogs_dir.mkdir(parents=True)
+        (catalogs_dir / "default.py").write_text(
+            dedent(f"""\
+            from datacachalog import Dataset
+            datasets = [
+                Dataset(name="data", source="s3://{versioned_bucket}/data.txt"),
+            ]
+        """)
+        )
 
-            (tmp_path / "data").mkdir()
-            monkeypatch.chdir(tmp_path)
+        (tmp_path / "data").mkdir()
+        monkeypatch.chdir(tmp_path)
 
-            result = runner.invoke(app, ["fetch", "--all", "--as-of", "2024-12-10"])
+        result = runner.invoke(app, ["fetch", "--all", "--as-of", "2024-12-10"])
 
-            assert result.exit_code == 1, f"Expected error but got: {result.output}"
-            assert "as-of" in result.output.lower() or "all" in result.output.lower()
+        assert result.exit_code == 1, f"Expected error but got: {result.output}"
+        assert "as-of" in result.output.lower() or "all" in result.output.lower()
 
     @pytest.mark.tier(1)
     def test_fetch_dry_run_shows_stale_status_without_downloading(
         self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """dry-run shows stale status without downloading or modifying cache."""
-        import os
-        import time
-
         # Create source file
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
@@ -507,10 +462,6 @@ class TestCatalogFetch:
         os.utime(source_file, (future_time, future_time))
 
         # Get cache state before dry-run
-        from datacachalog import Catalog
-        from datacachalog.config import find_project_root
-        from datacachalog.discovery import discover_catalogs, load_catalog
-
         root = find_project_root()
         catalogs = discover_catalogs(root)
         all_ds = []
@@ -607,104 +558,81 @@ class TestCatalogFetch:
 
     @pytest.mark.tier(1)
     def test_fetch_dry_run_with_as_of_flag(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        session_s3_client: Any,
+        versioned_bucket: str,
     ) -> None:
         """dry-run with --as-of checks version without downloading."""
-        from datetime import timedelta
-
-        import boto3
-        from moto import mock_aws
-
-        with mock_aws():
-            client = boto3.client("s3", region_name="us-east-1")
-            client.create_bucket(Bucket="versioned-bucket")
-            client.put_bucket_versioning(
-                Bucket="versioned-bucket",
-                VersioningConfiguration={"Status": "Enabled"},
-            )
-
-            client.put_object(
-                Bucket="versioned-bucket", Key="data.txt", Body=b"content"
-            )
-
-            catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
-            catalogs_dir.mkdir(parents=True)
-            (catalogs_dir / "default.py").write_text(
-                dedent("""\
-                from datacachalog import Dataset
-                datasets = [
-                    Dataset(name="data", source="s3://versioned-bucket/data.txt"),
-                ]
-            """)
-            )
+        session_s3_client.put_object(
+            Bucket=versioned_bucket, Key="data.txt", Body=b"content"
+        )
+        uploaded_at = datetime.now(UTC)
 
-            (tmp_path / "data").mkdir()
-            monkeypatch.chdir(tmp_path)
+        catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
+        catalogs_dir.mkdir(parents=True)
+        (catalogs_dir / "default.py").write_text(
+            dedent(f"""\
+            from datacachalog import Dataset
+            datasets = [
+                Dataset(name="data", source="s3://{versioned_bucket}/data.txt"),
+            ]
+        """)
+        )
 
-            # Get version timestamp
-            from datacachalog.adapters.storage import S3Storage
+        (tmp_path / "data").mkdir()
+        monkeypatch.chdir(tmp_path)
 
-            storage = S3Storage(client=client)
-            versions = storage.list_versions("s3://versioned-bucket/data.txt")
-            v1_timestamp = versions[0].last_modified
-            future_time = v1_timestamp + timedelta(days=1)
-            as_of_date = future_time.strftime("%Y-%m-%d")
+        # The version was written no later than uploaded_at
+        future_time = uploaded_at + timedelta(days=1)
+        as_of_date = future_time.strftime("%Y-%m-%d")
 
-            result = runner.invoke(
-                app, ["fetch", "data", "--dry-run", "--as-of", as_of_date]
-            )
+        result = runner.invoke(
+            app, ["fetch", "data", "--dry-run", "--as-of", as_of_date]
+        )
 
-            assert result.exit_code == 0, f"Failed with: {result.output}"
+        assert result.exit_code == 0, f"Failed with: {result.output}"
 
     @pytest.mark.tier(1)
     def test_fetch_dry_run_with_version_id_flag(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        session_s3_client: Any,
+        versioned_bucket: str,
     ) -> None:
         """dry-run with --version-id checks version without downloading."""
-        import boto3
-        from moto import mock_aws
-
-        with mock_aws():
-            client = boto3.client("s3", region_name="us-east-1")
-            client.create_bucket(Bucket="versioned-bucket")
-            client.put_bucket_versioning(
-                Bucket="versioned-bucket",
-                VersioningConfiguration={"Status": "Enabled"},
-            )
+        resp = session_s3_client.put_object(
+            Bucket=versioned_bucket, Key="data.txt", Body=b"content"
+        )
+        version_id = resp["VersionId"]
 
-            resp = client.put_object(
-                Bucket="versioned-bucket", Key="data.txt", Body=b"content"
-            )
-            version_id = resp["VersionId"]
-
-            catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
-            catalogs_dir.mkdir(parents=True)
-            (catalogs_dir / "default.py").write_text(
-                dedent("""\
-                from datacachalog import Dataset
-                datasets = [
-                    Dataset(name="data", source="s3://versioned-bucket/data.txt"),
-                ]
-            """)
-            )
+        catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
+        catalogs_dir.mkdir(parents=True)
+        (catalogs_dir / "default.py").write_text(
+            dedent(f"""\
+            from datacachalog import Dataset
+            datasets = [
+                Dataset(name="data", source="s3://{versioned_bucket}/data.txt"),
+            ]
+        """)
+        )
 
-            (tmp_path / "data").mkdir()
-            monkeypatch.chdir(tmp_path)
+        (tmp_path / "data").mkdir()
+        monkeypatch.chdir(tmp_path)
 
-            result = runner.invoke(
-                app, ["fetch", "data", "--dry-run", "--version-id", version_id]
-            )
+        result = runner.invoke(
+            app, ["fetch", "data", "--dry-run", "--version-id", version_id]
+        )
 
-            assert result.exit_code == 0, f"Failed with: {result.output}"
+        assert result.exit_code == 0, f"Failed with: {result.output}"
 
     @pytest.mark.tier(1)
     def test_fetch_dry_run_does_not_modify_cache(
         self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Multiple dry-run calls should not modify cache state."""
-        import os
-        import time
-
         # Create source file
         storage_dir = tmp_path / "storage"
         storage_dir.mkdir()
@@ -735,10 +663,6 @@ class TestCatalogFetch:
         os.utime(source_file, (future_time, future_time))
 
         # Get cache state before dry-runs
-        from datacachalog import Catalog
-        from datacachalog.config import find_project_root
-        from datacachalog.discovery import discover_catalogs, load_catalog
-
         root = find_project_root()
         catalogs = discover_catalogs(root)
         all_ds = []
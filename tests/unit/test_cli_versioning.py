@@ -2,6 +2,7 @@
 
 from pathlib import Path
 from textwrap import dedent
+from typing import Any
 
 import pytest
 from typer.testing import CliRunner
@@ -19,300 +20,267 @@ class TestCatalogVersions:
     """Tests for catalog versions command."""
 
     def test_versions_shows_version_list(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        session_s3_client: Any,
+        versioned_bucket: str,
     ) -> None:
         """versions command lists available versions with dates."""
-        import boto3
-        from moto import mock_aws
-
-        with mock_aws():
-            # Setup versioned S3 bucket
-            client = boto3.client("s3", region_name="us-east-1")
-            client.create_bucket(Bucket="versioned-bucket")
-            client.put_bucket_versioning(
-                Bucket="versioned-bucket",
-                VersioningConfiguration={"Status": "Enabled"},
-            )
+        # Upload multiple versions
+        session_s3_client.put_object(
+            Bucket=versioned_bucket, Key="data.txt", Body=b"v1"
+        )
+        session_s3_client.put_object(
+            Bucket=versioned_bucket, Key="data.txt", Body=b"v2"
+        )
+        session_s3_client.put_object(
+            Bucket=versioned_bucket, Key="data.txt", Body=b"v3"
+        )
 
-            # Upload multiple versions
-            client.put_object(Bucket="versioned-bucket", Key="data.txt", Body=b"v1")
-            client.put_object(Bucket="versioned-bucket", Key="data.txt", Body=b"v2")
-            client.put_object(Bucket="versioned-bucket", Key="data.txt", Body=b"v3")
-
-            # Create catalog with dataset pointing to S3
-            catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
-            catalogs_dir.mkdir(parents=True)
-            (catalogs_dir / "default.py").write_text(
-                dedent("""\
-                from datacachalog import Dataset
-                datasets = [
-                    Dataset(name="data", source="s3://versioned-bucket/data.txt"),
-                ]
-            """)
-            )
+        # Create catalog with dataset pointing to S3
+        catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
+        catalogs_dir.mkdir(parents=True)
+        (catalogs_dir / "default.py").write_text(
+            dedent(f"""\
+            from datacachalog import Dataset
+            datasets = [
+                Dataset(name="data", source="s3://{versioned_bucket}/data.txt"),
+            ]
+        """)
+        )
 
-            (tmp_path / "data").mkdir()
-            monkeypatch.chdir(tmp_path)
+        (tmp_path / "data").mkdir()
+        monkeypatch.chdir(tmp_path)
 
-            result = runner.invoke(app, ["versions", "data"])
+        result = runner.invoke(app, ["versions", "data"])
 
-            assert result.exit_code == 0, f"Failed with: {result.output}"
-            assert "Versions for 'data'" in result.output
-            # Should show dates (YYYY-MM-DD format)
-            assert (
-                "202" in result.output
-                or "2024" in result.output
-                or "2025" in result.output
-            )
+        assert result.exit_code == 0, f"Failed with: {result.output}"
+        assert "Versions for 'data'" in result.output
+        # Should show dates (YYYY-MM-DD format)
+        assert (
+            "202" in result.output or "2024" in result.output or "2025" in result.output
+        )
 
     def test_versions_hides_version_id_by_default(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        session_s3_client: Any,
+        versioned_bucket: str,
     ) -> None:
         """Version ID is not shown in default output."""
-        import boto3
-        from moto import mock_aws
-
-        with mock_aws():
-            client = boto3.client("s3", region_name="us-east-1")
-            client.create_bucket(Bucket="versioned-bucket")
-            client.put_bucket_versioning(
-                Bucket="versioned-bucket",
-                VersioningConfiguration={"Status": "Enabled"},
-            )
+        resp = session_s3_client.put_object(
+            Bucket=versioned_bucket, Key="data.txt", Body=b"v1"
+        )
+        version_id = resp["VersionId"]
 
-            resp = client.put_object(
-                Bucket="versioned-bucket", Key="data.txt", Body=b"v1"
-            )
-            version_id = resp["VersionId"]
-
-            catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
-            catalogs_dir.mkdir(parents=True)
-            (catalogs_dir / "default.py").write_text(
-                dedent("""\
-                from datacachalog import Dataset
-                datasets = [
-                    Dataset(name="data", source="s3://versioned-bucket/data.txt"),
-                ]
-            """)
-            )
+        catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
+        catalogs_dir.mkdir(parents=True)
+        (catalogs_dir / "default.py").write_text(
+            dedent(f"""\
+            from datacachalog import Dataset
+            datasets = [
+                Dataset(name="data", source="s3://{versioned_bucket}/data.txt"),
+            ]
+        """)
+        )
 
-            (tmp_path / "data").mkdir()
-            monkeypatch.chdir(tmp_path)
+        (tmp_path / "data").mkdir()
+        monkeypatch.chdir(tmp_path)
 
-            result = runner.invoke(app, ["versions", "data"])
+        result = runner.invoke(app, ["versions", "data"])
 
-            assert result.exit_code == 0, f"Failed with: {result.output}"
-            # Version ID should NOT be in output
-            # Expected format: "  YYYY-MM-DD HH:MM:SS  size [flags]"
-            assert version_id not in result.output, (
-                f"Version ID {version_id} should not be in output"
-            )
-            # Also verify the format: should have date, then size, without version_id in between
-            output_lines = [
-                line.strip()
-                for line in result.output.split("\n")
-                if line.strip()
-                and not line.startswith("Versions for")
-                and not line.startswith("No versions")
-            ]
-            assert len(output_lines) > 0, "Should have at least one version line"
-            # Each line should match: date (YYYY-MM-DD HH:MM:SS) followed by size
-            # Should NOT have a long alphanumeric string (version_id) between them
-            for line in output_lines:
-                # Split by whitespace - should have: date, time, size_number, "bytes", optionally flags
-                parts = line.split()
-                # After date/time (first 2 parts), next should be size number, not a version_id
-                # Version IDs are typically UUIDs or long strings - check that part[2] is a number or "unknown"
-                if len(parts) >= 3:
-                    # parts[0] = date, parts[1] = time, parts[2] should be size number or "unknown"
-                    # If parts[2] looks like a version_id (long alphanumeric), that's wrong
-                    third_part = parts[2]
-                    # Version IDs are typically non-numeric, so if it's not a number and not "unknown", it might be version_id
-                    if (
-                        not third_part.replace(",", "").isdigit()
-                        and third_part != "unknown"
-                        and len(third_part) > 10
-                    ):
-                        # This is likely a version_id, which should not be there
-                        raise AssertionError(
-                            f"Found potential version_id in output: {third_part}"
-                        )
+        assert result.exit_code == 0, f"Failed with: {result.output}"
+        # Version ID should NOT be in output
+        # Expected format: "  YYYY-MM-DD HH:MM:SS  size [flags]"
+        assert version_id not in result.output, (
+            f"Version ID {version_id} should not be in output"
+        )
+        # Also verify the format: should have date, then size, without version_id in between
+        output_lines = [
+            line.strip()
+            for line in result.output.split("\n")
+            if line.strip()
+            and not line.startswith("Versions for")
+            and not line.startswith("No versions")
+        ]
+        assert len(output_lines) > 0, "Should have at least one version line"
+        # Each line should match: date (YYYY-MM-DD HH:MM:SS) followed by size
+        # Should NOT have a long alphanumeric string (version_id) between them
+        for line in output_lines:
+            # Split by whitespace - should have: date, time, size_number, "bytes", optionally flags
+            parts = line.split()
+            # After date/time (first 2 parts), next should be size number, not a version_id
+            # Version IDs are typically UUIDs or long strings - check that part[2] is a number or "unknown"
+            if len(parts) >= 3:
+                # parts[0] = date, parts[1] = time, parts[2] should be size number or "unknown"
+                # If parts[2] looks like a version_id (long alphanumeric), that's wrong
+                third_part = parts[2]
+                # Version IDs are typically non-numeric, so if it's not a number and not "unknown", it might be version_id
+                if (
+                    not third_part.replace(",", "").isdigit()
+                    and third_part != "unknown"
+                    and len(third_part) > 10
+                ):
+                    # This is likely a version_id, which should not be there
+                    raise AssertionError(
+                        f"Found potential version_id in output: {third_part}"
+                    )
 
     def test_versions_shows_date_as_primary(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        session_s3_client: Any,
+        versioned_bucket: str,
     ) -> None:
         """Date/timestamp is the primary identifier in output."""
-        import boto3
-        from moto import mock_aws
-
-        with mock_aws():
-            client = boto3.client("s3", region_name="us-east-1")
-            client.create_bucket(Bucket="versioned-bucket")
-            client.put_bucket_versioning(
-                Bucket="versioned-bucket",
-                VersioningConfiguration={"Status": "Enabled"},
-            )
+        session_s3_client.put_object(
+            Bucket=versioned_bucket, Key="data.txt", Body=b"v1"
+        )
 
-            client.put_object(Bucket="versioned-bucket", Key="data.txt", Body=b"v1")
-
-            catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
-            catalogs_dir.mkdir(parents=True)
-            (catalogs_dir / "default.py").write_text(
-                dedent("""\
-                from datacachalog import Dataset
-                datasets = [
-                    Dataset(name="data", source="s3://versioned-bucket/data.txt"),
-                ]
-            """)
-            )
+        catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
+        catalogs_dir.mkdir(parents=True)
+        (catalogs_dir / "default.py").write_text(
+            dedent(f"""\
+            from datacachalog import Dataset
+            datasets = [
+                Dataset(name="data", source="s3://{versioned_bucket}/data.txt"),
+            ]
+        """)
+        )
 
-            (tmp_path / "data").mkdir()
-            monkeypatch.chdir(tmp_path)
+        (tmp_path / "data").mkdir()
+        monkeypatch.chdir(tmp_path)
 
-            result = runner.invoke(app, ["versions", "data"])
+        result = runner.invoke(app, ["versions", "data"])
 
-            assert result.exit_code == 0, f"Failed with: {result.output}"
-            # Date should be at the start of each version line
-            # Format should be: "  YYYY-MM-DD HH:MM:SS  size [flags]"
-            output_lines = [
-                line
-                for line in result.output.split("\n")
-                if line.strip() and not line.startswith("Versions for")
-            ]
-            assert len(output_lines) > 0, "Should have at least one version line"
-            # First non-header line should start with date format
-            first_version_line = output_lines[0]
-            # Should start with spaces, then date (YYYY-MM-DD)
-            assert first_version_line.strip().startswith(
-                "202"
-            ) or first_version_line.strip().startswith("20")
+        assert result.exit_code == 0, f"Failed with: {result.output}"
+        # Date should be at the start of each version line
+        # Format should be: "  YYYY-MM-DD HH:MM:SS  size [flags]"
+        output_lines = [
+            line
+            for line in result.output.split("\n")
+            if line.strip() and not line.startswith("Versions for")
+        ]
+        assert len(output_lines) > 0, "Should have at least one version line"
+        # First non-header line should start with date format
+        first_version_line = output_lines[0]
+        # Should start with spaces, then date (YYYY-MM-DD)
+        assert first_version_line.strip().startswith(
+            "202"
+        ) or first_version_line.strip().startswith("20")
 
     def test_versions_respects_limit_flag(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        session_s3_client: Any,
+        versioned_bucket: str,
     ) -> None:
         """--limit flag limits number of versions shown."""
-        import boto3
-        from moto import mock_aws
-
-        with mock_aws():
-            client = boto3.client("s3", region_name="us-east-1")
-            client.create_bucket(Bucket="versioned-bucket")
-            client.put_bucket_versioning(
-                Bucket="versioned-bucket",
-                VersioningConfiguration={"Status": "Enabled"},
+        # Upload 5 versions
+        for i in range(5):
+            session_s3_client.put_object(
+                Bucket=versioned_bucket, Key="data.txt", Body=f"v{i}".encode()
             )
 
-            # Upload 5 versions
-            for i in range(5):
-                client.put_object(
-                    Bucket="versioned-bucket", Key="data.txt", Body=f"v{i}".encode()
-                )
-
-            catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
-            catalogs_dir.mkdir(parents=True)
-            (catalogs_dir / "default.py").write_text(
-                dedent("""\
-                from datacachalog import Dataset
-                datasets = [
-                    Dataset(name="data", source="s3://versioned-bucket/data.txt"),
-                ]
-            """)
-            )
+        catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
+        catalogs_dir.mkdir(parents=True)
+        (catalogs_dir / "default.py").write_text(
+            dedent(f"""\
+            from datacachalog import Dataset
+            datasets = [
+                Dataset(name="data", source="s3://{versioned_bucket}/data.txt"),
+            ]
+        """)
+        )
 
-            (tmp_path / "data").mkdir()
-            monkeypatch.chdir(tmp_path)
+        (tmp_path / "data").mkdir()
+        monkeypatch.chdir(tmp_path)
 
-            result = runner.invoke(app, ["versions", "data", "--limit", "3"])
+        result = runner.invoke(app, ["versions", "data", "--limit", "3"])
 
-            assert result.exit_code == 0, f"Failed with: {result.output}"
-            # Count version lines (excluding header)
-            version_lines = [
-                line
-                for line in result.output.split("\n")
-                if line.strip()
-                and not line.startswith("Versions for")
-                and not line.startswith("No versions")
-            ]
-            assert len(version_lines) == 3, (
-                f"Expected 3 versions, got {len(version_lines)}"
-            )
+        assert result.exit_code == 0, f"Failed with: {result.output}"
+        # Count version lines (excluding header)
+        version_lines = [
+            line
+            for line in result.output.split("\n")
+            if line.strip()
+            and not line.startswith("Versions for")
+            and not line.startswith("No versions")
+        ]
+        assert len(version_lines) == 3, f"Expected 3 versions, got {len(version_lines)}"
 
     def test_versions_shows_latest_flag(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        session_s3_client: Any,
+        versioned_bucket: str,
     ) -> None:
         """Latest version is marked with 'latest' flag."""
-        import boto3
-        from moto import mock_aws
-
-        with mock_aws():
-            client = boto3.client("s3", region_name="us-east-1")
-            client.create_bucket(Bucket="versioned-bucket")
-            client.put_bucket_versioning(
-                Bucket="versioned-bucket",
-                VersioningConfiguration={"Status": "Enabled"},
-            )
+        session_s3_client.put_object(
+            Bucket=versioned_bucket, Key="data.txt", Body=b"v1"
+        )
+        session_s3_client.put_object(
+            Bucket=versioned_bucket, Key="data.txt", Body=b"v2"
+        )
 
-            client.put_object(Bucket="versioned-bucket", Key="data.txt", Body=b"v1")
-            client.put_object(Bucket="versioned-bucket", Key="data.txt", Body=b"v2")
-
-            catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
-            catalogs_dir.mkdir(parents=True)
-            (catalogs_dir / "default.py").write_text(
-                dedent("""\
-                from datacachalog import Dataset
-                datasets = [
-                    Dataset(name="data", source="s3://versioned-bucket/data.txt"),
-                ]
-            """)
-            )
+        catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
+        catalogs_dir.mkdir(parents=True)
+        (catalogs_dir / "default.py").write_text(
+            dedent(f"""\
+            from datacachalog import Dataset
+            datasets = [
+                Dataset(name="data", source="s3://{versioned_bucket}/data.txt"),
+            ]
+        """)
+        )
 
-            (tmp_path / "data").mkdir()
-            monkeypatch.chdir(tmp_path)
+        (tmp_path / "data").mkdir()
+        monkeypatch.chdir(tmp_path)
 
-            result = runner.invoke(app, ["versions", "data"])
+        result = runner.invoke(app, ["versions", "data"])
 
-            assert result.exit_code == 0, f"Failed with: {result.output}"
-            # Should show "latest" flag for the newest version
-            assert "latest" in result.output.lower()
+        assert result.exit_code == 0, f"Failed with: {result.output}"
+        # Should show "latest" flag for the newest version
+        assert "latest" in result.output.lower()
 
     def test_versions_shows_deleted_flag(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        session_s3_client: Any,
+        versioned_bucket: str,
     ) -> None:
         """Delete markers are marked with 'deleted' flag."""
-        import boto3
-        from moto import mock_aws
-
-        with mock_aws():
-            client = boto3.client("s3", region_name="us-east-1")
-            client.create_bucket(Bucket="versioned-bucket")
-            client.put_bucket_versioning(
-                Bucket="versioned-bucket",
-                VersioningConfiguration={"Status": "Enabled"},
-            )
+        session_s3_client.put_object(
+            Bucket=versioned_bucket, Key="data.txt", Body=b"v1"
+        )
+        # Delete the object (creates delete marker)
+        session_s3_client.delete_object(Bucket=versioned_bucket, Key="data.txt")
 
-            client.put_object(Bucket="versioned-bucket", Key="data.txt", Body=b"v1")
-            # Delete the object (creates delete marker)
-            client.delete_object(Bucket="versioned-bucket", Key="data.txt")
-
-            catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
-            catalogs_dir.mkdir(parents=True)
-            (catalogs_dir / "default.py").write_text(
-                dedent("""\
-                from datacachalog import Dataset
-                datasets = [
-                    Dataset(name="data", source="s3://versioned-bucket/data.txt"),
-                ]
-            """)
-            )
+        catalogs_dir = tmp_path / ".datacachalog" / "catalogs"
+        catalogs_dir.mkdir(parents=True)
+        (catalogs_dir / "default.py").write_text(
+            dedent(f"""\
+            from datacachalog import Dataset
+            datasets = [
+                Dataset(name="data", source="s3://{versioned_bucket}/data.txt"),
+            ]
+        """)
+        )
 
-            (tmp_path / "data").mkdir()
-            monkeypatch.chdir(tmp_path)
+        (tmp_path / "data").mkdir()
+        monkeypatch.chdir(tmp_path)
 
-            result = runner.invoke(app, ["versions", "data"])
+        result = runner.invoke(app, ["versions", "data"])
 
-            assert result.exit_code == 0, f"Failed with: {result.output}"
-            # Should show "deleted" flag for delete marker
-            assert "deleted" in result.output.lower()
+        assert result.exit_code == 0, f"Failed with: {result.output}"
+        # Should show "deleted" flag for delete marker
+        assert "deleted" in result.output.lower()
 
     def test_versions_dataset_not_found(
         self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
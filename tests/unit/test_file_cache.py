@@ -1,5 +1,6 @@
 """Unit tests for FileCache adapter."""
 
+import os
 import shutil
 from datetime import UTC, datetime
 from pathlib import Path
@@ -47,6 +48,13 @@ class TestGet:
         (tmp_path / "orphan").write_text("data")
         assert cache.get("orphan") is None
 
+    def test_get_returns_none_when_data_file_missing(self, tmp_path: Path) -> None:
+        """get() should return None, not read a sidecar left behind by its file."""
+
+        cache = FileCache(cache_dir=tmp_path)
+        (tmp_path / "orphan.meta.json").write_text("not json")
+        assert cache.get("orphan") is None
+
 
 @pytest.mark.cache
 @pytest.mark.tra("Adapter.FileCache")
@@ -70,6 +78,50 @@ class TestPut:
         assert path.read_text() == "data"
         assert retrieved_meta.etag == '"abc123"'
 
+    def test_put_failure_keeps_previous_entry(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A failed put() should leave the old entry intact and no temp files."""
+
+        cache = FileCache(cache_dir=tmp_path / "cache")
+        source = tmp_path / "source.txt"
+        source.write_text("old")
+        meta = CacheMetadata(etag='"old"')
+        cache.put("key", source, meta)
+        old_entry = cache.get("key")
+
+        def failing_copy(_src: Path, dst: Path) -> None:
+            Path(dst).write_text("partial")
+            raise OSError("disk full")
+
+        monkeypatch.setattr(shutil, "copy2", failing_copy)
+        source.write_text("new")
+        with pytest.raises(OSError, match="disk full"):
+            cache.put("key", source, CacheMetadata(etag='"new"'))
+
+        assert cache.get("key") == old_entry
+        assert old_entry is not None
+        assert old_entry[0].read_text() == "old"
+        assert sorted(p.name for p in (tmp_path / "cache").iterdir()) == [
+            "key",
+            "key.meta.json",
+        ]
+
+    def test_put_honours_umask(self, tmp_path: Path) -> None:
+        """Cached files and sidecars should get the umask's mode, not 0o600."""
+        previous = os.umask(0o027)
+        try:
+            cache = FileCache(cache_dir=tmp_path / "cache")
+            source = tmp_path / "source.txt"
+            source.write_text("data")
+            cache.put("key", source, CacheMetadata(etag='"abc"'))
+        finally:
+            os.umask(previous)
+
+        for name in ("key", "key.meta.json"):
+            mode = (tmp_path / "cache" / name).stat().st_mode & 0o777
+            assert mode == 0o640, f"{name}: {oct(mode)}"
+
     def test_put_preserves_all_metadata_fields(self, tmp_path: Path) -> None:
         """put() should preserve all CacheMetadata fields in the sidecar."""
 
@@ -211,6 +263,58 @@ class TestInvalidatePrefix:
         assert cache.get("logs/2024/02/data.parquet") is None
 
 
+@pytest.mark.cache
+@pytest.mark.tra("Adapter.FileCache")
+@pytest.mark.tier(1)
+class TestFingerprint:
+    """Tests for fingerprint() and verify_unchanged() methods."""
+
+    def test_fingerprint_returns_none_when_not_cached(self, tmp_path: Path) -> None:
+        """fingerprint() should return None for keys not in cache."""
+
+        cache = FileCache(cache_dir=tmp_path)
+        assert cache.fingerprint("missing") is None
+        assert cache.verify_unchanged("missing", None)
+
+    def test_verify_unchanged_true_when_entry_untouched(self, tmp_path: Path) -> None:
+        """verify_unchanged() should be True when the entry was not rewritten."""
+
+        cache = FileCache(cache_dir=tmp_path / "cache")
+        source = tmp_path / "source.txt"
+        source.write_text("data")
+        cache.put("mykey", source, CacheMetadata(etag='"abc"'))
+
+        prior = cache.fingerprint("mykey")
+        assert prior is not None
+        cache.get("mykey")
+        assert cache.verify_unchanged("mykey", prior)
+
+    def test_verify_unchanged_false_after_put(self, tmp_path: Path) -> None:
+        """verify_unchanged() should be False after the entry is rewritten."""
+
+        cache = FileCache(cache_dir=tmp_path / "cache")
+        source = tmp_path / "source.txt"
+        source.write_text("data")
+        cache.put("mykey", source, CacheMetadata(etag='"abc"'))
+        prior = cache.fingerprint("mykey")
+
+        source.write_text("new data")
+        cache.put("mykey", source, CacheMetadata(etag='"def456"'))
+        assert not cache.verify_unchanged("mykey", prior)
+
+    def test_verify_unchanged_false_after_invalidate(self, tmp_path: Path) -> None:
+        """verify_unchanged() should be False once the entry is removed."""
+
+        cache = FileCache(cache_dir=tmp_path / "cache")
+        source = tmp_path / "source.txt"
+        source.write_text("data")
+        cache.put("mykey", source, CacheMetadata(etag='"abc"'))
+        prior = cache.fingerprint("mykey")
+
+        cache.invalidate("mykey")
+        assert not cache.verify_unchanged("mykey", prior)
+
+
 @pytest.mark.cache
 @pytest.mark.tra("Adapter.FileCache")
 @pytest.mark.tier(1)
@@ -50,6 +50,57 @@ class TestHead:
         # S3 ETags are quoted
         assert metadata.etag == f'"{expected_md5}"'
 
+    def test_head_memoizes_etag_until_file_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """head() should hash a settled file once and rehash after a rewrite."""
+        from datacachalog.adapters.storage import FilesystemStorage, filesystem
+
+        hashed: list[Path] = []
+        real_md5_etag = filesystem._md5_etag
+
+        def counting_md5_etag(path: Path) -> str:
+            hashed.append(path)
+            return real_md5_etag(path)
+
+        monkeypatch.setattr(filesystem, "_md5_etag", counting_md5_etag)
+        monkeypatch.setattr(filesystem, "_RACY_WINDOW_NS", -1)
+
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("hello")
+        storage = FilesystemStorage()
+
+        first = storage.head(str(test_file))
+        assert storage.head(str(test_file)) == first
+        assert len(hashed) == 1
+
+        test_file.write_text("hello, world")
+        assert storage.head(str(test_file)).etag != first.etag
+        assert len(hashed) == 2
+
+    def test_head_rehashes_recently_modified_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A file changed within the racy window should never use the memo."""
+        from datacachalog.adapters.storage import FilesystemStorage, filesystem
+
+        hashed: list[Path] = []
+        real_md5_etag = filesystem._md5_etag
+
+        def counting_md5_etag(path: Path) -> str:
+            hashed.append(path)
+            return real_md5_etag(path)
+
+        monkeypatch.setattr(filesystem, "_md5_etag", counting_md5_etag)
+
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("hello")
+        storage = FilesystemStorage()
+        storage.head(str(test_file))
+        storage.head(str(test_file))
+
+        assert len(hashed) == 2
+
     def test_head_file_not_found_raises_storage_not_found(self, tmp_path: Path) -> None:
         """head() should raise StorageNotFoundError for missing files."""
         from datacachalog.adapters.storage import FilesystemStorage
@@ -107,6 +158,116 @@ class TestDownload:
         assert progress_calls[-1][0] == 1000
         assert progress_calls[-1][1] == 1000
 
+    def test_download_falls_back_when_kernel_copy_unsupported(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """download() should fall back to a chunked copy if the kernel refuses."""
+        import errno
+        import os
+
+        from datacachalog.adapters.storage import FilesystemStorage, filesystem
+
+        def refuse(*args: object) -> int:
+            raise OSError(errno.EXDEV, "cross-device copy")
+
+        monkeypatch.setattr(filesystem, "_reflink", lambda src, dst: False)
+        monkeypatch.setattr(os, "copy_file_range", refuse, raising=False)
+
+        source = tmp_path / "source.txt"
+        dest = tmp_path / "dest.txt"
+        source.write_bytes(b"x" * 1000)
+        progress_calls: list[tuple[int, int]] = []
+
+        storage = FilesystemStorage()
+        storage.download(
+            str(source), dest, progress=lambda d, t: progress_calls.append((d, t))
+        )
+
+        assert dest.read_bytes() == b"x" * 1000
+        assert progress_calls[-1] == (1000, 1000)
+
+    def test_download_falls_back_when_kernel_copy_moves_nothing(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """download() should not leave an empty file if copy_file_range returns 0."""
+        import os
+
+        from datacachalog.adapters.storage import FilesystemStorage, filesystem
+
+        monkeypatch.setattr(filesystem, "_reflink", lambda src, dst: False)
+        monkeypatch.setattr(os, "copy_file_range", lambda *args: 0, raising=False)
+
+        source = tmp_path / "source.txt"
+        dest = tmp_path / "dest.txt"
+        source.write_bytes(b"x" * 1000)
+
+        FilesystemStorage().download(str(source), dest, progress=lambda x, y: None)
+
+        assert dest.read_bytes() == b"x" * 1000
+
+    def test_download_restarts_after_short_kernel_copy(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A copy_file_range that stops partway should not corrupt dest."""
+        import os
+
+        from datacachalog.adapters.storage import FilesystemStorage, filesystem
+
+        real_copy_file_range = os.copy_file_range
+        calls = 0
+
+        def copy_once(src: int, dst: int, count: int) -> int:
+            nonlocal calls
+            calls += 1
+            return real_copy_file_range(src, dst, 100) if calls == 1 else 0
+
+        monkeypatch.setattr(filesystem, "_reflink", lambda src, dst: False)
+        monkeypatch.setattr(os, "copy_file_range", copy_once)
+
+        source = tmp_path / "source.txt"
+        dest = tmp_path / "dest.txt"
+        source.write_bytes(bytes(range(250)) * 4)
+        progress_calls: list[tuple[int, int]] = []
+
+        FilesystemStorage().download(
+            str(source), dest, progress=lambda d, t: progress_calls.append((d, t))
+        )
+
+        assert dest.read_bytes() == bytes(range(250)) * 4
+        assert progress_calls[-1] == (1000, 1000)
+
+    def test_download_replaces_previous_download_without_touching_source(
+        self, tmp_path: Path
+    ) -> None:
+        """Re-downloading over dest should leave the earlier source intact."""
+        from datacachalog.adapters.storage import FilesystemStorage
+
+        first = tmp_path / "first.txt"
+        second = tmp_path / "second.txt"
+        dest = tmp_path / "dest.txt"
+        first.write_bytes(b"first")
+        second.write_bytes(b"second")
+
+        storage = FilesystemStorage()
+        storage.download(str(first), dest, progress=lambda x, y: None)
+        storage.download(str(second), dest, progress=lambda x, y: None)
+
+        assert dest.read_bytes() == b"second"
+        assert first.read_bytes() == b"first"
+
+    def test_download_dest_is_independent_of_source(self, tmp_path: Path) -> None:
+        """Editing a downloaded file must not change the source file."""
+        from datacachalog.adapters.storage import FilesystemStorage
+
+        source = tmp_path / "source.txt"
+        dest = tmp_path / "dest.txt"
+        source.write_bytes(b"original")
+
+        FilesystemStorage().download(str(source), dest, progress=lambda x, y: None)
+        dest.write_bytes(b"user edit")
+
+        assert source.read_bytes() == b"original"
+
     def test_download_source_not_found_raises_storage_not_found(
         self, tmp_path: Path
     ) -> None:
@@ -275,6 +436,34 @@ class TestList:
         assert len(result) == 1
         assert str(tmp_path / "file.txt") in result
 
+    def test_list_pattern_excludes_matching_directories(self, tmp_path: Path) -> None:
+        """list() with a pattern should skip directories whose names match."""
+        from datacachalog.adapters.storage import FilesystemStorage
+
+        (tmp_path / "a.csv").write_text("a")
+        (tmp_path / "archive.csv").mkdir()
+        (tmp_path / "b.txt").write_text("b")
+
+        storage = FilesystemStorage()
+        result = storage.list(str(tmp_path) + "/", pattern="*.csv")
+
+        assert result == [str(tmp_path / "a.csv")]
+
+    @pytest.mark.parametrize("prefix", ["", "."])
+    def test_list_relative_prefix_returns_pathlib_style_paths(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, prefix: str
+    ) -> None:
+        """list() should not prepend "./" to results for a relative prefix."""
+        from datacachalog.adapters.storage import FilesystemStorage
+
+        (tmp_path / "a.csv").write_text("a")
+        monkeypatch.chdir(tmp_path)
+
+        storage = FilesystemStorage()
+
+        assert storage.list(prefix) == ["a.csv"]
+        assert storage.list(prefix, pattern="*.csv") == ["a.csv"]
+
     def test_list_recursive_pattern(self, tmp_path: Path) -> None:
         """list() with ** pattern should search recursively."""
         from datacachalog.adapters.storage import FilesystemStorage
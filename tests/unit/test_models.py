@@ -6,7 +6,9 @@ They are pure unit tests with no I/O dependencies.
 
 from __future__ import annotations
 
+import sys
 from datetime import datetime, timedelta
+from enum import StrEnum
 from pathlib import Path
 
 import pytest
@@ -53,6 +55,26 @@ class TestDataset:
         with pytest.raises(AttributeError):
             dataset.name = "new_name"  # type: ignore[misc]
 
+    @pytest.mark.core
+    def test_dataset_name_is_interned(self) -> None:
+        """Dataset interns its name so equal names share one string object."""
+        name = "".join(["cust", "omers"])
+        dataset = Dataset(name=name, source="s3://bucket/file.parquet")
+
+        assert dataset.name is sys.intern("customers")
+
+    @pytest.mark.core
+    def test_dataset_accepts_str_subclass_name(self) -> None:
+        """Dataset interns str subclasses such as StrEnum members as plain str."""
+
+        class Names(StrEnum):
+            CUSTOMERS = "customers"
+
+        dataset = Dataset(name=Names.CUSTOMERS, source="s3://bucket/file.parquet")
+
+        assert type(dataset.name) is str
+        assert dataset.name is sys.intern("customers")
+
     @pytest.mark.core
     def test_dataset_empty_name_raises(self) -> None:
         """Dataset raises ValueError for empty name."""
@@ -676,3 +698,38 @@ class TestDatasetSourceValidation:
         """Dataset accepts Windows paths like C:/data/file.parquet."""
         dataset = Dataset(name="test", source="C:/data/file.parquet")
         assert dataset.source == "C:/data/file.parquet"
+
+
+class TestListedVersionMetadata:
+    """Tests for the listed_version_metadata() pure function."""
+
+    @pytest.mark.core
+    def test_returns_metadata_for_listed_version(self) -> None:
+        """A complete listing entry converts to FileMetadata."""
+        from datacachalog.core.models import listed_version_metadata
+
+        version = ObjectVersion(
+            last_modified=datetime(2024, 12, 5), version_id="v1", etag='"a"', size=10
+        )
+
+        assert listed_version_metadata(version) == FileMetadata(
+            etag='"a"', last_modified=datetime(2024, 12, 5), size=10
+        )
+
+    @pytest.mark.core
+    def test_returns_none_for_incomplete_entry_or_delete_marker(self) -> None:
+        """Entries without an etag or size, and delete markers, yield None."""
+        from datacachalog.core.models import listed_version_metadata
+
+        # Without a size, callers must fall back to a HEAD
+        no_size = ObjectVersion(
+            last_modified=datetime(2024, 12, 15), version_id="v2", etag='"b"'
+        )
+        delete_marker = ObjectVersion(
+            last_modified=datetime(2024, 12, 15),
+            version_id="dm",
+            is_delete_marker=True,
+        )
+
+        assert listed_version_metadata(no_size) is None
+        assert listed_version_metadata(delete_marker) is None
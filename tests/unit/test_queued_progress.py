@@ -0,0 +1,196 @@
+"""Unit tests for QueuedProgressReporter adapter."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from datacachalog import Dataset
+from datacachalog.adapters.cache import FileCache
+from datacachalog.adapters.executor import ThreadPoolExecutorAdapter
+from datacachalog.adapters.storage import FilesystemStorage
+from datacachalog.core.ports import ProgressCallback, ProgressReporter
+from datacachalog.core.services import Catalog
+from datacachalog.progress import QueuedProgressReporter
+
+
+class RecordingReporter:
+    """Reporter that records every call and the thread it arrived on."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, ...]] = []
+        self.threads: set[str] = set()
+
+    def start_task(self, name: str, total: int) -> ProgressCallback:
+        self.threads.add(threading.current_thread().name)
+        self.events.append(("start", name, str(total)))
+
+        def callback(downloaded: int, _total: int) -> None:
+            self.threads.add(threading.current_thread().name)
+            self.events.append(("update", name, str(downloaded)))
+
+        return callback
+
+    def finish_task(self, name: str) -> None:
+        self.threads.add(threading.current_thread().name)
+        self.events.append(("finish", name))
+
+
+@pytest.mark.progress
+@pytest.mark.tra("Adapter.QueuedProgressReporter")
+@pytest.mark.tier(1)
+class TestQueuedProgressReporter:
+    """Tests for QueuedProgressReporter."""
+
+    def test_satisfies_protocol(self) -> None:
+        """QueuedProgressReporter should implement ProgressReporter."""
+        reporter = QueuedProgressReporter(RecordingReporter())
+        assert isinstance(reporter, ProgressReporter)
+
+    def test_replays_events_in_order_on_one_thread(self) -> None:
+        """Events reach the wrapped reporter in order, from the dispatcher."""
+        inner = RecordingReporter()
+
+        with QueuedProgressReporter(inner) as reporter:
+            callback = reporter.start_task("data", 100)
+            callback(40, 100)
+            callback(100, 100)
+            reporter.finish_task("data")
+
+        assert inner.events == [
+            ("start", "data", "100"),
+            ("update", "data", "40"),
+            ("update", "data", "100"),
+            ("finish", "data"),
+        ]
+        assert inner.threads == {"progress-dispatch"}
+
+    def test_reporter_error_is_raised_on_close_after_later_events(self) -> None:
+        """A raising reporter doesn't stall the queue; close() re-raises."""
+
+        class FailingStartReporter(RecordingReporter):
+            def start_task(self, name: str, total: int) -> ProgressCallback:
+                if name == "bad":
+                    raise RuntimeError("display gone")
+                return super().start_task(name, total)
+
+        inner = FailingStartReporter()
+        reporter = QueuedProgressReporter(inner)
+        bad = reporter.start_task("bad", 10)
+        bad(10, 10)
+        reporter.finish_task("bad")
+        reporter.start_task("good", 5)
+        reporter.finish_task("good")
+
+        with pytest.raises(RuntimeError, match="display gone"):
+            reporter.close()
+
+        assert inner.events == [
+            ("start", "good", "5"),
+            ("finish", "good"),
+        ]
+
+    def test_failed_start_drops_the_task_finish(self) -> None:
+        """A task the reporter never started doesn't get finished either."""
+
+        class FailingOnceReporter(RecordingReporter):
+            def __init__(self) -> None:
+                super().__init__()
+                self.failed = False
+
+            def start_task(self, name: str, total: int) -> ProgressCallback:
+                if not self.failed:
+                    self.failed = True
+                    raise RuntimeError("display gone")
+                return super().start_task(name, total)
+
+        inner = FailingOnceReporter()
+        reporter = QueuedProgressReporter(inner)
+        reporter.start_task("data", 10)
+        reporter.finish_task("data")
+        reporter.start_task("data", 10)(10, 10)
+        reporter.finish_task("data")
+
+        with pytest.raises(RuntimeError, match="display gone"):
+            reporter.close()
+
+        assert inner.events == [
+            ("start", "data", "10"),
+            ("update", "data", "10"),
+            ("finish", "data"),
+        ]
+
+    def test_events_after_close_are_dropped(self) -> None:
+        """Late worker events are dropped; a new task raises after close()."""
+        inner = RecordingReporter()
+        reporter = QueuedProgressReporter(inner)
+        callback = reporter.start_task("data", 10)
+        reporter.close()
+
+        callback(10, 10)
+        reporter.finish_task("data")
+        with pytest.raises(RuntimeError, match="closed"):
+            reporter.start_task("other", 5)
+        reporter.close()
+
+        assert inner.events == [("start", "data", "10")]
+
+    def test_concurrent_close_delivers_or_drops_every_event(self) -> None:
+        """Events racing close() are either delivered or dropped, never stuck."""
+        inner = RecordingReporter()
+        reporter = QueuedProgressReporter(inner)
+        callback = reporter.start_task("data", 10_000)
+
+        def worker() -> None:
+            for i in range(10_000):
+                callback(i, 10_000)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        reporter.close()
+        thread.join()
+
+        assert reporter._queue.empty()
+
+    def test_exit_does_not_mask_the_block_exception(self) -> None:
+        """A reporter error on exit yields to the exception already raising."""
+
+        class FailingReporter(RecordingReporter):
+            def finish_task(self, name: str) -> None:
+                raise RuntimeError("display gone")
+
+        reporter = QueuedProgressReporter(FailingReporter()).__enter__()
+        reporter.finish_task("data")
+
+        # Returns quietly so the block's own exception keeps propagating
+        reporter.__exit__(ValueError, ValueError("fetch failed"), None)
+
+    @pytest.mark.parallel
+    def test_fetch_all_parallel_reports_every_dataset(
+        self, tmp_path: Path, seed_storage: Path, storage: FilesystemStorage
+    ) -> None:
+        """Parallel fetch_all() events are all delivered by close()."""
+        cache_dir = tmp_path / "cache"
+        datasets = [
+            Dataset(name=f"ds{i}", source=str(seed_storage / f"file{i}.csv"))
+            for i in range(4)
+        ]
+        inner = RecordingReporter()
+
+        with (
+            ThreadPoolExecutorAdapter(max_workers=4) as executor,
+            QueuedProgressReporter(inner) as reporter,
+        ):
+            catalog = Catalog(
+                datasets=datasets,
+                storage=storage,
+                cache=FileCache(cache_dir=cache_dir),
+                cache_dir=cache_dir,
+                executor=executor,
+            )
+            catalog.fetch_all(progress=reporter, max_workers=4)
+
+        expected = {"ds0", "ds1", "ds2", "ds3"}
+        assert {e[1] for e in inner.events if e[0] == "start"} == expected
+        assert {e[1] for e in inner.events if e[0] == "finish"} == expected
+        assert inner.threads == {"progress-dispatch"}
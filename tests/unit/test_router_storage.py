@@ -137,7 +137,9 @@ class TestRouterStorageDownload:
 
         router.download("s3://bucket/key.csv", dest, progress)
 
-        mock_s3.download.assert_called_once_with("s3://bucket/key.csv", dest, progress)
+        mock_s3.download.assert_called_once_with(
+            "s3://bucket/key.csv", dest, progress, meta=None
+        )
 
 
 @pytest.mark.storage
@@ -4,35 +4,48 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import boto3
 import pytest
 from moto import mock_aws
+from s3transfer.exceptions import RetriesExceededError, S3DownloadFailedError
 
-from datacachalog.core.models import FileMetadata
+from datacachalog.adapters.storage import S3Storage
+from datacachalog.core.exceptions import StorageError, StorageNotFoundError
+from datacachalog.core.models import FileMetadata, ObjectVersion
 from datacachalog.core.ports import StoragePort
 
 
 @pytest.fixture
-def s3_client() -> Any:
-    """Create a mocked S3 client with a test bucket."""
+def s3_client(session_s3_client: Any) -> Any:
+    """Reset moto and give the shared S3 client a fresh test bucket."""
     with mock_aws():
-        client = boto3.client("s3", region_name="us-east-1")
-        client.create_bucket(Bucket="test-bucket")
-        yield client
+        session_s3_client.create_bucket(Bucket="test-bucket")
+        yield session_s3_client
 
 
 @pytest.fixture
-def versioned_s3_client() -> Any:
-    """Create a mocked S3 client with a versioned bucket."""
+def versioned_s3_client(session_s3_client: Any) -> Any:
+    """Reset moto and give the shared S3 client a fresh versioned bucket."""
     with mock_aws():
-        client = boto3.client("s3", region_name="us-east-1")
-        client.create_bucket(Bucket="versioned-bucket")
+        session_s3_client.create_bucket(Bucket="versioned-bucket")
         # Enable versioning on the bucket
-        client.put_bucket_versioning(
+        session_s3_client.put_bucket_versioning(
             Bucket="versioned-bucket",
             VersioningConfiguration={"Status": "Enabled"},
         )
-        yield client
+        yield session_s3_client
+
+
+@pytest.fixture
+def s3_calls(session_s3_client: Any) -> Any:
+    """Record (operation name, request headers) for each call the client makes."""
+    calls: list[tuple[str, dict[str, str]]] = []
+
+    def record(model: Any, params: dict[str, Any], **kwargs: Any) -> None:
+        calls.append((model.name, dict(params["headers"])))
+
+    session_s3_client.meta.events.register("before-call.s3", record)
+    yield calls
+    session_s3_client.meta.events.unregister("before-call.s3", record)
 
 
 @pytest.mark.storage
@@ -43,8 +56,6 @@ class TestHead:
 
     def test_head_returns_file_metadata(self, s3_client: Any) -> None:
         """head() should return FileMetadata with etag, last_modified, and size."""
-        from datacachalog.adapters.storage import S3Storage
-
         # Upload a test object
         s3_client.put_object(
             Bucket="test-bucket", Key="data/test.txt", Body=b"hello world"
@@ -61,8 +72,6 @@ class TestHead:
 
     def test_head_etag_from_s3(self, s3_client: Any) -> None:
         """ETag should come directly from S3 response."""
-        from datacachalog.adapters.storage import S3Storage
-
         s3_client.put_object(Bucket="test-bucket", Key="test.txt", Body=b"hello world")
 
         storage = S3Storage(client=s3_client)
@@ -75,9 +84,6 @@ class TestHead:
 
     def test_head_missing_key_raises_storage_not_found(self, s3_client: Any) -> None:
         """head() should raise StorageNotFoundError for missing keys."""
-        from datacachalog.adapters.storage import S3Storage
-        from datacachalog.core.exceptions import StorageNotFoundError
-
         storage = S3Storage(client=s3_client)
 
         with pytest.raises(StorageNotFoundError) as exc_info:
@@ -95,8 +101,6 @@ class TestDownload:
 
     def test_download_copies_file(self, s3_client: Any, tmp_path: Path) -> None:
         """download() should download file to destination."""
-        from datacachalog.adapters.storage import S3Storage
-
         s3_client.put_object(Bucket="test-bucket", Key="test.txt", Body=b"hello world")
         dest = tmp_path / "downloaded.txt"
 
@@ -108,8 +112,6 @@ class TestDownload:
 
     def test_download_reports_progress(self, s3_client: Any, tmp_path: Path) -> None:
         """download() should call progress callback with bytes."""
-        from datacachalog.adapters.storage import S3Storage
-
         content = b"x" * 1000  # 1000 bytes
         s3_client.put_object(Bucket="test-bucket", Key="test.txt", Body=content)
         dest = tmp_path / "downloaded.txt"
@@ -128,13 +130,160 @@ class TestDownload:
         assert progress_calls[-1][0] == 1000
         assert progress_calls[-1][1] == 1000
 
+    def test_download_large_object_in_parts(
+        self, s3_client: Any, tmp_path: Path
+    ) -> None:
+        """download() should reassemble objects above the multipart threshold."""
+        content = bytes(range(256)) * (40 * 1024)  # 10 MiB
+        s3_client.put_object(Bucket="test-bucket", Key="big.bin", Body=content)
+        dest = tmp_path / "big.bin"
+
+        progress_calls: list[tuple[int, int]] = []
+        storage = S3Storage(client=s3_client)
+        storage.download(
+            "s3://test-bucket/big.bin",
+            dest,
+            progress=lambda done, total: progress_calls.append((done, total)),
+        )
+
+        assert dest.read_bytes() == content
+        assert progress_calls[-1] == (len(content), len(content))
+
+    def test_download_with_meta_skips_head_and_pins_ranges(
+        self, s3_client: Any, s3_calls: Any, tmp_path: Path
+    ) -> None:
+        """download(meta=) should issue no HEAD and pin each ranged GET to the ETag."""
+        content = bytes(range(256)) * (40 * 1024)  # 10 MiB
+        s3_client.put_object(Bucket="test-bucket", Key="big.bin", Body=content)
+        storage = S3Storage(client=s3_client)
+        meta = storage.head("s3://test-bucket/big.bin")
+        s3_calls.clear()
+
+        storage.download(
+            "s3://test-bucket/big.bin",
+            tmp_path / "big.bin",
+            progress=lambda x, y: None,
+            meta=meta,
+        )
+
+        assert [name for name, _ in s3_calls] == ["GetObject", "GetObject"]
+        assert all(headers["If-Match"] == meta.etag for _, headers in s3_calls)
+
+    def test_download_with_outdated_meta_fails(
+        self, s3_client: Any, tmp_path: Path
+    ) -> None:
+        """Ranged GETs should fail rather than mix parts of different objects."""
+        content = bytes(range(256)) * (40 * 1024)  # 10 MiB
+        s3_client.put_object(Bucket="test-bucket", Key="big.bin", Body=content)
+        storage = S3Storage(client=s3_client)
+        meta = storage.head("s3://test-bucket/big.bin")
+        s3_client.put_object(Bucket="test-bucket", Key="big.bin", Body=content[::-1])
+
+        with pytest.raises(StorageError, match="changed during download"):
+            storage.download(
+                "s3://test-bucket/big.bin",
+                tmp_path / "big.bin",
+                progress=lambda x, y: None,
+                meta=meta,
+            )
+
+    def test_downloads_share_one_transfer_manager(
+        self, s3_client: Any, tmp_path: Path
+    ) -> None:
+        """Each download should reuse the adapter's transfer manager."""
+        s3_client.put_object(Bucket="test-bucket", Key="a.txt", Body=b"a")
+        s3_client.put_object(Bucket="test-bucket", Key="b.txt", Body=b"b")
+        storage = S3Storage(client=s3_client)
+
+        storage.download("s3://test-bucket/a.txt", tmp_path / "a", lambda x, y: None)
+        manager = storage._transfer_manager()
+        storage.download("s3://test-bucket/b.txt", tmp_path / "b", lambda x, y: None)
+
+        assert storage._transfer_manager() is manager
+        assert (tmp_path / "b").read_bytes() == b"b"
+
+    def test_failed_download_keeps_previous_dest(
+        self, s3_client: Any, tmp_path: Path
+    ) -> None:
+        """A failed download should leave dest as it was, with no temp files."""
+        dest = tmp_path / "data.txt"
+        dest.write_bytes(b"previous")
+        storage = S3Storage(client=s3_client)
+
+        with pytest.raises(StorageNotFoundError):
+            storage.download(
+                "s3://test-bucket/nonexistent.txt", dest, progress=lambda x, y: None
+            )
+
+        assert dest.read_bytes() == b"previous"
+        assert list(tmp_path.iterdir()) == [dest]
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            RetriesExceededError(ConnectionError("reset")),
+            S3DownloadFailedError("checksum mismatch"),
+        ],
+        ids=["retries-exceeded", "download-failed"],
+    )
+    def test_transfer_errors_become_storage_errors(
+        self,
+        s3_client: Any,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        error: Exception,
+    ) -> None:
+        """s3transfer failures should surface as StorageError with their message."""
+        s3_client.put_object(Bucket="test-bucket", Key="test.txt", Body=b"hello")
+        storage = S3Storage(client=s3_client)
+
+        class FailingFuture:
+            def result(self) -> None:
+                raise error
+
+        class FailingManager:
+            def download(self, *args: Any, **kwargs: Any) -> FailingFuture:
+                return FailingFuture()
+
+        monkeypatch.setattr(storage, "_transfer_manager", FailingManager)
+
+        with pytest.raises(StorageError, match="S3 download failed") as exc_info:
+            storage.download(
+                "s3://test-bucket/test.txt",
+                tmp_path / "test.txt",
+                progress=lambda x, y: None,
+            )
+
+        assert exc_info.value.cause is error
+        assert list(tmp_path.iterdir()) == []
+
+    def test_close_shuts_down_transfer_manager(
+        self, s3_client: Any, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Leaving the context should shut down the shared transfer manager."""
+        s3_client.put_object(Bucket="test-bucket", Key="a.txt", Body=b"a")
+        shutdowns: list[object] = []
+
+        with S3Storage(client=s3_client) as storage:
+            storage.download(
+                "s3://test-bucket/a.txt", tmp_path / "a", lambda x, y: None
+            )
+            manager = storage._transfer_manager()
+            real_shutdown = manager.shutdown
+
+            def spy_shutdown() -> None:
+                shutdowns.append(manager)
+                real_shutdown()
+
+            monkeypatch.setattr(manager, "shutdown", spy_shutdown)
+
+        assert shutdowns == [manager]
+        assert storage._manager is None
+
     def test_download_missing_key_raises_storage_not_found(
         self, s3_client: Any, tmp_path: Path
     ) -> None:
         """download() should raise StorageNotFoundError for missing keys."""
-        from datacachalog.adapters.storage import S3Storage
-        from datacachalog.core.exceptions import StorageNotFoundError
-
         dest = tmp_path / "downloaded.txt"
         storage = S3Storage(client=s3_client)
 
@@ -154,8 +303,6 @@ class TestUpload:
 
     def test_upload_copies_file(self, s3_client: Any, tmp_path: Path) -> None:
         """upload() should upload local file to S3."""
-        from datacachalog.adapters.storage import S3Storage
-
         local = tmp_path / "local.txt"
         local.write_text("hello world")
 
@@ -168,8 +315,6 @@ class TestUpload:
 
     def test_upload_to_nested_key(self, s3_client: Any, tmp_path: Path) -> None:
         """upload() should handle nested S3 keys."""
-        from datacachalog.adapters.storage import S3Storage
-
         local = tmp_path / "local.txt"
         local.write_text("hello world")
 
@@ -184,8 +329,6 @@ class TestUpload:
 
     def test_upload_reports_progress(self, s3_client: Any, tmp_path: Path) -> None:
         """upload() should call progress callback with bytes."""
-        from datacachalog.adapters.storage import S3Storage
-
         local = tmp_path / "local.txt"
         content = "x" * 1000
         local.write_text(content)
@@ -211,8 +354,6 @@ class TestList:
 
     def test_list_returns_objects_with_prefix(self, s3_client: Any) -> None:
         """list() should return all objects matching prefix."""
-        from datacachalog.adapters.storage import S3Storage
-
         s3_client.put_object(Bucket="test-bucket", Key="data/a.parquet", Body=b"a")
         s3_client.put_object(Bucket="test-bucket", Key="data/b.parquet", Body=b"b")
         s3_client.put_object(Bucket="test-bucket", Key="other/c.parquet", Body=b"c")
@@ -227,8 +368,6 @@ class TestList:
 
     def test_list_with_pattern_filters_by_glob(self, s3_client: Any) -> None:
         """list() with pattern should filter by glob."""
-        from datacachalog.adapters.storage import S3Storage
-
         s3_client.put_object(Bucket="test-bucket", Key="data/a.parquet", Body=b"a")
         s3_client.put_object(Bucket="test-bucket", Key="data/b.parquet", Body=b"b")
         s3_client.put_object(Bucket="test-bucket", Key="data/c.csv", Body=b"c")
@@ -243,8 +382,6 @@ class TestList:
 
     def test_list_returns_sorted_alphabetically(self, s3_client: Any) -> None:
         """list() should return results sorted alphabetically."""
-        from datacachalog.adapters.storage import S3Storage
-
         s3_client.put_object(Bucket="test-bucket", Key="data/z.txt", Body=b"z")
         s3_client.put_object(Bucket="test-bucket", Key="data/a.txt", Body=b"a")
         s3_client.put_object(Bucket="test-bucket", Key="data/m.txt", Body=b"m")
@@ -260,8 +397,6 @@ class TestList:
 
     def test_list_empty_prefix_returns_empty_list(self, s3_client: Any) -> None:
         """list() with no matching objects should return empty list."""
-        from datacachalog.adapters.storage import S3Storage
-
         storage = S3Storage(client=s3_client)
         result = storage.list("s3://test-bucket/nonexistent/")
 
@@ -269,8 +404,6 @@ class TestList:
 
     def test_list_handles_pagination(self, s3_client: Any) -> None:
         """list() should handle paginated results."""
-        from datacachalog.adapters.storage import S3Storage
-
         # Create more objects than default page size
         for i in range(25):
             s3_client.put_object(
@@ -284,8 +417,6 @@ class TestList:
 
     def test_list_recursive_pattern(self, s3_client: Any) -> None:
         """list() with ** pattern should match nested keys."""
-        from datacachalog.adapters.storage import S3Storage
-
         s3_client.put_object(Bucket="test-bucket", Key="data/a.parquet", Body=b"a")
         s3_client.put_object(Bucket="test-bucket", Key="data/sub/b.parquet", Body=b"b")
         s3_client.put_object(
@@ -311,8 +442,6 @@ class TestProtocolConformance:
 
     def test_satisfies_storage_port(self, s3_client: Any) -> None:
         """S3Storage should satisfy StoragePort protocol."""
-        from datacachalog.adapters.storage import S3Storage
-
         storage = S3Storage(client=s3_client)
         assert isinstance(storage, StoragePort)
 
@@ -325,8 +454,6 @@ class TestUriParsing:
 
     def test_parses_simple_uri(self, s3_client: Any) -> None:
         """Should parse s3://bucket/key correctly."""
-        from datacachalog.adapters.storage import S3Storage
-
         s3_client.put_object(Bucket="test-bucket", Key="file.txt", Body=b"test")
 
         storage = S3Storage(client=s3_client)
@@ -336,8 +463,6 @@ class TestUriParsing:
 
     def test_parses_nested_key(self, s3_client: Any) -> None:
         """Should parse s3://bucket/path/to/file correctly."""
-        from datacachalog.adapters.storage import S3Storage
-
         s3_client.put_object(Bucket="test-bucket", Key="path/to/file.txt", Body=b"test")
 
         storage = S3Storage(client=s3_client)
@@ -354,9 +479,9 @@ class TestPackageExport:
 
     def test_s3storage_exported_from_package_root(self) -> None:
         """S3Storage should be importable from datacachalog."""
-        from datacachalog import S3Storage
+        from datacachalog import S3Storage as RootS3Storage
 
-        assert S3Storage is not None
+        assert RootS3Storage is S3Storage
 
 
 @pytest.mark.storage
@@ -369,9 +494,6 @@ class TestListVersions:
         self, versioned_s3_client: Any
     ) -> None:
         """list_versions() should return list of ObjectVersion."""
-        from datacachalog.adapters.storage import S3Storage
-        from datacachalog.core.models import ObjectVersion
-
         # Upload multiple versions
         versioned_s3_client.put_object(
             Bucket="versioned-bucket", Key="data.txt", Body=b"v1"
@@ -388,8 +510,6 @@ class TestListVersions:
 
     def test_list_versions_sorted_newest_first(self, versioned_s3_client: Any) -> None:
         """list_versions() should return newest version first."""
-        from datacachalog.adapters.storage import S3Storage
-
         versioned_s3_client.put_object(
             Bucket="versioned-bucket", Key="data.txt", Body=b"v1"
         )
@@ -407,8 +527,6 @@ class TestListVersions:
 
     def test_list_versions_with_limit(self, versioned_s3_client: Any) -> None:
         """list_versions() should respect limit parameter."""
-        from datacachalog.adapters.storage import S3Storage
-
         # Upload 5 versions
         for i in range(5):
             versioned_s3_client.put_object(
@@ -422,8 +540,6 @@ class TestListVersions:
 
     def test_list_versions_includes_version_id(self, versioned_s3_client: Any) -> None:
         """list_versions() should include version_id for each version."""
-        from datacachalog.adapters.storage import S3Storage
-
         versioned_s3_client.put_object(
             Bucket="versioned-bucket", Key="data.txt", Body=b"content"
         )
@@ -436,8 +552,6 @@ class TestListVersions:
 
     def test_list_versions_includes_metadata(self, versioned_s3_client: Any) -> None:
         """list_versions() should include etag and size."""
-        from datacachalog.adapters.storage import S3Storage
-
         versioned_s3_client.put_object(
             Bucket="versioned-bucket", Key="data.txt", Body=b"hello"
         )
@@ -452,8 +566,6 @@ class TestListVersions:
         self, versioned_s3_client: Any
     ) -> None:
         """list_versions() should include delete markers."""
-        from datacachalog.adapters.storage import S3Storage
-
         # Create object and then delete it (creates delete marker)
         versioned_s3_client.put_object(
             Bucket="versioned-bucket", Key="data.txt", Body=b"content"
@@ -478,8 +590,6 @@ class TestHeadVersion:
 
     def test_head_version_returns_file_metadata(self, versioned_s3_client: Any) -> None:
         """head_version() should return FileMetadata for specific version."""
-        from datacachalog.adapters.storage import S3Storage
-
         # Upload two versions
         versioned_s3_client.put_object(
             Bucket="versioned-bucket", Key="data.txt", Body=b"v1"
@@ -500,9 +610,6 @@ class TestHeadVersion:
         self, versioned_s3_client: Any
     ) -> None:
         """head_version() should raise StorageNotFoundError for missing version."""
-        from datacachalog.adapters.storage import S3Storage
-        from datacachalog.core.exceptions import StorageNotFoundError
-
         versioned_s3_client.put_object(
             Bucket="versioned-bucket", Key="data.txt", Body=b"content"
         )
@@ -525,8 +632,6 @@ class TestDownloadVersion:
         self, versioned_s3_client: Any, tmp_path: Path
     ) -> None:
         """download_version() should download specific version content."""
-        from datacachalog.adapters.storage import S3Storage
-
         # Upload two versions
         resp1 = versioned_s3_client.put_object(
             Bucket="versioned-bucket", Key="data.txt", Body=b"first version"
@@ -554,8 +659,6 @@ class TestDownloadVersion:
         self, versioned_s3_client: Any, tmp_path: Path
     ) -> None:
         """download_version() should call progress callback."""
-        from datacachalog.adapters.storage import S3Storage
-
         resp = versioned_s3_client.put_object(
             Bucket="versioned-bucket", Key="data.txt", Body=b"x" * 1000
         )
@@ -578,13 +681,36 @@ class TestDownloadVersion:
         assert len(progress_calls) > 0
         assert progress_calls[-1][0] == 1000
 
+    def test_download_version_with_meta_skips_head(
+        self, versioned_s3_client: Any, s3_calls: Any, tmp_path: Path
+    ) -> None:
+        """download_version(meta=) should fetch the version without a HEAD."""
+        resp = versioned_s3_client.put_object(
+            Bucket="versioned-bucket", Key="data.txt", Body=b"first version"
+        )
+        versioned_s3_client.put_object(
+            Bucket="versioned-bucket", Key="data.txt", Body=b"second version"
+        )
+        storage = S3Storage(client=versioned_s3_client)
+        meta = storage.head_version("s3://versioned-bucket/data.txt", resp["VersionId"])
+        s3_calls.clear()
+
+        dest = tmp_path / "downloaded.txt"
+        storage.download_version(
+            "s3://versioned-bucket/data.txt",
+            dest,
+            resp["VersionId"],
+            progress=lambda x, y: None,
+            meta=meta,
+        )
+
+        assert [name for name, _ in s3_calls] == ["GetObject"]
+        assert dest.read_text() == "first version"
+
     def test_download_version_not_found_raises_error(
         self, versioned_s3_client: Any, tmp_path: Path
     ) -> None:
         """download_version() should raise StorageNotFoundError for missing version."""
-        from datacachalog.adapters.storage import S3Storage
-        from datacachalog.core.exceptions import StorageNotFoundError
-
         versioned_s3_client.put_object(
             Bucket="versioned-bucket", Key="data.txt", Body=b"content"
         )